@@ -6,22 +6,25 @@ Runs outside the app directory to safely replace it.
 """
 
 import argparse
-import contextlib
+import hashlib
 import json
 import os
 import platform
 import shutil
 import sys
 import tempfile
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
 import platformdirs
 import requests
-from packaging.version import Version as V
 from requests import ConnectionError, HTTPError, JSONDecodeError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # ============================================================================
 # Configuration (loaded from app.env or defaults)
@@ -34,40 +37,88 @@ NIGHTLY_ZIP_URL = "https://github.com/OrthoDriven/2d-point-annotator/archive/ref
 SYSTEM = platform.system()
 APP_DIR_NAME_UNIX = "2d-point-annotator"
 APP_DIR_NAME_WINDOWS = "2D-Point-Annotator"
+# Cap for the exponential back-off applied to MIN_CHECK_INTERVAL_SECONDS
+MAX_BACKOFF_FACTOR = 64
+# Pretty-print update_state.json only when debugging the updater
+PRETTY_STATE = bool(os.environ.get("ANNOTATOR_UPDATER_DEBUG"))
 
 
 def get_install_root() -> Path:
     if SYSTEM == "Windows":
         return Path(platformdirs.user_documents_dir()) / APP_DIR_NAME_WINDOWS
     else:
-        return Path().home() / APP_DIR_NAME_UNIX
+        return Path(os.path.expanduser("~")) / APP_DIR_NAME_UNIX
 
 
-def get_releases(url: str):
-    r = requests.get(url)
+def parse_version(tag: str) -> tuple[int, ...]:
+    """Parse a "vX.Y.Z" release tag into a comparable tuple of ints."""
+    return tuple(int(part) for part in tag.lstrip("v").split("."))
+
+
+def build_session(user_agent: str) -> requests.Session:
+    """Create a keep-alive session that retries transient GitHub failures."""
+    session = requests.Session()
+    session.headers["User-Agent"] = user_agent
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=retry),
+    )
+    return session
+
+
+def get_releases(url: str, session: requests.Session):
+    r = session.get(url)
     print(r.content)
     return r.json()
 
 
-def download_release_zip(zip_url: str, download_path: Path, timeout: int = 20) -> None:
-    with requests.get(zip_url, stream=True, timeout=timeout) as r:
+def download_release_zip(
+    zip_url: str,
+    download_path: Path,
+    session: requests.Session,
+    timeout: int = 20,
+    expected_sha256: Optional[str] = None,
+) -> str:
+    """
+    Stream the archive to disk, hashing it on the way through.
+    Returns the SHA-256 hex digest; raises ValueError if it does not match
+    expected_sha256.
+    """
+    h = hashlib.sha256()
+    with session.get(zip_url, stream=True, timeout=timeout) as r:
+        r.raise_for_status()
+        # Let urllib3 undo any Content-Encoding so the bytes on disk are the zip
+        r.raw.decode_content = True
         with open(download_path, "wb") as f:
-            f.write(r.content)
+            while chunk := r.raw.read(1024 * 1024):
+                h.update(chunk)
+                f.write(chunk)
+
+    digest = h.hexdigest()
+    if expected_sha256 and digest != expected_sha256.removeprefix("sha256:").lower():
+        raise ValueError(
+            f"Checksum mismatch for {zip_url}: expected {expected_sha256}, got {digest}"
+        )
+    return digest
 
 
-def load_config():
-    install_root = get_install_root()
+INSTALL_ROOT = get_install_root()
+USER_AGENT = "2d-point-annotator-updater"
+
+_CONFIG = {
+    "INSTALL_ROOT": str(INSTALL_ROOT),
+    "APP_DIR": str(INSTALL_ROOT / "app"),
+    "STATE_PATH": str(INSTALL_ROOT / "update_state.json"),
+    "USER_AGENT": USER_AGENT,
+    "MIN_CHECK_INTERVAL_SECONDS": 15,
+    "REQUEST_TIMEOUT_SEC": 15,
+    "SESSION": build_session(USER_AGENT),
+}
 
-    config = {
-        "INSTALL_ROOT": str(install_root),
-        "APP_DIR": str(install_root / "app"),
-        "STATE_PATH": str(install_root / "update_state.json"),
-        "USER_AGENT": "2d-point-annotator-updater",
-        "MIN_CHECK_INTERVAL_SECONDS": 15,
-        "REQUEST_TIMEOUT_SEC": 15,
-    }
 
-    return config
+def load_config():
+    return _CONFIG
 
 
 # ============================================================================
@@ -83,6 +134,7 @@ def load_state(state_path):
             "etag": "",
             "updatedUtc": datetime.now(timezone.utc).isoformat(),
             "lastCheckUtc": "1970-01-01T00:00:00Z",
+            "lastCheckEpoch": 0,
             "version": "0.0.0",
         }
 
@@ -98,33 +150,50 @@ def load_state(state_path):
             "etag": "",
             "updatedUtc": datetime.now(timezone.utc).isoformat(),
             "lastCheckUtc": "1970-01-01T00:00:00Z",
+            "lastCheckEpoch": 0,
             "version": "0.0.0",
         }
 
 
+def write_state(state_path, state):
+    """Atomically write state so a crash never leaves a truncated file."""
+    tmp_path = str(state_path) + ".tmp"
+    with open(tmp_path, "w") as f:
+        if PRETTY_STATE:
+            json.dump(state, f, indent=2)
+        else:
+            json.dump(state, f, separators=(",", ":"))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, state_path)
+
+
 def save_state(
     state_path,
+    state,
     sha="",
     etag="",
     new_version: Optional[str] = None,
     update_last_check=True,
+    consecutive_unchanged: Optional[int] = None,
 ):
-    """Save update state to JSON file."""
-    state = load_state(state_path)
-
+    """Apply updates to the in-memory state and write it to the JSON file."""
     if sha:
         state["sha"] = sha
     if etag:
         state["etag"] = etag
     if update_last_check:
+        # ISO string is for humans; the throttle only reads the epoch
         state["lastCheckUtc"] = datetime.now(timezone.utc).isoformat()
+        state["lastCheckEpoch"] = int(time.time())
     if sha or etag:
         state["updatedUtc"] = datetime.now(timezone.utc).isoformat()
     if new_version is not None:
         state["version"] = new_version
+    if consecutive_unchanged is not None:
+        state["consecutiveUnchanged"] = consecutive_unchanged
 
-    with open(state_path, "w") as f:
-        json.dump(state, f, indent=2)
+    write_state(state_path, state)
 
 
 # ============================================================================
@@ -132,15 +201,18 @@ def save_state(
 # ============================================================================
 
 
-def check_for_updates(api_url, state, user_agent, timeout):
+def check_for_updates(api_url, state, session, timeout):
     """Check GitHub API for new commits."""
-    headers = {"User-Agent": user_agent}
+    headers = {}
 
     if state.get("etag"):
         headers["If-None-Match"] = state["etag"]
 
     try:
-        with requests.get(api_url, timeout=timeout) as response:
+        with session.get(api_url, headers=headers, timeout=timeout) as response:
+            if response.status_code == 304:
+                return {"status": "unchanged", "etag": state["etag"]}
+
             response.raise_for_status()
             etag = response.headers.get("ETag", "")
             # data = json.loads(response.read().decode())
@@ -172,12 +244,46 @@ def check_for_updates(api_url, state, user_agent, timeout):
 # ============================================================================
 
 
-def find_project_root(extract_dir):
-    """Find the directory containing pixi.toml in extracted archive."""
-    for root, dirs, files in os.walk(extract_dir):
-        if "pixi.toml" in files:
-            return Path(root)
-    return None
+def find_project_prefix(names, max_depth=3):
+    """
+    Find the archive prefix of the shallowest directory containing pixi.toml.
+    Members nested deeper than max_depth directories are ignored.
+    """
+    best = None
+    best_depth = max_depth + 1
+    for name in names:
+        if name != "pixi.toml" and not name.endswith("/pixi.toml"):
+            continue
+        depth = name.count("/")
+        if depth < best_depth:
+            best, best_depth = name, depth
+            # Zipballs keep pixi.toml directly under <owner>-<repo>-<sha>/
+            if depth <= 1:
+                break
+    if best is None:
+        return None
+    return best[: -len("pixi.toml")]
+
+
+def extract_project(zip_path, extract_dir):
+    """
+    Extract only the project tree from the archive.
+    Returns the extracted project root, or None if pixi.toml is missing.
+    """
+    # A 1 MiB read buffer keeps the central-directory and member-header
+    # parsing from issuing thousands of small reads
+    with (
+        open(zip_path, "rb", buffering=1024 * 1024) as raw,
+        zipfile.ZipFile(raw, "r", allowZip64=True) as zip_ref,
+    ):
+        names = zip_ref.namelist()
+        prefix = find_project_prefix(names)
+        if prefix is None:
+            return None
+        zip_ref.extractall(
+            extract_dir, members=[n for n in names if n.startswith(prefix)]
+        )
+    return Path(extract_dir) / prefix
 
 
 # ============================================================================
@@ -185,6 +291,25 @@ def find_project_root(extract_dir):
 # ============================================================================
 
 
+def clean_swap_dirs(app_dir):
+    """Remove app.new/app.old left behind by an interrupted swap."""
+    app_path = Path(app_dir)
+    for leftover in (app_path.parent / "app.new", app_path.parent / "app.old"):
+        if leftover.exists():
+            shutil.rmtree(leftover, ignore_errors=True)
+
+
+def extract_for_swap(zip_path, extract_dir, app_dir):
+    """
+    Extract the archive on a worker thread while the swap staging area is
+    cleaned up. Returns the extracted project root, or None.
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(extract_project, zip_path, extract_dir)
+        clean_swap_dirs(app_dir)
+        return future.result()
+
+
 def atomic_swap(new_dir, app_dir):
     """
     Atomically replace app directory with new version.
@@ -195,10 +320,7 @@ def atomic_swap(new_dir, app_dir):
     old_path = app_path.parent / "app.old"
 
     # Clean up any leftover temp directories
-    if new_path.exists():
-        shutil.rmtree(new_path, ignore_errors=True)
-    if old_path.exists():
-        shutil.rmtree(old_path, ignore_errors=True)
+    clean_swap_dirs(app_dir)
 
     # Move new version to staging area
     shutil.move(str(new_dir), str(new_path))
@@ -235,20 +357,15 @@ def atomic_swap(new_dir, app_dir):
 def should_check_for_updates(state, min_interval):
     """Determine if enough time has passed since last check."""
     try:
-        last_check = datetime.fromisoformat(
-            state["lastCheckUtc"].replace("Z", "+00:00")
-        )
-        now = datetime.now(timezone.utc)
-        delta = (now - last_check).total_seconds()
+        delta = time.time() - float(state.get("lastCheckEpoch", 0))
 
-        print(f"[debug] lastCheckUtc = {state['lastCheckUtc']}")
-        print(f"[debug] now          = {now.isoformat()}")
+        print(f"[debug] lastCheckUtc = {state.get('lastCheckUtc')}")
         print(f"[debug] delta        = {delta:.1f} seconds")
         print(f"[debug] min interval = {min_interval} seconds")
         print(f"[debug] version      = {state['version']}")
 
         if delta < 0:
-            print("[warn] lastCheckUtc is in the future; resetting")
+            print("[warn] lastCheckEpoch is in the future; resetting")
             return True, 0
 
         if delta < min_interval:
@@ -260,26 +377,26 @@ def should_check_for_updates(state, min_interval):
 
         return True, delta
     except Exception as e:
-        print(f"[warn] Could not parse lastCheckUtc: {e}")
+        print(f"[warn] Could not parse lastCheckEpoch: {e}")
         return True, 0
 
 
 def run_nightly_update(config, state, state_path):
     """Update from latest commit on main branch."""
     app_dir = config["APP_DIR"]
-    user_agent = config["USER_AGENT"]
+    session = config["SESSION"]
     timeout = int(config["REQUEST_TIMEOUT_SEC"])
 
-    headers = {"User-Agent": user_agent}
+    headers = {}
     if state.get("etag"):
         headers["If-None-Match"] = state["etag"]
 
     try:
-        response = requests.get(NIGHTLY_COMMITS_URL, headers=headers, timeout=timeout)
+        response = session.get(NIGHTLY_COMMITS_URL, headers=headers, timeout=timeout)
 
         if response.status_code == 304:
             print(f"[info] Already up-to-date ({state.get('sha', 'unknown')[:7]})")
-            save_state(state_path, update_last_check=True)
+            save_state(state_path, state, update_last_check=True)
             return
 
         response.raise_for_status()
@@ -289,48 +406,48 @@ def run_nightly_update(config, state, state_path):
 
         if not new_sha:
             print("[warn] GitHub response did not include sha")
-            save_state(state_path, update_last_check=True)
+            save_state(state_path, state, update_last_check=True)
             return
 
         if state.get("sha") == new_sha:
             print(f"[info] Already up-to-date ({new_sha[:7]})")
-            save_state(state_path, update_last_check=True)
+            save_state(state_path, state, update_last_check=True)
             return
 
         print(f"[info] New commit detected ({new_sha[:7]}). Updating...")
 
     except Exception as e:
         print(f"[warn] Could not check for nightly update: {e}")
-        save_state(state_path, update_last_check=True)
+        save_state(state_path, state, update_last_check=True)
         return
 
     try:
-        with tempfile.TemporaryDirectory() as temp_dir:
+        # Stage next to app_dir so atomic_swap's move is a plain rename
+        with tempfile.TemporaryDirectory(dir=Path(app_dir).parent) as temp_dir:
             temp_path = Path(temp_dir)
             zip_path = temp_path / "annotator.zip"
 
-            download_release_zip(
+            digest = download_release_zip(
                 zip_url=NIGHTLY_ZIP_URL,
                 download_path=zip_path,
+                session=session,
                 timeout=timeout * 6,
             )
+            print(f"[info] Downloaded archive (sha256 {digest[:12]})")
 
-            with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
-
-            project_root = find_project_root(temp_path)
+            project_root = extract_for_swap(zip_path, temp_path, app_dir)
             if not project_root:
                 print("[error] Cannot find project root in downloaded archive")
                 return
 
             atomic_swap(project_root, app_dir)
 
-        save_state(state_path, sha=new_sha, etag=new_etag)
+        save_state(state_path, state, sha=new_sha, etag=new_etag)
         print(f"[info] Update complete -> {new_sha[:7]}")
 
     except Exception as e:
         print(f"[error] Nightly update failed: {e}")
-        save_state(state_path, update_last_check=True)
+        save_state(state_path, state, update_last_check=True)
         raise
 
 
@@ -339,10 +456,17 @@ def run_update():
     config = load_config()
     state_path = config["STATE_PATH"]
     app_dir = config["APP_DIR"]
-    [
-        contextlib.suppress(Exception)(shutil.rmtree(p))
-        for p in Path(app_dir).parent.glob("app.old*")
-    ]
+
+    # Clean up app.old* leftovers from previous swaps
+    install_root = Path(app_dir).parent
+    if install_root.is_dir():
+        with os.scandir(install_root) as it:
+            for entry in it:
+                if entry.name.startswith("app.old"):
+                    try:
+                        shutil.rmtree(entry.path)
+                    except OSError:
+                        pass
 
     # Load state
     state = load_state(state_path)
@@ -352,13 +476,15 @@ def run_update():
         run_nightly_update(config, state, state_path)
         return
 
-    # Check if we should run
-    # should_check, delta = should_check_for_updates(
-    #     state, int(config["MIN_CHECK_INTERVAL_SECONDS"])
-    # )
+    # Check if we should run, backing off while nothing changes upstream
+    unchanged_streak = int(state.get("consecutiveUnchanged", 0))
+    min_interval = int(config["MIN_CHECK_INTERVAL_SECONDS"]) * min(
+        2**unchanged_streak, MAX_BACKOFF_FACTOR
+    )
+    should_check, delta = should_check_for_updates(state, min_interval)
 
-    # if not should_check:
-    #     return
+    if not should_check:
+        return
 
     # Always update lastCheckUtc from here on
     try:
@@ -367,25 +493,35 @@ def run_update():
             # config["API_URL"],
             REPO_URL,
             state,
-            config["USER_AGENT"],
+            config["SESSION"],
             int(config["REQUEST_TIMEOUT_SEC"]),
         )
 
-        save_state(state_path, update_last_check=True)
-
         if result["status"] == "error":
+            save_state(state_path, state, consecutive_unchanged=unchanged_streak + 1)
             return
 
         if result["status"] == "unchanged":
-            print(f"[info] Already up-to-date ({state.get('sha', 'unknown')})")
+            print(f"[info] Already up-to-date (on version {state.get('version')})")
+            save_state(
+                state_path,
+                state,
+                etag=result["etag"],
+                consecutive_unchanged=unchanged_streak + 1,
+            )
             return
 
-        current_version = V(state.get("version") or "0.0.0")
-        new_version = V(result.get("version", "0.0.0"))
+        current_version = (state.get("version") or "0.0.0").lstrip("v")
+        new_version = (result.get("version") or "0.0.0").lstrip("v")
 
-        if current_version == new_version:
+        if parse_version(current_version) == parse_version(new_version):
             print(f"[info] Already up-to-date (on version {new_version})")
-            save_state(state_path, etag=result.get("etag", state.get("etag", "")))
+            save_state(
+                state_path,
+                state,
+                etag=result.get("etag", state.get("etag", "")),
+                consecutive_unchanged=unchanged_streak + 1,
+            )
             return
 
         print(
@@ -394,21 +530,24 @@ def run_update():
 
         new_zip_url = result["version_zip_url"]
 
-        # Download and extract
-        with tempfile.TemporaryDirectory() as temp_dir:
+        # Record the check before the (slow) download
+        save_state(state_path, state, update_last_check=True)
+
+        # Download and extract next to app_dir so atomic_swap's move is a
+        # plain rename rather than a cross-device copy
+        with tempfile.TemporaryDirectory(dir=Path(app_dir).parent) as temp_dir:
             temp_path = Path(temp_dir)
             zip_path = temp_path / "annotator.zip"
 
-            download_release_zip(
+            digest = download_release_zip(
                 zip_url=new_zip_url,
                 download_path=zip_path,
+                session=config["SESSION"],
                 timeout=int(config["REQUEST_TIMEOUT_SEC"]) * 6,
             )
+            print(f"[info] Downloaded archive (sha256 {digest[:12]})")
 
-            with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
-
-            project_root = find_project_root(temp_path)
+            project_root = extract_for_swap(zip_path, temp_path, app_dir)
             if not project_root:
                 print("[error] Cannot find project root in downloaded archive")
                 return
@@ -418,13 +557,17 @@ def run_update():
 
         # Update state
         save_state(
-            state_path, new_version=str(new_version), etag=result.get("etag", "")
+            state_path,
+            state,
+            new_version=new_version,
+            etag=result.get("etag", ""),
+            consecutive_unchanged=0,
         )
         print(f"[info] Update complete -> {new_version}")
 
     except Exception as e:
         print(f"[error] Update failed: {e}")
-        save_state(state_path, update_last_check=True)
+        save_state(state_path, state, update_last_check=True)
         raise
 
 
@@ -445,8 +588,10 @@ if __name__ == "__main__":
         _state["sha"] = ""
         _state["etag"] = ""
         _state["version"] = ""
-        with open(_config["STATE_PATH"], "w") as _f:
-            json.dump(_state, _f, indent=2)
+        _state["lastCheckUtc"] = "1970-01-01T00:00:00Z"
+        _state["lastCheckEpoch"] = 0
+        _state["consecutiveUnchanged"] = 0
+        write_state(_config["STATE_PATH"], _state)
         print(f"[info] Channel set to '{args.set_channel}'. Next launch will fetch from {args.set_channel}.")
         sys.exit(0)
 
@@ -1,37 +1,71 @@
 import hashlib
+import os
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
 def check_all_images(fpath: Path, dup_path: Path):
-    image_hashes = {}
     duplicates = []
 
-    for root, dirs, files in fpath.walk():
-        for file in files:
-            current_image_hash = hash_image(Path(root / file))
-            if current_image_hash in image_hashes.keys():
-                print(f"Found duplicate at {Path(root / file)}")
+    # Files can only be duplicates of files with the same byte size, so group
+    # by size first and hash only the sizes shared by more than one file.
+    files_by_size: dict[int, list[Path]] = {}
+    # dup_path usually sits inside fpath; skip it so files moved there by an
+    # earlier run are not hashed again and reported against their originals.
+    for entry in iter_files(fpath, skip_dirs={dup_path.name}):
+        files_by_size.setdefault(entry.stat().st_size, []).append(Path(entry.path))
+
+    candidates = [
+        image_path
+        for same_size in files_by_size.values()
+        if len(same_size) > 1
+        for image_path in same_size
+    ]
+
+    # hashlib releases the GIL while hashing, so threads overlap reads and
+    # hashing; results come back in order and are handled on this thread.
+    image_hashes = {}
+    workers = min(16, (os.cpu_count() or 1) * 2)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for image_path, current_image_hash in zip(
+            candidates, pool.map(hash_image, candidates), strict=True
+        ):
+            if current_image_hash in image_hashes:
+                print(f"Found duplicate at {image_path}")
                 print(f"Duplicate of {image_hashes[current_image_hash]}")
                 print("========================")
-                duplicates.append(Path(root / file))
-                fname = Path(root / file).name
-                Path(root / file).rename(Path(dup_path / fname))
+                duplicates.append(image_path)
+                image_path.rename(Path(dup_path / image_path.name))
             else:
-                image_hashes[current_image_hash] = Path(root / file)
+                image_hashes[current_image_hash] = image_path
 
     print(f"Total duplicates: {len(duplicates)}")
 
 
+def iter_files(
+    fpath: Path, skip_dirs: frozenset[str] | set[str] = frozenset({"duplicates"})
+) -> Iterator[os.DirEntry]:
+    """Yield os.DirEntry objects for all files under fpath, top-down, without
+    descending into directories named in skip_dirs."""
+    pending = [fpath]
+    while pending:
+        subdirs = []
+        with os.scandir(pending.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in skip_dirs:
+                        subdirs.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+        pending.extend(reversed(subdirs))
+
+
 def hash_image(image_path: Path):
-    sha256 = hashlib.sha256()
+    # Only duplicate detection, not security: blake2b is faster than sha256
+    # on most CPUs, and file_digest streams the file without a full read().
     with open(image_path, "rb") as f:
-        while True:
-            data = f.read()
-            if not data:
-                break
-            sha256.update(data)
-
-    return sha256.hexdigest()
+        return hashlib.file_digest(f, "blake2b").hexdigest()
 
 
 def main():
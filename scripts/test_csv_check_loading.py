@@ -4,6 +4,8 @@ from math import nan
 
 import polars as pl
 
+NUM_PATTERN = r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+
 df = pl.read_csv("./data/csv/ap_preop.csv")
 
 # df = df.drop(["image_path", "image_quality"])
@@ -27,12 +29,9 @@ print(landmarks)
 # out = df.with_columns(pl.col(c).list.to_array(2).alias(c + "_arr") for c in landmarks)
 out = df.with_columns(
     pl.col(c)
-    .str.strip_prefix("[")
-    .str.strip_suffix("]")
-    .str.split(",")
+    .str.extract_all(NUM_PATTERN)
     .list.eval(pl.element().cast(pl.Float32))
-    # .list.to_array(2)
-    # .alias(c + "_arr")
+    .list.to_array(2)
     for c in landmarks
 )
 df = out
@@ -40,13 +39,10 @@ df = out
 
 out = df.with_columns(
     pl.col(c)
-    .str.strip_prefix("[")
-    .str.strip_suffix("]")
-    .str.split(",")
-    .list.eval(pl.element().str.strip_chars())
-    .list.slice(0, 2)
+    .str.extract_all(NUM_PATTERN)
+    .list.head(2)
     .list.eval(pl.element().cast(pl.Float32))
-    # .list.to_array(2)
+    .list.to_array(2)
     # .list.to_struct(
     #     fields=[
     #         "x",
@@ -65,13 +61,11 @@ paths = out.get_column("image_path")
 
 print(paths[0])
 
-single_row = out.row(0, named=True)
-single_row["LASIS"] = [0.0, 0.0]
-# dct = {k: pl.Null if not v else [v] for k, v in single_row.items()}
-
-dct = {k: [v] for k, v in single_row.items()}
-new_df = pl.DataFrame(dct, nan_to_null=True)
-# new_df = pl.DataFrame(row_for_df)
-print(new_df)
-out = out.update(new_df, on="image_path")
+row_idx = out.get_column("image_path").index_of(paths[0])
+out = out.with_columns(
+    pl.when(pl.int_range(pl.len()) == row_idx)
+    .then(pl.lit([0.0, 0.0], dtype=out.schema["LASIS"]))
+    .otherwise(pl.col("LASIS"))
+    .alias("LASIS")
+)
 print(out)
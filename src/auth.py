@@ -14,11 +14,16 @@ Usage:
 from __future__ import annotations
 
 import asyncio
+import functools
 import getpass
+import hashlib
+import json
 import logging
 import socket
 import threading
+import time
 import tkinter as tk
+import urllib.request
 
 # Prioritize IPv4 to avoid 5s hangs on broken IPv6 routes (common on some networks)
 _original_getaddrinfo = socket.getaddrinfo
@@ -32,10 +37,11 @@ def _getaddrinfo_prioritize_ipv4(*args, **kwargs):
 
 socket.getaddrinfo = _getaddrinfo_prioritize_ipv4
 import webbrowser
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from pathlib import Path
 from tkinter import font, ttk
-from typing import Callable, Optional, Sequence
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from azure.identity import (
     AuthenticationRecord,
@@ -43,8 +49,14 @@ from azure.identity import (
     TokenCachePersistenceOptions,
 )
 from msgraph import GraphServiceClient
+from msgraph.generated.drives.item.items.item.create_upload_session.create_upload_session_post_request_body import (  # noqa: E501
+    CreateUploadSessionPostRequestBody,
+)
 from msgraph.generated.models.drive_item import DriveItem
-from msgraph.generated.models.folder import Folder
+from msgraph.generated.models.drive_item_uploadable_properties import (
+    DriveItemUploadableProperties,
+)
+from msgraph_core.tasks.large_file_upload import LargeFileUploadTask
 
 from dirs import AUTH_DIR
 
@@ -62,6 +74,35 @@ SHAREPOINT_DRIVE_ID = (
 BASE_BACKUP_FOLDER = "pelvic-2d-points-backup"
 
 AUTH_RECORD_PATH = AUTH_DIR / "auth_record.json"
+# Persistent MSAL token cache shared by every credential in this process
+_CACHE_OPTS = TokenCachePersistenceOptions(
+    name="onedrive-ml", allow_unencrypted_storage=True
+)
+# Expiry of the last access token acquired, to skip re-verifying it on startup
+AUTH_META_PATH = AUTH_DIR / "auth_meta.json"
+# Re-verify tokens that expire within this many seconds
+TOKEN_EXPIRY_MARGIN = 300
+# local path -> [remote item path, mtime_ns, size, blake2b] of the last upload
+UPLOAD_LEDGER_PATH = AUTH_DIR / "upload_ledger.json"
+
+# Files larger than this are streamed through a resumable upload session
+# instead of a single in-memory PUT
+SIMPLE_UPLOAD_LIMIT = 4 * 1024 * 1024
+# Upload session chunks must be a multiple of 320 KiB
+UPLOAD_CHUNK_SIZE = 32 * 320 * 1024
+_MAX_CONCURRENT_UPLOADS = 8
+
+# Host probed before uploading, the probe's connect timeout, and how many
+# seconds its answer is reused
+GRAPH_PROBE_ADDRESS = ("graph.microsoft.com", 443)
+PROBE_TIMEOUT = 1.0
+PROBE_TTL = 5.0
+_probe_cache: Optional[Tuple[float, bool]] = None
+_probe_lock = threading.Lock()
+
+# Worker threads that wait on background uploads (the uploads themselves run
+# on each OneDriveBackup's event loop)
+_upload_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="onedrive")
 
 # Module-level cached credential to avoid MSAL token-cache file-lock
 # contention when many DeviceCodeCredential instances are created rapidly.
@@ -70,11 +111,13 @@ _credential_lock = threading.Lock()
 
 # Global reference to auth dialog (to prevent garbage collection)
 _auth_dialog: Optional[tk.Toplevel] = None
+# Tk deletes a named font once its Font object is collected, so keep it too
+_auth_code_font: Optional[font.Font] = None
 
 
 def _show_auth_dialog(uri: str, code: str) -> None:
     """Show a Tkinter dialog with the authentication code."""
-    global _auth_dialog
+    global _auth_dialog, _auth_code_font
 
     # Try to get existing Tk root, or create temporary one
     try:
@@ -121,7 +164,6 @@ def _show_auth_dialog(uri: str, code: str) -> None:
     instructions = ttk.Label(
         frame,
         text="A browser window has opened.\nEnter this code to sign in:",
-        font=font.nametofont("TkDefaultFont").copy().configure(size=28),
         justify="center",
     )
     instructions.pack(pady=(0, 20))
@@ -130,10 +172,13 @@ def _show_auth_dialog(uri: str, code: str) -> None:
     code_frame = ttk.Frame(frame)
     code_frame.pack(pady=10)
 
+    # Font.configure() returns None, so configure the copy before passing it
+    code_font = font.nametofont("TkDefaultFont", root=dialog).copy()
+    code_font.configure(size=28, weight="bold")
     code_label = ttk.Label(
         code_frame,
         text=code,
-        font=font.nametofont("TkDefaultFont").copy().configure(size=36),
+        font=code_font,
         foreground="#0066cc",
     )
     code_label.pack(padx=20, pady=15)
@@ -172,6 +217,7 @@ def _show_auth_dialog(uri: str, code: str) -> None:
 
     # Store reference globally to prevent garbage collection
     _auth_dialog = dialog
+    _auth_code_font = code_font
 
     # Force update
     dialog.update()
@@ -179,30 +225,36 @@ def _show_auth_dialog(uri: str, code: str) -> None:
 
 def _close_auth_dialog() -> None:
     """Close the auth dialog if it exists."""
-    global _auth_dialog
+    global _auth_dialog, _auth_code_font
     if _auth_dialog is not None:
         try:
             _auth_dialog.destroy()
         except Exception:
             pass
         _auth_dialog = None
+        _auth_code_font = None
+
+
+def _open_browser(uri: str) -> None:
+    """Open uri in a new browser tab, ignoring failures."""
+    try:
+        webbrowser.open(uri, new=2)
+    except Exception:
+        pass
 
 
 def _prompt_callback(uri: str, code: str, expires_on) -> None:
     """Display device code authentication prompt via Tkinter dialog."""
-    # Open browser
+    # Open browser on a worker thread; launching the OS handler can block
     if uri:
-        try:
-            webbrowser.open(uri, new=2)
-        except Exception:
-            pass
+        threading.Thread(target=_open_browser, args=(uri,), daemon=True).start()
 
     # Show Tkinter dialog with code
     try:
         _show_auth_dialog(uri, code)
     except Exception as e:
         # Fallback to console if Tkinter fails
-        logger.warning(f"Failed to show auth dialog: {e}")
+        logger.warning("Failed to show auth dialog: %s", e)
         print(f"\n{'=' * 60}")
         print("ONE-TIME LOGIN")
         print(f"Open: {uri}")
@@ -210,6 +262,7 @@ def _prompt_callback(uri: str, code: str, expires_on) -> None:
         print("=" * 60)
 
 
+@functools.lru_cache(maxsize=1)
 def get_safe_username() -> str:
     """Get username for folder paths. Cross-platform safe."""
     try:
@@ -220,9 +273,66 @@ def get_safe_username() -> str:
         return os.getenv("USER") or os.getenv("USERNAME") or "default_user"
 
 
+# (day, folder name) from the last get_date_folder call
+_date_folder_cache: Optional[Tuple[date, str]] = None
+
+
 def get_date_folder() -> str:
     """Get today's date as folder name (YYYY-MM-DD)."""
-    return datetime.now().strftime("%Y-%m-%d")
+    global _date_folder_cache
+    today = date.today()
+    if _date_folder_cache is None or _date_folder_cache[0] != today:
+        _date_folder_cache = (today, today.isoformat())
+    return _date_folder_cache[1]
+
+
+def _cached_token_is_fresh() -> bool:
+    """True if the last acquired token has over TOKEN_EXPIRY_MARGIN s left."""
+    try:
+        expires_on = json.loads(AUTH_META_PATH.read_text())["expires_on"]
+        return time.time() + TOKEN_EXPIRY_MARGIN < float(expires_on)
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+
+
+def _save_token_expiry(expires_on: int) -> None:
+    """Record when the token just acquired expires (see _cached_token_is_fresh)."""
+    try:
+        AUTH_META_PATH.parent.mkdir(parents=True, exist_ok=True)
+        AUTH_META_PATH.write_text(json.dumps({"expires_on": expires_on}))
+    except OSError as e:
+        logger.warning("Failed to save token expiry: %s", e)
+
+
+def _probe_online() -> bool:
+    """
+    Check that Graph accepts TCP connections, so offline uploads fail fast.
+
+    The answer is cached for PROBE_TTL seconds. Behind an HTTPS proxy a
+    direct connect proves nothing (httpx goes through the proxy), so Graph
+    is assumed reachable.
+    """
+    global _probe_cache
+    proxies = urllib.request.getproxies()
+    if proxies.get("https") or proxies.get("all"):
+        return True
+    with _probe_lock:
+        now = time.monotonic()
+        if _probe_cache is not None and now - _probe_cache[0] < PROBE_TTL:
+            return _probe_cache[1]
+        try:
+            socket.create_connection(GRAPH_PROBE_ADDRESS, timeout=PROBE_TIMEOUT).close()
+            online = True
+        except OSError:
+            online = False
+        _probe_cache = (now, online)
+        return online
+
+
+def _file_digest(path: Path) -> str:
+    """Hex blake2b digest of the file at path."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "blake2b").hexdigest()
 
 
 def _get_or_create_credential(
@@ -262,14 +372,10 @@ def _get_or_create_credential(
                 record = None
 
         # Setup credential with token cache
-        cache_opts = TokenCachePersistenceOptions(
-            name="onedrive-ml", allow_unencrypted_storage=True
-        )
-
         _shared_credential = DeviceCodeCredential(
             client_id=CLIENT_ID,
             tenant_id=TENANT_ID,
-            cache_persistence_options=cache_opts,
+            cache_persistence_options=_CACHE_OPTS,
             authentication_record=record,
             prompt_callback=prompt_callback_fn or _prompt_callback,
         )
@@ -302,11 +408,18 @@ def get_graph_client(prompt_callback_fn=None) -> GraphServiceClient:
     """
     credential = _get_or_create_credential(prompt_callback_fn)
 
-    # Always try to get a token to verify/refresh credentials
+    if AUTH_RECORD_PATH.exists() and _cached_token_is_fresh():
+        # The token cache still holds a valid token, which the client picks up
+        # on its first request; skip the MSAL cache round-trip here
+        logger.info("Cached token still valid, skipping verification")
+        return GraphServiceClient(credentials=credential, scopes=SCOPES)
+
+    # Otherwise get a token now to verify/refresh credentials
     try:
         logger.info("Verifying/refreshing token...")
         token = credential.get_token(*SCOPES)
         logger.info("Token acquired (expires: %s)", token.expires_on)
+        _save_token_expiry(token.expires_on)
 
         # If we didn't have a record before, save one now
         if not AUTH_RECORD_PATH.exists():
@@ -345,6 +458,13 @@ class OneDriveBackup:
         self._credential: Optional[DeviceCodeCredential] = None
         self._lock = threading.Lock()
         self._initialized = False
+        # Background event loop that runs every upload, and the Graph client
+        # whose httpx connection pool is bound to it
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_client: Optional[GraphServiceClient] = None
+        self._loop_lock = threading.Lock()
+        # Loaded from UPLOAD_LEDGER_PATH on first use; only touched on the loop
+        self._ledger: Optional[Dict[str, List[Any]]] = None
 
     def _ensure_initialized(self) -> bool:
         """Lazy initialization of Graph client. Returns True if ready."""
@@ -380,58 +500,44 @@ class OneDriveBackup:
             logger.error("Failed to get credential: %s", e)
             return None
 
-    async def _ensure_folder_exists(self, folder_path: str) -> bool:
-        """
-        Ensure folder path exists, creating nested folders as needed.
-        folder_path: e.g., "pelvic-2d-points-backup/username/2024-01-15"
+    async def _put_file(
+        self, client: GraphServiceClient, local_path: Path, drive_item_path: str
+    ) -> Optional[DriveItem]:
         """
-        if not self._client:
-            return False
-
-        parts = folder_path.strip("/").split("/")
-        current_path = ""
-
-        for part in parts:
-            parent_path = current_path if current_path else "root"
-            current_path = f"{current_path}/{part}" if current_path else part
+        Upload local_path to drive_item_path (e.g. "root:/folder/file.json:").
 
-            try:
-                # Check if folder exists by trying to get it
-                item_path = f"root:/{current_path}:" if current_path else "root"
-                await (
-                    self._client.drives.by_drive_id(SHAREPOINT_DRIVE_ID)
-                    .items.by_drive_item_id(item_path)
-                    .get()
+        Small files go up in one PUT. Larger ones are streamed from disk in
+        UPLOAD_CHUNK_SIZE pieces through an upload session, so only one chunk
+        is held in memory at a time.
+        """
+        item = client.drives.by_drive_id(SHAREPOINT_DRIVE_ID).items.by_drive_item_id(
+            drive_item_path
+        )
+        file_size = local_path.stat().st_size
+        logger.debug("File size: %d bytes", file_size)
+        if file_size <= SIMPLE_UPLOAD_LIMIT:
+            return await item.content.put(local_path.read_bytes())
+
+        session = await item.create_upload_session.post(
+            CreateUploadSessionPostRequestBody(
+                item=DriveItemUploadableProperties(
+                    additional_data={"@microsoft.graph.conflictBehavior": "replace"}
                 )
-            except Exception:
-                # Folder doesn't exist, create it
-                try:
-                    request_body = DriveItem(
-                        name=part,
-                        folder=Folder(),
-                        additional_data={
-                            "@microsoft.graph" + ".conflictBehavior": "fail"
-                        },
-                    )
-
-                    parent_item_id = (
-                        f"root:/{'/'.join(current_path.split('/')[:-1])}:"
-                        if "/" in current_path
-                        else "root"
-                    )
-
-                    await (
-                        self._client.drives.by_drive_id(SHAREPOINT_DRIVE_ID)
-                        .items.by_drive_item_id(parent_item_id)
-                        .children.post(request_body)
-                    )
-                    logger.info(f"Created folder: {current_path}")
-                except Exception as e:
-                    # Might already exist due to race condition, continue
-                    if "nameAlreadyExists" not in str(e):
-                        logger.warning(f"Failed to create folder {current_path}: {e}")
+            )
+        )
+        if session is None:
+            return None
 
-        return True
+        with open(local_path, "rb") as f:
+            task = LargeFileUploadTask(
+                upload_session=session,
+                request_adapter=client.request_adapter,
+                stream=f,
+                parsable_factory=DriveItem,
+                max_chunk_size=UPLOAD_CHUNK_SIZE,
+            )
+            result = await task.upload()
+        return result.item_response
 
     async def _upload_file_async(self, local_path: Path, remote_folder: str) -> bool:
         """Upload a file to the specified remote folder."""
@@ -439,25 +545,20 @@ class OneDriveBackup:
             return False
 
         try:
-            with open(local_path, "rb") as f:
-                file_content = f.read()
-
             dest_file_name = local_path.name
             drive_item_path = f"root:/{remote_folder}/{dest_file_name}:"
 
-            uploaded_file: Optional[DriveItem] = await (
-                self._client.drives.by_drive_id(SHAREPOINT_DRIVE_ID)
-                .items.by_drive_item_id(drive_item_path)
-                .content.put(file_content)
+            uploaded_file = await self._put_file(
+                self._client, local_path, drive_item_path
             )
 
             if uploaded_file and uploaded_file.name:
-                logger.info(f"Uploaded: {uploaded_file.name} to {remote_folder}")
+                logger.info("Uploaded: %s to %s", uploaded_file.name, remote_folder)
                 return True
             return False
 
         except Exception as e:
-            logger.error(f"Failed to upload {local_path}: {e}")
+            logger.error("Failed to upload %s: %s", local_path, e)
             return False
 
     async def _backup_file_async(self, local_path: Path) -> bool:
@@ -466,8 +567,9 @@ class OneDriveBackup:
 
         Uploads to: pelvic-2d-points-backup/<username>/<YYYY-MM-DD>/<filename>
         """
-        # Note: _ensure_initialized must be called BEFORE entering async context
-        # (it's called in upload_backup_sync before run_until_complete)
+        # Note: uses self._client, so _ensure_initialized must be called BEFORE
+        # entering async context. The upload paths use _backup_with_client with
+        # the shared-loop client from _create_fresh_client instead.
         if not self._client:
             logger.error("OneDrive client not initialized")
             return False
@@ -494,43 +596,74 @@ class OneDriveBackup:
         """
         path = Path(file_path)
         if not path.exists():
-            logger.warning(f"File does not exist: {path}")
+            logger.warning("File does not exist: %s", path)
             if callback:
                 callback(False)
             return
 
         def _run():
-            # Use sync upload which creates fresh client per thread
+            # Blocks this worker thread; the upload itself runs on the shared loop
             success = self.upload_backup_sync(path, timeout=30.0)
             if callback:
                 callback(success)
 
-        thread = threading.Thread(target=_run, daemon=True)
-        thread.start()
+        _upload_executor.submit(_run)
 
     def _create_fresh_client(self) -> Optional[GraphServiceClient]:
         """
-        Create a fresh Graph client for the current thread.
+        Get the Graph client for the background loop, creating it on first use.
 
-        The MS Graph SDK uses httpx which has thread/event-loop affinity,
-        so we need a fresh GraphServiceClient for each thread. However,
-        the DeviceCodeCredential is reused — creating many credential
-        instances causes MSAL token-cache file-lock contention and hangs.
+        The MS Graph SDK uses httpx which has event-loop affinity, so the
+        client must only be used from coroutines passed to ``_run_coroutine``.
+        Every upload then shares its connection pool. The DeviceCodeCredential
+        is shared process-wide — creating many credential instances causes
+        MSAL token-cache file-lock contention and hangs.
         """
-        try:
-            logger.info("Creating fresh client for this thread...")
+        with self._loop_lock:
+            if self._loop_client is not None:
+                return self._loop_client
+
+            try:
+                logger.debug("Creating client for the upload loop...")
+
+                credential = self._get_shared_credential()
+                if credential is None:
+                    return None
+
+                client = GraphServiceClient(credentials=credential, scopes=SCOPES)
+                self._loop_client = client
+                logger.info("Loop client created successfully")
+                return client
 
-            credential = self._get_shared_credential()
-            if credential is None:
+            except Exception as e:
+                logger.error("Failed to create fresh client: %s", e)
                 return None
 
-            client = GraphServiceClient(credentials=credential, scopes=SCOPES)
-            logger.info("Fresh client created successfully")
-            return client
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the background upload loop, starting its thread on first use."""
+        with self._loop_lock:
+            if self._loop is None:
+                # SelectorEventLoop avoids Windows ProactorEventLoop hangs
+                loop = asyncio.SelectorEventLoop()
+                threading.Thread(
+                    target=loop.run_forever, name="onedrive-loop", daemon=True
+                ).start()
+                self._loop = loop
+            return self._loop
+
+    def _run_coroutine(self, coro, timeout: Optional[float] = None):
+        """
+        Run coro on the background upload loop and wait for its result.
 
-        except Exception as e:
-            logger.error("Failed to create fresh client: %s", e)
-            return None
+        Raises TimeoutError (after cancelling coro) if it takes longer than
+        timeout seconds.
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self._get_loop())
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
 
     def upload_backup_sync(self, file_path: str | Path, timeout: float = 30.0) -> bool:
         """
@@ -550,6 +683,10 @@ class OneDriveBackup:
             logger.warning("File does not exist: %s", path)
             return False
 
+        if not _probe_online():
+            logger.warning("OneDrive unreachable, skipping upload of %s", path.name)
+            return False
+
         logger.info("Starting sync upload: %s", path.name)
 
         try:
@@ -558,49 +695,98 @@ class OneDriveBackup:
                 logger.warning("No client available, skipping upload")
                 return False
 
-            loop = asyncio.SelectorEventLoop()
-
-            async def do_upload():
-                logger.info("Reading file: %s", path.name)
-                with open(path, "rb") as f:
-                    file_content = f.read()
-                logger.info("File size: %d bytes", len(file_content))
-
-                username = get_safe_username()
-                date_folder = get_date_folder()
-                remote_folder = f"{BASE_BACKUP_FOLDER}/{username}/{date_folder}"
-                drive_item_path = f"root:/{remote_folder}/{path.name}:"
-
-                logger.info("Uploading to: %s", drive_item_path)
-
-                uploaded_file = await (
-                    client.drives.by_drive_id(SHAREPOINT_DRIVE_ID)
-                    .items.by_drive_item_id(drive_item_path)
-                    .content.put(file_content)
-                )
-
-                logger.info(
-                    "Upload complete: %s",
-                    uploaded_file.name if uploaded_file else "unknown",
-                )
-                return uploaded_file is not None
-
-            logger.info("Running upload with %.1fs timeout...", timeout)
-            coro = asyncio.wait_for(do_upload(), timeout=timeout)
-            try:
-                success = loop.run_until_complete(coro)
-            finally:
-                loop.close()
+            logger.debug("Running upload with %.1fs timeout...", timeout)
+            success = self._run_coroutine(
+                self._backup_with_client(client, path), timeout=timeout
+            )
             logger.info("Sync upload result: %s", "success" if success else "failed")
             return success
 
-        except asyncio.TimeoutError:
+        except TimeoutError:
             logger.warning("Upload timed out after %.1fs for %s", timeout, path)
             return False
         except Exception as e:
             logger.error("Sync backup error: %s", e, exc_info=True)
             return False
 
+    async def _backup_with_client(self, client: GraphServiceClient, path: Path) -> bool:
+        """Upload path to the user/date backup folder using client."""
+        username = get_safe_username()
+        date_folder = get_date_folder()
+        remote_folder = f"{BASE_BACKUP_FOLDER}/{username}/{date_folder}"
+        drive_item_path = f"root:/{remote_folder}/{path.name}:"
+
+        # Skip files already uploaded to this item with the same content
+        key = str(path.resolve())
+        st = path.stat()
+        stamp = [drive_item_path, st.st_mtime_ns, st.st_size]
+        last = self._upload_ledger().get(key)
+        if last is not None and last[:3] == stamp:
+            logger.debug("Unchanged since last upload, skipping: %s", path.name)
+            return True
+        digest = await asyncio.to_thread(_file_digest, path)
+        if last is not None and last[0] == drive_item_path and last[3] == digest:
+            logger.debug("Content unchanged since last upload, skipping: %s", path.name)
+            self._record_upload(key, stamp + [digest])
+            return True
+
+        logger.debug("Uploading to: %s", drive_item_path)
+
+        uploaded_file = await self._put_file(client, path, drive_item_path)
+
+        logger.debug(
+            "Upload complete: %s",
+            uploaded_file.name if uploaded_file else "unknown",
+        )
+        if uploaded_file is None:
+            return False
+        self._record_upload(key, stamp + [digest])
+        return True
+
+    def _upload_ledger(self) -> Dict[str, List[Any]]:
+        """Get the record of past uploads, loading it on first use."""
+        if self._ledger is None:
+            try:
+                self._ledger = json.loads(UPLOAD_LEDGER_PATH.read_text())
+            except (OSError, ValueError):
+                self._ledger = {}
+        return self._ledger
+
+    def _record_upload(self, key: str, entry: List[Any]) -> None:
+        """Store entry for the local path key and save the ledger."""
+        ledger = self._upload_ledger()
+        ledger[key] = entry
+        try:
+            UPLOAD_LEDGER_PATH.parent.mkdir(parents=True, exist_ok=True)
+            UPLOAD_LEDGER_PATH.write_text(json.dumps(ledger))
+        except OSError as e:
+            logger.warning("Failed to save upload ledger: %s", e)
+
+    async def _backup_many_async(
+        self, client: GraphServiceClient, paths: Sequence[Path], timeout: float
+    ) -> int:
+        """
+        Upload paths concurrently and return how many succeeded.
+
+        At most _MAX_CONCURRENT_UPLOADS run at once, each limited to timeout
+        seconds.
+        """
+        sem = asyncio.Semaphore(_MAX_CONCURRENT_UPLOADS)
+
+        async def upload(path: Path) -> bool:
+            async with sem:
+                return await asyncio.wait_for(
+                    self._backup_with_client(client, path), timeout=timeout
+                )
+
+        results = await asyncio.gather(
+            *(upload(path) for path in paths), return_exceptions=True
+        )
+        for path, result in zip(paths, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning("Backup of %s failed: %r", path.name, result)
+        return sum(result is True for result in results)
+
     def backup_multiple(
         self,
         file_paths: Sequence[str | Path],
@@ -617,19 +803,24 @@ class OneDriveBackup:
         def _run():
             success_count = 0
             total = len(file_paths)
+            paths = [p for p in map(Path, file_paths) if p.exists()]
+            if paths and not _probe_online():
+                logger.warning("OneDrive unreachable, skipping backup")
+                paths = []
 
-            for path in file_paths:
-                p = Path(path)
-                if p.exists():
-                    # Use sync upload which creates fresh client per thread
-                    if self.upload_backup_sync(p, timeout=30.0):
-                        success_count += 1
+            client = self._create_fresh_client() if paths else None
+            if client is not None:
+                try:
+                    success_count = self._run_coroutine(
+                        self._backup_many_async(client, paths, timeout=30.0)
+                    )
+                except Exception as e:
+                    logger.error("Multi-file backup error: %s", e, exc_info=True)
 
             if callback:
                 callback(success_count, total)
 
-        thread = threading.Thread(target=_run, daemon=True)
-        thread.start()
+        _upload_executor.submit(_run)
 
 
 # Convenience function for simple usage
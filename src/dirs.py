@@ -3,6 +3,7 @@ import platform
 from pathlib import Path
 
 BASE_DIR = Path(__file__).parents[1]
+BASE_DIR_RESOLVED = BASE_DIR.resolve()
 APP_DIR = BASE_DIR.parent
 BASE_DIR_PATH = Path(BASE_DIR)
 DATA_DIR = APP_DIR / "data"
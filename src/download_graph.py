@@ -149,7 +149,6 @@ def download_graph(
             on_progress("Listing files\u2026")
 
         # Use SelectorEventLoop to avoid Windows ProactorEventLoop hangs
-        # (same pattern as auth.py upload_backup_sync)
         loop = asyncio.SelectorEventLoop()
         file_count = [0]
         sem = asyncio.Semaphore(_MAX_CONCURRENT_DOWNLOADS)
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 # pyright: reportMissingImports=false, reportMissingTypeArgument=false, reportUninitializedInstanceVariable=false, reportOperatorIssue=false
 import ast
-import asyncio
 import datetime
 import getpass
 import io
 import json
 import logging
+import os
+import re
 import sqlite3
 import threading
 import tkinter as tk
@@ -15,7 +16,21 @@ import tkinter.font as tkfont
 from datetime import datetime
 from pathlib import Path, PurePath
 from tkinter import filedialog, messagebox, ttk
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Configure logging - writes to file for debugging without disrupting users
 logging.basicConfig(
@@ -27,9 +42,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-import cv2
 import numpy as np
-import pandas as pd
 from PIL import Image, ImageTk
 
 from auth import (  # pyright: ignore[reportImplicitRelativeImport]
@@ -41,7 +54,11 @@ from dataset_config import (  # pyright: ignore[reportImplicitRelativeImport]
     get_dataset_dest,
     load_datasets_config,
 )
-from dirs import BASE_DIR, PLATFORM  # pyright: ignore[reportImplicitRelativeImport]
+from dirs import (  # pyright: ignore[reportImplicitRelativeImport]
+    BASE_DIR,
+    BASE_DIR_RESOLVED,
+    PLATFORM,
+)
 from downloader import download_dataset  # pyright: ignore[reportImplicitRelativeImport]
 from landmark_reference import (  # pyright: ignore[reportImplicitRelativeImport]
     LandmarkReference,  # pyright: ignore[reportImplicitRelativeImport]
@@ -49,11 +66,20 @@ from landmark_reference import (  # pyright: ignore[reportImplicitRelativeImport
 from landmark_reference_dialog import (  # pyright: ignore[reportImplicitRelativeImport]
     LandmarkReferenceDialog,  # pyright: ignore[reportImplicitRelativeImport]
 )
-from path_utils import extract_filename  # pyright: ignore[reportImplicitRelativeImport]
+from path_utils import (  # pyright: ignore[reportImplicitRelativeImport]
+    extract_filename,
+    iter_image_files,
+)
 
 AnnotationPoint = Tuple[float, float]
 AnnotationValue = Union[AnnotationPoint, List[AnnotationPoint]]
 
+# Legacy CSV cells are Python list reprs: "[x, y]", "[[x1, y1], [x2, y2]]" for
+# line landmarks, or "[x, y, 'FF', sens, edge_lock, edge_width, clahe, grow]"
+# for LOB/ROB. These pull the numbers and the method name out without an AST.
+_CSV_NUM_RE = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_CSV_METHOD_RE = re.compile(r"['\"]([^'\"]*)['\"]")
+
 # Display order for the landmark panel and keyboard navigation.
 # Landmarks not listed here are appended at the end in their original JSON order.
 # Changing this list does NOT affect how annotations are stored or read.
@@ -109,6 +135,25 @@ LANDMARK_DISPLAY_ORDER: List[str] = [
 
 class AnnotationGUI(tk.Tk):
     HOVER_CIRCLE_LANDMARKS: Set[str] = {"L-FHC", "R-FHC", "L-AC", "R-AC"}
+    # Number of resized base images kept for flipping back and forth
+    RESIZED_IMAGE_CACHE_SIZE = 8
+    # Delay used to coalesce <Configure> bursts while the window is dragged
+    RESIZE_DEBOUNCE_MS = 30
+    # (keys, action) rows shown by the "h" help window
+    SHORTCUT_ROWS: Tuple[Tuple[str, str], ...] = (
+        ("<up> / ↑ / d", "Previous landmark"),
+        ("<down> / ↓ / f", "Next landmark"),
+        ("<left> / <--", "Hide selected landmark"),
+        ("<right> / -->", "Show selected landmark"),
+        ("b / Ctrl+b", "Previous image"),
+        ("n / Ctrl+n", "Next image"),
+        ("1–4", "Set image quality (1-worst, 4-best)"),
+        ("Backspace", "Delete selected landmark"),
+        ("h", "Show this help"),
+        ("?", "Show landmark reference"),
+        ("Mouse click", "Place landmark"),
+        ("Mouse wheel", "Adjust hover radius"),
+    )
 
     def __init__(self) -> None:
         super().__init__()
@@ -127,22 +172,19 @@ class AnnotationGUI(tk.Tk):
         self._onedrive_upload_in_flight: bool = False
         if PLATFORM == "Linux":
             self._configure_linux_fonts()
+        # Classic tk widgets pick this up from the option database; only
+        # widgets that want heading_font pass font= explicitly.
+        self.option_add("*Font", self.dialogue_font)
 
         self.title("2D Point Annotation")
-        self.possible_image_suffix = [
-            ".png",
-            ".PNG",
-            ".jpg",
-            ".jpeg",
-            ".JPEG",
-            ".JPG",
-            ".bmp",
-            ".BMP",
-            ".tif",
-            ".tiff",
-            ".TIFF",
-            ".TIF",
-        ]
+        # Lowercase only: callers compare against suffix.lower()
+        self.possible_image_suffix = frozenset(
+            {".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff"}
+        )
+        # directory -> (mtime, sorted image names, name -> index)
+        self._dir_cache: Dict[Path, Tuple[float, List[str], Dict[str, int]]] = {}
+        # Resolved directory of the last listing, reused to build next/prev paths
+        self._current_dir: Optional[Path] = None
         self._panel_width = 450
         self._scrollbar_width = 18
         self._start_min_w = 0
@@ -158,6 +200,8 @@ class AnnotationGUI(tk.Tk):
         self.selected_landmark = tk.StringVar(value="")
         self._landmark_ref: LandmarkReference | None = None
         self._landmark_ref_dialog: LandmarkReferenceDialog | None = None
+        # Built on the first "h" press, then withdrawn and re-shown
+        self._help_win: tk.Toplevel | None = None
         _lm_json = Path(__file__).parent.parent / "docs" / "landmarks.json"
         if _lm_json.exists():
             try:
@@ -169,13 +213,19 @@ class AnnotationGUI(tk.Tk):
         self.current_view_var = tk.StringVar(value="")
         self.view_dropdown: ttk.Combobox | None = None
         self.image_flag_var = tk.BooleanVar(value=False)
-        self.landmark_visibility: Dict[str, tk.BooleanVar] = {}
-        self.landmark_found = {}
-        self.landmark_flagged: Dict[str, tk.BooleanVar] = {}
-        self.landmark_flag_widgets: Dict[str, tk.Checkbutton] = {}
-        self.landmark_found_widgets: Dict[str, tk.Checkbutton] = {}
+        # Per-landmark panel state as plain bools; the Treeview rows are
+        # redrawn from these by _refresh_landmark_row.
+        self.landmark_visibility: Dict[str, bool] = {}
+        self.landmark_found: Dict[str, bool] = {}
+        self.landmark_flagged: Dict[str, bool] = {}
+        self.landmark_tree: ttk.Treeview | None = None
         self.annotations: Dict[str, Dict[str, AnnotationValue]] = {}
         self.landmarks: List[str] = []
+        # Lowercase name -> landmark; refreshed wherever self.landmarks is set
+        self._lm_lower: Dict[str, str] = {}
+        # Landmarks shown in the panel, in display order, and their row index
+        self._panel_landmarks: List[str] = []
+        self._lm_idx: Dict[str, int] = {}
         self.images: List[Path] = []
         self.image_index_map: Dict[str, int] = {}
         self.current_image_index: int = -1
@@ -198,7 +248,10 @@ class AnnotationGUI(tk.Tk):
         self.image_direction_var = tk.StringVar(value="AP")
         self.line_landmarks: Set[str] = {"L-FA", "R-FA"}
         self.current_image: Image.Image | None = None
-        self.current_image_path: Path | None = None
+        # Integer-decimated pixels of current_image used only to build the preview
+        self._preview_np: np.ndarray | None = None
+        # Setting current_image_path also refreshes the cached dict keys
+        self.current_image_path = None
         self.current_image_quality: int = 0
         self.img_obj: ImageTk.PhotoImage | None = None
         self.seg_img_objs: Dict[str, ImageTk.PhotoImage] = {}
@@ -223,10 +276,30 @@ class AnnotationGUI(tk.Tk):
         self.edge_lock_width = tk.IntVar(value=2)
         self.use_clahe = tk.BooleanVar(value=True)
         self.grow_shrink = tk.IntVar(value=0)
+        # (source image, use_clahe, preprocessed gray) for segmentation
+        self._gray_cache: Optional[Tuple[Image.Image, bool, np.ndarray]] = None
+        # (gray it was built from, dilation radius, edge barrier) for flood fill
+        self._barrier_cache: Optional[Tuple[np.ndarray, int, np.ndarray]] = None
+        # radius -> elliptical (2r+1)x(2r+1) morphology kernel
+        self._ellipse_kernels: Dict[int, np.ndarray] = {}
+        # Shared CLAHE operator (clip 2.0, 8x8 tiles), created on first use
+        self._clahe: Optional[Any] = None
         self.disp_scale: float = 1.0
         self.disp_off: Tuple[int, int] = (0, 0)  # (offset_x, offset_y)
         self.disp_size: Tuple[int, int] = (0, 0)  # (disp_w, disp_h)
         self.base_img_item: Optional[int] = None
+        # landmark -> (oval, label shadow, label) canvas items for point markers
+        self._point_items: Dict[str, Tuple[int, int, int]] = {}
+        # landmark -> (x, y, label_y, oval color, text color, font) last applied
+        # to its point items; present only while the items are shown
+        self._point_item_state: Dict[str, Tuple[Any, ...]] = {}
+        # True while a _request_draw redraw is queued with after_idle
+        self._draw_pending: bool = False
+        # (font name, size) -> derived font used for marker labels
+        self._derived_fonts: Dict[Tuple[str, int], tkfont.Font] = {}
+        self._last_disp_size: Optional[Tuple[int, int]] = None
+        self._resize_after_id: Optional[str] = None
+        self._resized_image_cache: Dict[Tuple[str, int, int], Image.Image] = {}
         self.mouse_crosshair_ids: list[int] = []
         self.last_mouse_canvas_pos: tuple[int, int] | None = None
         self.right_mouse_held: bool = False
@@ -239,6 +312,8 @@ class AnnotationGUI(tk.Tk):
         self.zoom_percentile_low: tk.IntVar = tk.IntVar(value=1)
         self.zoom_percentile_high: tk.IntVar = tk.IntVar(value=99)
         self.zoom_img_obj: ImageTk.PhotoImage | None = None
+        # (mode, size) of zoom_img_obj; paste() converts to the photo's own mode
+        self._zoom_img_key: Optional[Tuple[str, Tuple[int, int]]] = None
         self.zoom_base_item: Optional[int] = None
         self.zoom_src_rect: Tuple[float, float, float, float] | None = None
         self.line_preview_id: Optional[int] = None
@@ -262,25 +337,28 @@ class AnnotationGUI(tk.Tk):
         self.after(0, self._lock_initial_minsize)
         self.unbind("<Up>")
         self.unbind("<Down>")
-        self._bind_shortcut("<Up>", self._on_arrow_up)
-        self._bind_shortcut("<Down>", self._on_arrow_down)
-        self._bind_shortcut("<f>", self._on_arrow_down)
-        self._bind_shortcut("<d>", self._on_arrow_up)
-        self._bind_shortcut("<Left>", self._on_arrow_left)
-        self._bind_shortcut("<Right>", self._on_arrow_right)
-        self._bind_shortcut("<Control-b>", self._on_pg_up)
-        self._bind_shortcut("<Control-n>", self._on_pg_down)
-        self._bind_shortcut("<n>", self._on_pg_down)
-        self._bind_shortcut("<g>", self._on_pg_down)
-        self._bind_shortcut("<b>", self._on_pg_up)
-        self._bind_shortcut("<BackSpace>", self._on_backspace)
-        self._bind_shortcut("<space>", self._on_space)
-        self._bind_shortcut("1", self._on_1_press)
-        self._bind_shortcut("2", self._on_2_press)
-        self._bind_shortcut("3", self._on_3_press)
-        self._bind_shortcut("4", self._on_4_press)
-        self._bind_shortcut("<h>", self._on_h_press)
-        self._bind_shortcut("<question>", self._open_landmark_reference)
+        # Single <KeyPress> binding dispatching on keysym; Control-b/Control-n
+        # share the keysym of b/n and map to the same handlers.
+        self._key_map: Dict[str, Callable[[Any], Any]] = {
+            "Up": self._on_arrow_up,
+            "Down": self._on_arrow_down,
+            "f": self._on_arrow_down,
+            "d": self._on_arrow_up,
+            "Left": self._on_arrow_left,
+            "Right": self._on_arrow_right,
+            "n": self._on_pg_down,
+            "g": self._on_pg_down,
+            "b": self._on_pg_up,
+            "BackSpace": self._on_backspace,
+            "space": self._on_space,
+            "1": self._on_1_press,
+            "2": self._on_2_press,
+            "3": self._on_3_press,
+            "4": self._on_4_press,
+            "h": self._on_h_press,
+            "question": self._open_landmark_reference,
+        }
+        self.bind("<KeyPress>", self._on_key_press)
         self.queue_mode = False
         self.unannotated_queue: List[Path] = []
         self.queue_index = 0
@@ -291,6 +369,13 @@ class AnnotationGUI(tk.Tk):
         self.last_update = datetime.now()
         # Initialize path attributes to prevent AttributeError if accessed before assignment
         self.abs_csv_path: Optional[str] = None
+        # ((path, mtime_ns, size), parsed frame) for the last CSV read
+        self._csv_cache: Optional[Tuple[Tuple[str, int, int], pd.DataFrame]] = None
+        # (path column, path -> first row position) for the cached frame
+        self._csv_row_index: Optional[Tuple[str, Dict[str, int]]] = None
+        # ((CSV stamp, path column, landmarks), annotated filenames) for the
+        # unannotated-image scan
+        self._annotated_cache: Optional[Tuple[Tuple[Any, ...], FrozenSet[str]]] = None
         self.absolute_current_image_path: Optional[Path] = None
         self.csv_local_image_directory_path: Optional[str] = None
 
@@ -380,10 +465,27 @@ class AnnotationGUI(tk.Tk):
     def _path_key(self, path: Union[str, Path]) -> str:
         return str(Path(path).resolve())
 
+    @property
+    def current_image_path(self) -> Optional[Path]:
+        return self._current_image_path
+
+    @current_image_path.setter
+    def current_image_path(self, path: Optional[Path]) -> None:
+        self._current_image_path = path
+        # str() key for the per-image dicts; the resolved key is filled lazily
+        self._cur_key: str = str(path)
+        self._cur_path_key: Optional[str] = None
+
+    def _current_path_key(self) -> str:
+        """_path_key of the current image, resolved once per image."""
+        if self._cur_path_key is None:
+            self._cur_path_key = self._path_key(self.current_image_path)
+        return self._cur_path_key
+
     def _get_current_image_record(self) -> Optional[Dict]:
         if self.current_image_path is None:
             return None
-        idx = self.image_index_map.get(self._path_key(self.current_image_path))
+        idx = self.image_index_map.get(self._current_path_key())
         if idx is None:
             return None
         images = self.json_data.get("images", [])
@@ -404,7 +506,7 @@ class AnnotationGUI(tk.Tk):
         record["app_version"] = self._get_app_version()
         record["protocol_version"] = self._get_protocol_version()
 
-        key = self._path_key(self.current_image_path)
+        key = self._current_path_key()
         record["resolved_image_path"] = key
         self.annotations[key] = self._parse_annotations_for_record(record)
 
@@ -466,7 +568,7 @@ class AnnotationGUI(tk.Tk):
             return
 
         allowed = self._get_allowed_landmarks_for_current_view()
-        key = self._path_key(self.current_image_path)
+        key = self._current_path_key()
         pts = self.annotations.setdefault(key, {})
         meta = self.landmark_meta.setdefault(key, {})
         radii = getattr(self, "hover_radii", {}).get(key, {})
@@ -628,7 +730,7 @@ class AnnotationGUI(tk.Tk):
 
             tmp_path = self.json_path.with_suffix(self.json_path.suffix + ".tmp")
             with tmp_path.open("w", encoding="utf-8") as handle:
-                json.dump(save_data, handle, indent=2)
+                handle.write(self._format_annotation_json(save_data))
             tmp_path.replace(self.json_path)
 
             self._refresh_saved_snapshot_for_current_image()
@@ -643,6 +745,24 @@ class AnnotationGUI(tk.Tk):
             messagebox.showerror("Save Error", f"Failed to save JSON:\n{e}")
             return False
 
+    @staticmethod
+    def _format_annotation_json(save_data: Dict[str, Any]) -> str:
+        """Serialize the annotation document with one image record per line.
+
+        json.dump with indent= runs the pure-Python encoder over every record
+        on each autosave; encoding each value in one shot uses the C encoder
+        and keeps the file line-oriented per image.
+        """
+        parts = []
+        for key, value in save_data.items():
+            if key == "images":
+                rows = ",\n".join("    " + json.dumps(rec) for rec in value)
+                body = f"[\n{rows}\n  ]" if rows else "[]"
+            else:
+                body = json.dumps(value)
+            parts.append(f"  {json.dumps(key)}: {body}")
+        return "{\n" + ",\n".join(parts) + "\n}\n"
+
     def _parse_annotations_for_record(self, record: Dict) -> Dict[str, AnnotationValue]:
         pts: Dict[str, AnnotationValue] = {}
         annotations = record.get("annotations", {}) or {}
@@ -706,7 +826,7 @@ class AnnotationGUI(tk.Tk):
                     }
 
         if self.current_image_path is not None:
-            key = self._path_key(self.current_image_path)
+            key = self._current_path_key()
             self.lm_settings[key] = per_img_settings
             self.landmark_meta[key] = per_img_meta
             getattr(self, "hover_radii", {})[key] = per_img_radius
@@ -735,7 +855,6 @@ class AnnotationGUI(tk.Tk):
         listbox = tk.Listbox(
             list_frame,
             yscrollcommand=scrollbar.set,
-            font=self.dialogue_font,
             selectmode="single",
             height=15,
             width=65,  # chars
@@ -869,6 +988,7 @@ class AnnotationGUI(tk.Tk):
             "images": [],
         }
         self.landmarks = list(landmarks)
+        self._refresh_landmark_lookup()
         self._check_landmark_display_order()
         self.images = []
         self.image_index_map = {}
@@ -928,6 +1048,9 @@ class AnnotationGUI(tk.Tk):
 
         if not self.images:
             self.current_image = None
+            self._gray_cache = None
+            self._barrier_cache = None
+            self._preview_np = None
             self.current_image_path = None
             self.absolute_current_image_path = None
             self.current_image_index = -1
@@ -936,6 +1059,9 @@ class AnnotationGUI(tk.Tk):
             self.quality_var.set("0")
             self.current_view_var.set("")
             self.canvas.delete("all")
+            self.base_img_item = None
+            self._point_items.clear()
+            self._point_item_state.clear()
             self._render_black_zoom_view()
             self.dirty = False
             self._refresh_image_listbox()
@@ -1207,14 +1333,12 @@ class AnnotationGUI(tk.Tk):
             label="Zoom (x)",
             variable=self.zoom_percent,
             command=self._on_zoom_change,
-            font=self.dialogue_font,
         ).pack(fill="x", padx=6, pady=(6, 6))
         tk.Checkbutton(
             zoom_wrap,
             text="Show Selected Landmark",
             variable=self.show_selected_landmark_in_zoom,
             command=self._refresh_zoom_landmark_overlay,
-            font=self.dialogue_font,
         ).pack(anchor="w", padx=6, pady=(0, 6))
         tk.Checkbutton(
             zoom_wrap,
@@ -1224,7 +1348,6 @@ class AnnotationGUI(tk.Tk):
                 self.last_mouse_canvas_pos[0] if self.last_mouse_canvas_pos else None,
                 self.last_mouse_canvas_pos[1] if self.last_mouse_canvas_pos else None,
             ),
-            font=self.dialogue_font,
         ).pack(anchor="w", padx=6, pady=(0, 6))
         tk.Checkbutton(
             zoom_wrap,
@@ -1234,7 +1357,6 @@ class AnnotationGUI(tk.Tk):
                 self.last_mouse_canvas_pos[0] if self.last_mouse_canvas_pos else None,
                 self.last_mouse_canvas_pos[1] if self.last_mouse_canvas_pos else None,
             ),
-            font=self.dialogue_font,
             takefocus=False,
         ).pack(anchor="w", padx=6, pady=(0, 6))
         tk.Checkbutton(
@@ -1245,7 +1367,6 @@ class AnnotationGUI(tk.Tk):
                 self.last_mouse_canvas_pos[0] if self.last_mouse_canvas_pos else None,
                 self.last_mouse_canvas_pos[1] if self.last_mouse_canvas_pos else None,
             ),
-            font=self.dialogue_font,
         ).pack(anchor="w", padx=6, pady=(6, 0))
         tk.Scale(
             zoom_wrap,
@@ -1258,7 +1379,6 @@ class AnnotationGUI(tk.Tk):
                 self.last_mouse_canvas_pos[0] if self.last_mouse_canvas_pos else None,
                 self.last_mouse_canvas_pos[1] if self.last_mouse_canvas_pos else None,
             ),
-            font=self.dialogue_font,
             takefocus=False,
         ).pack(fill="x", padx=6, pady=(0, 0))
         tk.Scale(
@@ -1272,7 +1392,6 @@ class AnnotationGUI(tk.Tk):
                 self.last_mouse_canvas_pos[0] if self.last_mouse_canvas_pos else None,
                 self.last_mouse_canvas_pos[1] if self.last_mouse_canvas_pos else None,
             ),
-            font=self.dialogue_font,
             takefocus=False,
         ).pack(fill="x", padx=6, pady=(0, 6))
         self.after(0, self._render_black_zoom_view)
@@ -1284,7 +1403,6 @@ class AnnotationGUI(tk.Tk):
             text="Show Hover Circle",
             variable=self.hover_enabled,
             command=self._toggle_hover,
-            font=self.dialogue_font,
         ).pack(anchor="w", padx=6, pady=(6, 0))
         self.radius_scale = tk.Scale(
             hover_wrap,
@@ -1294,7 +1412,6 @@ class AnnotationGUI(tk.Tk):
             label="Hover Radius",
             variable=self.hover_radius,
             command=self._on_radius_change,
-            font=self.dialogue_font,
         )
         self.radius_scale.config(state="disabled")
         self.radius_scale.pack(fill="x", padx=6, pady=6)
@@ -1307,7 +1424,6 @@ class AnnotationGUI(tk.Tk):
             text="Show Femoral Axis",
             variable=self.femoral_axis_enabled,
             command=self._toggle_femoral_axis,
-            font=self.dialogue_font,
         ).pack(anchor="w", padx=6, pady=(6, 0))
 
         self.femoral_axis_count_scale = tk.Scale(
@@ -1318,7 +1434,6 @@ class AnnotationGUI(tk.Tk):
             label="Num whiskers/Orthogonal Projections",
             variable=self.femoral_axis_count,
             command=self._on_femoral_axis_count_change,
-            font=self.dialogue_font,
         )
         self.femoral_axis_count_scale.config(state="disabled")
         self.femoral_axis_count_scale.pack(fill="x", padx=6, pady=(6, 2))
@@ -1331,7 +1446,6 @@ class AnnotationGUI(tk.Tk):
             label="Whisker Tip Length",
             variable=self.femoral_axis_whisker_tip_length,
             command=self._on_femoral_axis_whisker_tip_length_change,
-            font=self.dialogue_font,
         )
         self.femoral_axis_whisker_tip_length_scale.config(state="disabled")
         self.femoral_axis_whisker_tip_length_scale.pack(fill="x", padx=6, pady=(0, 6))
@@ -1344,7 +1458,6 @@ class AnnotationGUI(tk.Tk):
             text="Show Extended Crosshair",
             variable=self.extended_crosshair_enabled,
             command=self._toggle_extended_crosshair,
-            font=self.dialogue_font,
         ).pack(anchor="w", padx=6, pady=(6, 0))
 
         self.crosshair_length_scale = tk.Scale(
@@ -1355,7 +1468,6 @@ class AnnotationGUI(tk.Tk):
             label="Crosshair Length",
             variable=self.extended_crosshair_length,
             command=self._on_extended_crosshair_length_change,
-            font=self.dialogue_font,
         )
         self.crosshair_length_scale.config(state="disabled")
         self.crosshair_length_scale.pack(fill="x", padx=6, pady=6)
@@ -1363,7 +1475,6 @@ class AnnotationGUI(tk.Tk):
         tk.Label(
             left_tools,
             text=f"App: v{self._get_app_version()}\nProtocol: v{self._get_protocol_version()}\nNOT FDA APPROVED",
-            font=self.dialogue_font,
             fg="grey50",
             anchor="w",
             justify="left",
@@ -1413,7 +1524,6 @@ class AnnotationGUI(tk.Tk):
         self._dl_status_label = tk.Label(
             dl_frame,
             textvariable=self._dl_status_var,
-            font=self.dialogue_font,
             fg="grey40",
             anchor="w",
             wraplength=max(1, self._panel_width - 30),
@@ -1464,7 +1574,6 @@ class AnnotationGUI(tk.Tk):
             ctrl,
             text="Autosave",
             variable=self.autosave_var,
-            font=self.dialogue_font,
         )
         self.autosave_check.pack(anchor="w", pady=(0, 6))
 
@@ -1482,7 +1591,6 @@ class AnnotationGUI(tk.Tk):
             text="Image Flag",
             variable=self.image_flag_var,
             command=self._on_image_flag_widget_changed,
-            font=self.dialogue_font,
             fg="black",
             activeforeground="black",
             disabledforeground="black",
@@ -1490,9 +1598,7 @@ class AnnotationGUI(tk.Tk):
         )
         self.image_flag_check.pack(side="left", padx=(0, 12))
 
-        tk.Label(row_meta, text="Dir:", font=self.dialogue_font).pack(
-            side="left", padx=(0, 2)
-        )
+        tk.Label(row_meta, text="Dir:").pack(side="left", padx=(0, 2))
         self.direction_dropdown = ttk.Combobox(
             row_meta,
             textvariable=self.image_direction_var,
@@ -1510,7 +1616,7 @@ class AnnotationGUI(tk.Tk):
         row_meta2 = ttk.Frame(img_frame)
         row_meta2.pack(fill="x", padx=6, pady=(0, 6))
 
-        tk.Label(row_meta2, text="View:", font=self.dialogue_font).pack(side="left")
+        tk.Label(row_meta2, text="View:").pack(side="left")
         self.view_dropdown = ttk.Combobox(
             row_meta2,
             textvariable=self.current_view_var,
@@ -1621,57 +1727,64 @@ class AnnotationGUI(tk.Tk):
                 lm_heading_row,
                 text="?",
                 command=self._open_landmark_reference,
-                font=self.dialogue_font,
                 width=2,
                 padx=0,
                 pady=0,
             ).pack(side="left", padx=(4, 0))
-        lp_header = tk.Frame(ctrl)
-        lp_header.pack(fill="x", padx=2)
-        lp_header.grid_columnconfigure(0, minsize=55)
-        lp_header.grid_columnconfigure(1, minsize=140)
-        lp_header.grid_columnconfigure(2, minsize=80)
-        lp_header.grid_columnconfigure(3, minsize=60)
-        tk.Label(lp_header, text="View", anchor="w", font=self.heading_font).grid(
-            row=0, column=0, sticky="w", padx=(2, 4)
-        )
-        tk.Label(lp_header, text="Name", anchor="w", font=self.heading_font).grid(
-            row=0, column=1, sticky="w", padx=(2, 4)
-        )
-        tk.Label(lp_header, text="Ann.", anchor="w", font=self.heading_font).grid(
-            row=0, column=2, sticky="w", padx=(2, 4)
-        )
-        tk.Label(lp_header, text="Flag", anchor="w", font=self.heading_font).grid(
-            row=0, column=3, sticky="w", padx=(2, 4)
-        )
         self._landmark_panel_container = tk.Frame(
             ctrl, bd=1, relief="sunken", width=self._panel_width, height=CANVAS_HEIGHT
         )
         self._landmark_panel_container.pack(fill="x", pady=(0, 0))
         self._landmark_panel_container.pack_propagate(False)
 
-        self.lp_canvas = tk.Canvas(
+        # One Treeview row per landmark: View / Name / Annotated / Flag
+        style = ttk.Style(self)
+        style.configure(
+            "Landmark.Treeview",
+            font=self.dialogue_font,
+            rowheight=self.dialogue_font.metrics("linespace") + 6,
+        )
+        style.configure("Landmark.Treeview.Heading", font=self.heading_font)
+        self.landmark_tree = ttk.Treeview(
             self._landmark_panel_container,
-            height=CANVAS_HEIGHT,
-            width=self._panel_width - self._scrollbar_width,
-            highlightthickness=0,
+            columns=("view", "name", "annotated", "flag"),
+            show="headings",
+            selectmode="browse",
+            style="Landmark.Treeview",
+        )
+        for col, text, width, anchor in (
+            ("view", "View", 55, "center"),
+            ("name", "Name", 140, "w"),
+            ("annotated", "Ann.", 80, "center"),
+            ("flag", "Flag", 60, "center"),
+        ):
+            self.landmark_tree.heading(col, text=text, anchor=anchor)
+            self.landmark_tree.column(
+                col, width=width, minwidth=width, anchor=anchor, stretch=col == "name"
+            )
+        self.landmark_tree.tag_configure("found", foreground="green")
+        self.landmark_tree.tag_configure("flagged", foreground="red")
+        # Skip the Treeview class bindings: clicks are handled per column below,
+        # and arrow keys must keep going to the window-level landmark shortcuts
+        self.landmark_tree.bindtags((str(self.landmark_tree), str(self), "all"))
+        self.landmark_tree.bind("<Button-1>", self._on_landmark_tree_click)
+        self.landmark_tree.bind(
+            "<Button-4>", lambda _e: self.landmark_tree.yview_scroll(-1, "units")
+        )
+        self.landmark_tree.bind(
+            "<Button-5>", lambda _e: self.landmark_tree.yview_scroll(1, "units")
         )
-        self.lp_canvas.pack(side=tk.LEFT, fill="both")
+        self.landmark_tree.bind("<Enter>", lambda e: self._bind_landmark_scroll(True))
+        self.landmark_tree.bind("<Leave>", lambda e: self._bind_landmark_scroll(False))
+        self.landmark_tree.pack(side=tk.LEFT, fill="both", expand=True)
         self.lp_scrollbar = tk.Scrollbar(
             self._landmark_panel_container,
             orient="vertical",
-            command=self.lp_canvas.yview,
+            command=self.landmark_tree.yview,
         )
         self.lp_scrollbar.pack(side=tk.RIGHT, fill="y")
-        self.lp_canvas.configure(yscrollcommand=self.lp_scrollbar.set)
-        self.lp_inner = tk.Frame(self.lp_canvas)
-        self.lp_canvas.create_window((0, 0), window=self.lp_inner, anchor="nw")
-        self.lp_inner.bind(
-            "<Configure>",
-            lambda e: self.lp_canvas.configure(scrollregion=self.lp_canvas.bbox("all")),
-        )
-        self.lp_inner.bind("<Enter>", lambda e: self._bind_landmark_scroll(True))
-        self.lp_inner.bind("<Leave>", lambda e: self._bind_landmark_scroll(False))
+        self.landmark_tree.configure(yscrollcommand=self.lp_scrollbar.set)
+        self.selected_landmark.trace_add("write", self._sync_landmark_tree_selection)
         ttk.Separator(ctrl, orient="horizontal").pack(fill="x", pady=(6, 6))
         buttons_row = tk.Frame(ctrl)
         buttons_row.pack(fill="x", pady=(0, 6))
@@ -1679,13 +1792,11 @@ class AnnotationGUI(tk.Tk):
             buttons_row,
             text="View All",
             command=lambda: self._set_all_visibility(True),
-            font=self.dialogue_font,
         ).pack(side="left", expand=True, fill="x", padx=(0, 4))
         tk.Button(
             buttons_row,
             text="View None",
             command=lambda: self._set_all_visibility(False),
-            font=self.dialogue_font,
         ).pack(side="left", expand=True, fill="x")
 
         note_wrap = ttk.LabelFrame(ctrl, text="Landmark Note")
@@ -1695,7 +1806,6 @@ class AnnotationGUI(tk.Tk):
             note_wrap,
             height=8,
             wrap="word",
-            font=self.dialogue_font,
         )
         self.note_text.pack(fill="x", padx=6, pady=6)
         self.note_text.bind("<<Modified>>", self._on_note_text_modified)
@@ -1780,8 +1890,9 @@ class AnnotationGUI(tk.Tk):
         # Try known column names in order of preference
         candidates = ["image_path", "Dataset", "dataset", "path", "file", "filename"]
 
+        columns = set(df.columns)
         for col in candidates:
-            if col in df.columns:
+            if col in columns:
                 return col
 
         # Fallback: use first column if none match
@@ -1841,7 +1952,20 @@ class AnnotationGUI(tk.Tk):
 
         size = self._get_zoom_canvas_size()
         black_img = Image.new("RGB", (size, size), "black")
-        self.zoom_img_obj = ImageTk.PhotoImage(black_img)
+        self._show_zoom_image(black_img)
+
+        self.zoom_src_rect = None
+        self._update_zoom_crosshair()
+        self._clear_zoom_landmark_overlay()
+
+    # Shows img in the zoom canvas, reusing the Tk photo when mode/size match.
+    def _show_zoom_image(self, img: Image.Image) -> None:
+        key = (img.mode, img.size)
+        if self.zoom_img_obj is not None and self._zoom_img_key == key:
+            self.zoom_img_obj.paste(img)
+        else:
+            self.zoom_img_obj = ImageTk.PhotoImage(img)
+            self._zoom_img_key = key
 
         if self.zoom_base_item is None:
             self.zoom_base_item = self.zoom_canvas.create_image(
@@ -1851,10 +1975,6 @@ class AnnotationGUI(tk.Tk):
             self.zoom_canvas.itemconfigure(self.zoom_base_item, image=self.zoom_img_obj)
             self.zoom_canvas.coords(self.zoom_base_item, 0, 0)
 
-        self.zoom_src_rect = None
-        self._update_zoom_crosshair()
-        self._clear_zoom_landmark_overlay()
-
     def _scale2x_numpy(self, img_array):
         """
         Scale2x (EPX) algorithm using vectorized NumPy.
@@ -1911,6 +2031,8 @@ class AnnotationGUI(tk.Tk):
     def _update_zoom_view(
         self, mouse_x: Optional[float] = None, mouse_y: Optional[float] = None
     ) -> None:
+        import cv2
+
         if self.zoom_canvas is None:
             return
 
@@ -1956,8 +2078,12 @@ class AnnotationGUI(tk.Tk):
             patch_np = self._scale2x_numpy(patch_np)
             patch_np = self._scale2x_numpy(patch_np)
 
-            out = Image.fromarray(patch_np)
-            out = out.resize((size, size), Image.Resampling.NEAREST)
+            # INTER_NEAREST_EXACT samples the same pixels as PIL's NEAREST
+            out = Image.fromarray(
+                cv2.resize(
+                    patch_np, (size, size), interpolation=cv2.INTER_NEAREST_EXACT
+                )
+            )
         else:
             try:
                 out = self.current_image.transform(
@@ -1978,8 +2104,7 @@ class AnnotationGUI(tk.Tk):
         if self.enable_zoom_contrast.get():
             out_gray = out.convert("L")
             img_np = np.array(out_gray)
-            clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-            img_np = clahe.apply(img_np)
+            img_np = self._get_clahe().apply(img_np)
             out = Image.fromarray(img_np)
 
         if self.enable_zoom_percentile_stretch.get():
@@ -1994,15 +2119,7 @@ class AnnotationGUI(tk.Tk):
             img_np = self._percentile_contrast_stretch(img_np, low, high)
             out = Image.fromarray(img_np)
 
-        self.zoom_img_obj = ImageTk.PhotoImage(out)
-
-        if self.zoom_base_item is None:
-            self.zoom_base_item = self.zoom_canvas.create_image(
-                0, 0, anchor="nw", image=self.zoom_img_obj
-            )
-        else:
-            self.zoom_canvas.itemconfigure(self.zoom_base_item, image=self.zoom_img_obj)
-            self.zoom_canvas.coords(self.zoom_base_item, 0, 0)
+        self._show_zoom_image(out)
 
         self._update_zoom_crosshair()
         self._refresh_zoom_landmark_overlay()
@@ -2340,11 +2457,11 @@ class AnnotationGUI(tk.Tk):
         return out[:2]
 
     def _set_line_points(self, lm: str, pts_list: List[Tuple[float, float]]) -> None:
-        self.annotations.setdefault(str(self.current_image_path), {})[lm] = [
+        self.annotations.setdefault(self._cur_key, {})[lm] = [
             (float(x), float(y)) for x, y in pts_list[:2]
         ]
         if lm in self.landmark_found:
-            self.landmark_found[lm].set(len(pts_list) > 0)
+            self.landmark_found[lm] = len(pts_list) > 0
 
     def _clamp_img_point(self, xi: float, yi: float) -> Tuple[float, float]:
         if not self.current_image:
@@ -2574,9 +2691,9 @@ class AnnotationGUI(tk.Tk):
             overlay_ids.extend([circle_id, hline_id, vline_id])
             if lm in self.HOVER_CIRCLE_LANDMARKS and abs(self.disp_scale) > 1e-12:
                 key = (
-                    self._path_key(self.current_image_path)
+                    self._current_path_key()
                     if self.json_path is not None
-                    else str(self.current_image_path)
+                    else self._cur_key
                 )
                 saved_radius = getattr(self, "hover_radii", {}).get(key, {}).get(lm)
                 if saved_radius is not None:
@@ -2616,26 +2733,16 @@ class AnnotationGUI(tk.Tk):
     # Builds the landmark selection table with visibility and status controls.
 
     def _build_landmark_panel(self) -> None:
-        for w in self.lp_inner.winfo_children():
-            w.destroy()
+        tree = self.landmark_tree
+        tree.delete(*tree.get_children())
         self.landmark_visibility.clear()
         self.landmark_found.clear()
         self.landmark_flagged.clear()
-        self.landmark_radio_widgets = {}
-        self.landmark_found_widgets = {}
-        self.landmark_flag_widgets = {}
-
-        self.landmark_table = tk.Frame(self.lp_inner)
-        self.landmark_table.pack(fill="x", padx=2, pady=2)
-        self.landmark_table.grid_columnconfigure(0, minsize=55)
-        self.landmark_table.grid_columnconfigure(1, minsize=140)
-        self.landmark_table.grid_columnconfigure(2, minsize=80)
-        self.landmark_table.grid_columnconfigure(3, minsize=60)
 
         key = (
-            self._path_key(self.current_image_path)
+            self._current_path_key()
             if self.json_path is not None and self.current_image_path is not None
-            else str(self.current_image_path)
+            else self._cur_key
         )
         meta = self.landmark_meta.get(key, {})
 
@@ -2643,56 +2750,15 @@ class AnnotationGUI(tk.Tk):
         visible_landmarks = self._display_ordered(
             [lm for lm in getattr(self, "landmarks", []) if lm in allowed]
         )
+        self._panel_landmarks = visible_landmarks
+        self._lm_idx = {lm: i for i, lm in enumerate(visible_landmarks)}
 
-        for i, lm in enumerate(visible_landmarks, start=0):
-            vis_var = tk.BooleanVar(value=True)
-            found_var = tk.BooleanVar(value=False)
-            flag_var = tk.BooleanVar(value=bool(meta.get(lm, {}).get("flag", False)))
-            self.landmark_visibility[lm] = vis_var
-            self.landmark_found[lm] = found_var
-            self.landmark_flagged[lm] = flag_var
-            tk.Checkbutton(
-                self.landmark_table,
-                variable=vis_var,
-                command=self._draw_points,
-                font=self.dialogue_font,
-            ).grid(row=i, column=0, sticky="w", padx=(2, 4), pady=1)
-            rb = tk.Radiobutton(
-                self.landmark_table,
-                text=lm,
-                variable=self.selected_landmark,
-                value=lm,
-                anchor="w",
-                justify="left",
-                command=self._on_landmark_selected,
-                font=self.dialogue_font,
-            )
-            rb.grid(row=i, column=1, sticky="w", padx=(2, 4), pady=1)
-            self.landmark_radio_widgets[lm] = rb
-
-            found_cb = tk.Checkbutton(
-                self.landmark_table,
-                text="",
-                variable=found_var,
-                font=self.dialogue_font,
-                indicatoron=True,
-                takefocus=0,
-                command=lambda lm=lm: self._on_annotated_checkbox_toggled(lm),
-            )
-            found_cb.grid(row=i, column=2, sticky="w", padx=(2, 4), pady=1)
-            self.landmark_found_widgets[lm] = found_cb
-
-            flag_cb = tk.Checkbutton(
-                self.landmark_table,
-                text="",
-                variable=flag_var,
-                font=self.dialogue_font,
-                indicatoron=True,
-                takefocus=0,
-                command=lambda lm=lm: self._on_flag_checkbox_toggled(lm),
-            )
-            flag_cb.grid(row=i, column=3, sticky="w", padx=(2, 4), pady=1)
-            self.landmark_flag_widgets[lm] = flag_cb
+        for lm in visible_landmarks:
+            self.landmark_visibility[lm] = True
+            self.landmark_found[lm] = False
+            self.landmark_flagged[lm] = bool(meta.get(lm, {}).get("flag", False))
+            tree.insert("", "end", iid=lm)
+            self._refresh_landmark_row(lm)
 
         if visible_landmarks and not self.selected_landmark.get():
             self.selected_landmark.set(visible_landmarks[0])
@@ -2702,8 +2768,77 @@ class AnnotationGUI(tk.Tk):
         self._load_note_for_selected_landmark()
         self._bind_landmark_scroll(True)
 
+    @staticmethod
+    def _checkbox_glyph(value: bool) -> str:
+        return "\u2611" if value else "\u2610"
+
+    # Redraws one landmark row from its visibility/found/flag state.
+    def _refresh_landmark_row(self, lm: str) -> None:
+        tree = self.landmark_tree
+        if tree is None or not tree.exists(lm):
+            return
+        is_visible = self.landmark_visibility.get(lm, True)
+        is_found = self.landmark_found.get(lm, False)
+        is_flagged = self.landmark_flagged.get(lm, False)
+        if is_flagged:
+            tags: Tuple[str, ...] = ("flagged",)
+        elif is_found:
+            tags = ("found",)
+        else:
+            tags = ()
+        tree.item(
+            lm,
+            values=(
+                self._checkbox_glyph(is_visible),
+                lm,
+                self._checkbox_glyph(is_found),
+                self._checkbox_glyph(is_flagged),
+            ),
+            tags=tags,
+        )
+
+    # Dispatches a click on the landmark table to the column that was hit.
+    def _on_landmark_tree_click(self, event) -> str:
+        tree = self.landmark_tree
+        if tree is None or tree.identify_region(event.x, event.y) != "cell":
+            return "break"
+        lm = tree.identify_row(event.y)
+        if not lm:
+            return "break"
+        column = tree.identify_column(event.x)
+
+        if column == "#1":
+            self.landmark_visibility[lm] = not self.landmark_visibility[lm]
+            self._refresh_landmark_row(lm)
+            self._draw_points()
+        elif column == "#3":
+            self.landmark_found[lm] = not self.landmark_found[lm]
+            self._on_annotated_checkbox_toggled(lm)
+            self._refresh_landmark_row(lm)
+        elif column == "#4":
+            self.landmark_flagged[lm] = not self.landmark_flagged[lm]
+            self._on_flag_checkbox_toggled(lm)
+            self._refresh_landmark_row(lm)
+        elif lm != self.selected_landmark.get():
+            self.selected_landmark.set(lm)
+            self._on_landmark_selected()
+        return "break"
+
+    # Mirrors selected_landmark into the landmark table's row selection.
+    def _sync_landmark_tree_selection(self, *_args) -> None:
+        tree = self.landmark_tree
+        if tree is None:
+            return
+        lm = self.selected_landmark.get()
+        if lm and tree.exists(lm):
+            tree.selection_set(lm)
+        else:
+            tree.selection_remove(*tree.selection())
+
     # (4) Render base image (add to class)
     def _render_base_image(self) -> None:
+        import cv2
+
         if not self.current_image:
             return
 
@@ -2711,8 +2846,41 @@ class AnnotationGUI(tk.Tk):
         disp_w, disp_h = self.disp_size
         off_x, off_y = self.disp_off
 
-        resized = self.current_image.resize((disp_w, disp_h), Image.Resampling.LANCZOS)
-        self.img_obj = ImageTk.PhotoImage(resized)
+        if (
+            self.disp_size == self._last_disp_size
+            and self.img_obj is not None
+            and self.base_img_item is not None
+        ):
+            self.canvas.coords(self.base_img_item, off_x, off_y)
+            return
+
+        cache_key = (str(self.absolute_current_image_path), disp_w, disp_h)
+        resized = self._resized_image_cache.get(cache_key)
+        if resized is None:
+            source = (
+                self._preview_np
+                if self._preview_np is not None
+                else np.asarray(self.current_image)
+            )
+            # INTER_AREA for the usual downscale; LANCZOS4 when upscaling
+            interp = cv2.INTER_AREA if disp_w < source.shape[1] else cv2.INTER_LANCZOS4
+            resized = Image.fromarray(
+                cv2.resize(source, (disp_w, disp_h), interpolation=interp)
+            )
+            self._resized_image_cache[cache_key] = resized
+            if len(self._resized_image_cache) > self.RESIZED_IMAGE_CACHE_SIZE:
+                oldest = next(iter(self._resized_image_cache))
+                del self._resized_image_cache[oldest]
+        self._last_disp_size = self.disp_size
+        if (
+            self.img_obj is not None
+            and self.img_obj.width() == disp_w
+            and self.img_obj.height() == disp_h
+        ):
+            # Same size: blit into the existing Tk image instead of allocating
+            self.img_obj.paste(resized)
+        else:
+            self.img_obj = ImageTk.PhotoImage(resized)
 
         if self.base_img_item is None:
             self.base_img_item = self.canvas.create_image(
@@ -2722,7 +2890,42 @@ class AnnotationGUI(tk.Tk):
             self.canvas.itemconfigure(self.base_img_item, image=self.img_obj)
             self.canvas.coords(self.base_img_item, off_x, off_y)
 
+    @staticmethod
+    def _normalize_16bit(arr: np.ndarray) -> np.ndarray:
+        """Stretch a uint16 image between its 1st and 99th percentiles to uint8.
+
+        Percentiles come from a 65536-bin histogram and the stretch is a
+        single lookup-table gather, so no sort or float image is needed.
+        """
+        import cv2
+
+        hist = cv2.calcHist([arr], [0], None, [65536], [0, 65536]).ravel()
+        cdf = np.cumsum(hist)
+        lo = int(np.searchsorted(cdf, 0.01 * arr.size))
+        hi = int(np.searchsorted(cdf, 0.99 * arr.size))
+        hi = max(hi, lo + 1)
+
+        lut = np.clip((np.arange(65536) - lo) / (hi - lo) * 255, 0, 255)
+        return lut.astype(np.uint8)[arr]
+
+    def _build_preview_image(self, img: Image.Image) -> Image.Image:
+        """Box-reduce img so the LANCZOS preview resize starts from at most
+        about twice the screen resolution. current_image stays full-size."""
+        max_dim = 2 * max(self.winfo_screenwidth(), self.winfo_screenheight())
+        factor = max(img.size) // max(1, max_dim)
+        if factor < 2:
+            return img
+        return img.reduce(factor)
+
     def _on_canvas_resize(self, _event=None) -> None:
+        if self._resize_after_id is not None:
+            self.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.after(
+            self.RESIZE_DEBOUNCE_MS, self._apply_canvas_resize
+        )
+
+    def _apply_canvas_resize(self) -> None:
+        self._resize_after_id = None
         if not self.current_image:
             self._clear_line_preview()
             self._update_zoom_view(None, None)
@@ -2781,9 +2984,6 @@ class AnnotationGUI(tk.Tk):
         self._image_container.config(width=new_w)
         self._landmark_panel_container.config(width=new_w)
 
-        # Update landmark canvas
-        self.lp_canvas.config(width=new_w - self._scrollbar_width)
-
         # Update status label wraplength
         if hasattr(self, "_dl_status_label"):
             self._dl_status_label.config(wraplength=max(1, new_w - 30))
@@ -2813,9 +3013,9 @@ class AnnotationGUI(tk.Tk):
     # Enables or disables mousewheel scrolling for the landmark list.
     def _bind_landmark_scroll(self, bind: bool) -> None:
         if bind:
-            self.lp_canvas.bind_all("<MouseWheel>", self._landmark_mousewheel)
+            self.landmark_tree.bind_all("<MouseWheel>", self._landmark_mousewheel)
         else:
-            self.lp_canvas.unbind_all("<MouseWheel>")
+            self.landmark_tree.unbind_all("<MouseWheel>")
 
     def _bind_image_list_scroll(self, bind: bool) -> None:
         if self.image_tree is None:
@@ -2863,31 +3063,12 @@ class AnnotationGUI(tk.Tk):
     # Scrolls the landmark list in response to mouse wheel events.
     def _landmark_mousewheel(self, event) -> None:
         delta = -1 if event.delta > 0 else 1
-        self.lp_canvas.yview_scroll(delta, "units")
+        self.landmark_tree.yview_scroll(delta, "units")
 
     def _scroll_landmark_into_view(self, lm: str) -> None:
-        rb = getattr(self, "landmark_radio_widgets", {}).get(lm)
-        if rb is None:
-            return
-        self.lp_canvas.update_idletasks()
-        bbox = self.lp_canvas.bbox("all")
-        if not bbox:
-            return
-        y1, y2 = bbox[1], bbox[3]
-        total = max(1, y2 - y1)
-        canvas_h = self.lp_canvas.winfo_height()
-        vis_top = self.lp_canvas.canvasy(0)
-        vis_bottom = vis_top + canvas_h
-        item_top = self._widget_y_in_inner(rb)
-        item_bottom = item_top + rb.winfo_height()
-        pad = 6
-        if item_top < vis_top:
-            new_top = max(y1, item_top - pad)
-            self.lp_canvas.yview_moveto((new_top - y1) / total)
-        elif item_bottom > vis_bottom:
-            new_top = min(item_bottom + pad - canvas_h, y2 - canvas_h)
-            new_top = max(y1, new_top)
-            self.lp_canvas.yview_moveto((new_top - y1) / total)
+        tree = self.landmark_tree
+        if tree is not None and lm and tree.exists(lm):
+            tree.see(lm)
 
     # Applies stored per-landmark settings when a landmark is selected.
     def _on_landmark_selected(self) -> None:
@@ -2895,7 +3076,7 @@ class AnnotationGUI(tk.Tk):
         self._apply_settings_to_ui_for(lm)
         self._sync_auto_tools_for_selected_landmark()
         self._load_note_for_selected_landmark()
-        self._draw_points()
+        self._request_draw()
         self._refresh_zoom_landmark_overlay()
         if self.last_mouse_canvas_pos is not None:
             self._update_line_preview(*self.last_mouse_canvas_pos)
@@ -2910,11 +3091,7 @@ class AnnotationGUI(tk.Tk):
         if self.current_image_path is None:
             return {"flag": False, "note": ""}
 
-        key = (
-            self._path_key(self.current_image_path)
-            if self.json_path is not None
-            else str(self.current_image_path)
-        )
+        key = self._current_path_key() if self.json_path is not None else self._cur_key
         per_img = self.landmark_meta.setdefault(key, {})
         return per_img.setdefault(lm, {"flag": False, "note": ""})
 
@@ -2936,8 +3113,7 @@ class AnnotationGUI(tk.Tk):
         if self.current_image_path is None:
             return
 
-        flag_var = self.landmark_flagged.get(lm)
-        is_flagged = flag_var.get() if flag_var is not None else False
+        is_flagged = self.landmark_flagged.get(lm, False)
         self._set_landmark_flag(lm, is_flagged)
 
         if not is_flagged:
@@ -2958,12 +3134,11 @@ class AnnotationGUI(tk.Tk):
             return
 
         pts, _quality = self._get_annotations()
-        found_var = self.landmark_found.get(lm)
-        is_checked = found_var.get() if found_var is not None else False
+        is_checked = self.landmark_found.get(lm, False)
 
         if not is_checked:
             if lm not in pts:
-                self.landmark_found[lm].set(False)
+                self.landmark_found[lm] = False
                 self._update_found_checks(pts)
                 return
 
@@ -2974,15 +3149,15 @@ class AnnotationGUI(tk.Tk):
             )
 
             if not confirmed:
-                self.landmark_found[lm].set(True)
+                self.landmark_found[lm] = True
                 self._update_found_checks(pts)
                 return
 
             del pts[lm]
             key = (
-                self._path_key(self.current_image_path)
+                self._current_path_key()
                 if self.json_path is not None
-                else str(self.current_image_path)
+                else self._cur_key
             )
             if key in self.landmark_meta:
                 self.landmark_meta[key].pop(lm, None)
@@ -2994,8 +3169,8 @@ class AnnotationGUI(tk.Tk):
 
             if lm in ("LOB", "ROB"):
                 self.last_seed.pop(lm, None)
-                if str(self.current_image_path) in self.seg_masks:
-                    self.seg_masks[str(self.current_image_path)].pop(lm, None)
+                if self._cur_key in self.seg_masks:
+                    self.seg_masks[self._cur_key].pop(lm, None)
                 self._remove_overlay_for(lm)
 
             self._clear_femoral_axis_overlay()
@@ -3008,7 +3183,7 @@ class AnnotationGUI(tk.Tk):
             return
 
         if lm not in pts:
-            self.landmark_found[lm].set(False)
+            self.landmark_found[lm] = False
             self._update_found_checks(pts)
 
     def _set_note_editor_enabled(self, enabled: bool) -> None:
@@ -3076,13 +3251,13 @@ class AnnotationGUI(tk.Tk):
         self.dirty = True
         self._maybe_autosave_current_image()
 
-    def _bind_shortcut(self, sequence: str, callback) -> None:
-        def wrapper(event):
-            if self._note_text_shortcuts_blocked():
-                return "break"
-            return callback(event)
-
-        self.bind(sequence, wrapper)
+    def _on_key_press(self, event):
+        handler = self._key_map.get(event.keysym)
+        if handler is None:
+            return None
+        if self._note_text_shortcuts_blocked():
+            return "break"
+        return handler(event)
 
     def _note_text_shortcuts_blocked(self) -> bool:
         if self.note_text is None:
@@ -3158,15 +3333,9 @@ class AnnotationGUI(tk.Tk):
         if not self.landmarks:
             return
         current = self.selected_landmark.get()
-        allowed_set = self._get_allowed_landmarks_for_current_view()
-        allowed = self._display_ordered(
-            [lm for lm in self.landmarks if lm in allowed_set]
-        )
-        if current in allowed:
-            idx = allowed.index(current)
-        else:
-            idx = 0
-        idx = idx + step
+        # Same ordering the panel was built with; avoids re-filtering per keypress
+        allowed = self._panel_landmarks
+        idx = self._lm_idx.get(current, 0) + step
         if idx < 0 or idx >= len(allowed):
             return
         new_lm = allowed[idx]
@@ -3184,9 +3353,10 @@ class AnnotationGUI(tk.Tk):
 
     # Toggles visibility for all landmarks and redraws markers.
     def _set_all_visibility(self, value: bool) -> None:
-        for var in self.landmark_visibility.values():
-            var.set(value)
-        self._draw_points()
+        for lm in self.landmark_visibility:
+            self.landmark_visibility[lm] = value
+            self._refresh_landmark_row(lm)
+        self._request_draw()
 
     def load_landmarks_from_csv(self, path: Optional[Union[Path, str]] = None) -> None:
         if path is None:
@@ -3220,18 +3390,16 @@ class AnnotationGUI(tk.Tk):
 
         self.db_path = Path(isolated_data_path / db_name)
         self._init_database()
-        df: pd.DataFrame = pd.read_csv(self.abs_csv_path)
+        # Only the header is needed here; the parsed frame stays cached for
+        # the import below
+        df: pd.DataFrame = self._read_csv_cached()
 
         self.csv_path_column = self._detect_path_column(df)
 
         # Removing columns that we know are not landmarks, the rest are assumed to be landmarks
-        df.drop(
-            columns=["image_quality", self.csv_path_column],
-            inplace=True,
-            errors="ignore",
-        )
-
-        self.landmarks = list(df.columns)
+        non_landmarks = {"image_quality", self.csv_path_column}
+        self.landmarks = [c for c in df.columns if c not in non_landmarks]
+        self._refresh_landmark_lookup()
         if self.landmarks:
             self.selected_landmark.set(self.landmarks[0])
         self._build_landmark_panel()
@@ -3283,9 +3451,39 @@ class AnnotationGUI(tk.Tk):
         except sqlite3.Error:
             return False
 
+    def _read_csv_cached(self) -> pd.DataFrame:
+        """Read abs_csv_path, reusing the parsed frame while the file is unchanged.
+
+        Returns the shared cached frame itself, not a copy: callers must not
+        mutate it (call .copy() first if they need to).
+        """
+        import pandas as pd
+
+        path = str(self.abs_csv_path)
+        st = os.stat(path)
+        stamp = (path, st.st_mtime_ns, st.st_size)
+        if self._csv_cache is None or self._csv_cache[0] != stamp:
+            self._csv_cache = (stamp, pd.read_csv(path))
+            self._csv_row_index = None
+        return self._csv_cache[1]
+
+    def _csv_row_position(
+        self, df: pd.DataFrame, col: str, key: str
+    ) -> Optional[int]:
+        """Return the first row of the cached frame whose col equals key."""
+        if self._csv_row_index is None or self._csv_row_index[0] != col:
+            positions: Dict[str, int] = {}
+            for i, value in enumerate(df[col].tolist()):
+                if isinstance(value, str):
+                    positions.setdefault(value, i)
+            self._csv_row_index = (col, positions)
+        return self._csv_row_index[1].get(key)
+
     def _import_csv_to_db(self) -> None:
+        import pandas as pd
+
         try:
-            df = pd.read_csv(self.abs_csv_path)
+            df = self._read_csv_cached()
         except Exception as e:
             messagebox.showerror(
                 "CSV Error",
@@ -3299,16 +3497,22 @@ class AnnotationGUI(tk.Tk):
             with sqlite3.connect(str(self.db_path)) as conn:
                 cursor = conn.cursor()
 
-                for _, row in df.iterrows():
-                    path = str(row[col])
+                # Walk plain tuples of just the needed columns rather than
+                # looking each landmark up by label on every row
+                lm_cols = tuple(lm for lm in self.landmarks if lm in df.columns)
+                has_quality = "image_quality" in df.columns
+                cols = [col, *(["image_quality"] if has_quality else []), *lm_cols]
+                first_lm = 2 if has_quality else 1
+                rows = []
+                for row in df[cols].itertuples(index=False, name=None):
+                    path = str(row[0])
                     try:
-                        quality = int(row.get("image_quality", 0))
+                        quality = int(row[1]) if has_quality else 0
                     except (ValueError, TypeError):
                         quality = 0
                     landmark_data = {}
 
-                    for lm in self.landmarks:
-                        val = row.get(lm, "")
+                    for lm, val in zip(lm_cols, row[first_lm:], strict=True):
                         if pd.isna(val) or not str(val).strip():
                             continue  # Skip empty values entirely
 
@@ -3322,24 +3526,28 @@ class AnnotationGUI(tk.Tk):
                             # If parsing fails, skip this landmark
                             continue
 
-                    cursor.execute(
-                        """
-                        INSERT INTO annotations (image_filename, image_path, image_quality, data)
-                        VALUES (?, ?, ?, ?)
-                        ON CONFLICT(image_filename) DO UPDATE SET
-                            image_path    = excluded.image_path,
-                            image_quality = excluded.image_quality,
-                            data          = excluded.data,
-                            modified_at   = CURRENT_TIMESTAMP,
-                            verified      = annotations.verified
-                        """,
+                    rows.append(
                         (
                             extract_filename(path),
                             path,
                             quality,
                             json.dumps(landmark_data),
-                        ),
+                        )
                     )
+
+                cursor.executemany(
+                    """
+                    INSERT INTO annotations (image_filename, image_path, image_quality, data)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(image_filename) DO UPDATE SET
+                        image_path    = excluded.image_path,
+                        image_quality = excluded.image_quality,
+                        data          = excluded.data,
+                        modified_at   = CURRENT_TIMESTAMP,
+                        verified      = annotations.verified
+                    """,
+                    rows,
+                )
                 conn.commit()
         except sqlite3.Error as e:
             messagebox.showerror(
@@ -3423,18 +3631,28 @@ class AnnotationGUI(tk.Tk):
             Path(self.absolute_current_image_path).resolve().parent
         )
         current_image_name = extract_filename(self.absolute_current_image_path)
+        self._current_dir = current_image_directory
+
+        # Re-list the directory only when its mtime changes (files added/removed)
+        mtime = current_image_directory.stat().st_mtime
+        cached = self._dir_cache.get(current_image_directory)
+        if cached is None or cached[0] != mtime:
+            # scandir entries carry their d_type, so is_file() needs no stat
+            with os.scandir(current_image_directory) as entries:
+                all_files = sorted(
+                    entry.name
+                    for entry in entries
+                    if os.path.splitext(entry.name)[1].lower()
+                    in self.possible_image_suffix
+                    and entry.is_file()
+                )
+            name_index = {name: i for i, name in enumerate(all_files)}
+            cached = (mtime, all_files, name_index)
+            self._dir_cache[current_image_directory] = cached
+        _mtime, all_files, name_index = cached
 
-        all_files = [
-            file.name
-            for file in current_image_directory.iterdir()
-            if file.suffix.lower() in self.possible_image_suffix
-        ]
-
-        all_files.sort()
-
-        try:
-            idx = all_files.index(current_image_name)
-        except ValueError:
+        idx = name_index.get(current_image_name)
+        if idx is None:
             # If current image not found, check case-insensitive match
             current_lower = current_image_name.lower()
             for i, fname in enumerate(all_files):
@@ -3509,10 +3727,9 @@ class AnnotationGUI(tk.Tk):
                     "'Load Image' to find a new image, or use 'Prev Image' to move backward",
                 )
             else:
-                self.absolute_current_image_path = Path(
-                    current_path.resolve().parent / all_files[idx + 1]
-                )
-                self.load_image_from_path(Path(self.absolute_current_image_path))
+                next_path = self._current_dir / all_files[idx + 1]
+                self.absolute_current_image_path = next_path
+                self.load_image_from_path(next_path)
 
     def _prev_image(self) -> None:
         if self.json_path is not None and self.images:
@@ -3573,10 +3790,9 @@ class AnnotationGUI(tk.Tk):
                     "You've reached the beginning of the current image directory, please use 'Load Image' to find a new image, or use 'Next Image' to move forward",
                 )
             else:
-                self.absolute_current_image_path = Path(
-                    current_path.resolve().parent / all_files[idx - 1]
-                )
-                self.load_image_from_path(Path(self.absolute_current_image_path))
+                prev_path = self._current_dir / all_files[idx - 1]
+                self.absolute_current_image_path = prev_path
+                self.load_image_from_path(prev_path)
 
     def _on_pg_down(self, event) -> None:
         self._next_image()
@@ -3628,16 +3844,16 @@ class AnnotationGUI(tk.Tk):
 
             if self.current_image.mode == "I;16":
                 arr = np.array(self.current_image, dtype=np.uint16)
-
-                lo = np.percentile(arr, 1)
-                hi = np.percentile(arr, 99)
-
-                arr = np.clip(arr, lo, hi)
-                arr = ((arr - lo) / (hi - lo) * 255).astype(np.uint8)
+                arr = self._normalize_16bit(arr)
 
                 img = Image.fromarray(arr, mode="L").convert("RGB")
                 self.current_image = img
-            self.current_image = self.current_image.convert("RGB")
+            elif self.current_image.mode != "RGB":
+                self.current_image = self.current_image.convert("RGB")
+            self._gray_cache = None
+            self._barrier_cache = None
+            preview = self._build_preview_image(self.current_image)
+            self._preview_np = np.asarray(preview)
 
         except Exception as e:
             messagebox.showerror("Load Image", f"Failed to open image:\n{e}")
@@ -3647,8 +3863,8 @@ class AnnotationGUI(tk.Tk):
         if self.view_dropdown is not None:
             self.view_dropdown["values"] = list(self.allowed_views.keys())
 
+        resolved_path = path.resolve()
         if json_record_loaded:
-            resolved_path = path.resolve()
             self.current_image_path = resolved_path
             self.absolute_current_image_path = resolved_path
             self.current_image_index = (
@@ -3675,11 +3891,11 @@ class AnnotationGUI(tk.Tk):
             self.current_image_quality = 0
             self.current_view_var.set(self._get_current_view())
         else:
-            rel_path = PurePath(path.resolve()).relative_to(
-                BASE_DIR.resolve(), walk_up=True
+            rel_path = PurePath(resolved_path).relative_to(
+                BASE_DIR_RESOLVED, walk_up=True
             )
             self.current_image_path = Path(rel_path)
-            self.absolute_current_image_path = path.resolve()
+            self.absolute_current_image_path = resolved_path
             self.current_image_flag = False
             self.image_flag_var.set(False)
             self.current_image_direction = "AP"
@@ -3690,8 +3906,10 @@ class AnnotationGUI(tk.Tk):
 
         w, h = self.current_image.size
         self.canvas.config(width=w, height=h)
-        self.canvas.delete("all")
-        self.base_img_item = None
+        # Keep the base image and point items alive; only transient items go.
+        self.canvas.delete("marker&&!point_marker")
+        self._hide_point_items()
+        self._last_disp_size = None
         self._remove_all_overlays()
         self.last_seed.clear()
         self._clear_line_preview()
@@ -3702,9 +3920,9 @@ class AnnotationGUI(tk.Tk):
         self.dragging_line_last_img_pos = None
 
         current_key = (
-            self._path_key(self.current_image_path)
+            self._current_path_key()
             if json_record_loaded and self.current_image_path is not None
-            else str(self.current_image_path)
+            else self._cur_key
         )
         self.lm_settings.setdefault(current_key, {})
         self.annotations.setdefault(current_key, {})
@@ -3714,9 +3932,8 @@ class AnnotationGUI(tk.Tk):
             self.load_points(show_message=False)
 
         self._render_base_image()
-        self.mouse_crosshair_ids = []
-        self.extended_crosshair_ids = []
-        self.zoom_extended_crosshair_ids = []
+        self._hide_mouse_crosshair()
+        self._hide_extended_crosshair()
         self._hide_hover_circle()
         self.last_mouse_canvas_pos = None
         self._update_zoom_view(None, None)
@@ -3745,9 +3962,9 @@ class AnnotationGUI(tk.Tk):
         """Prepare landmark data for JSON or legacy database storage."""
         pts, _quality = self._get_annotations()
         key = (
-            self._path_key(self.current_image_path)
+            self._current_path_key()
             if self.json_path is not None and self.current_image_path is not None
-            else str(self.current_image_path)
+            else self._cur_key
         )
         per_img_settings = self.lm_settings.get(key, {})
         per_img_meta = self.landmark_meta.get(key, {})
@@ -3836,9 +4053,7 @@ class AnnotationGUI(tk.Tk):
 
         record = self._get_current_image_record()
         state = {
-            "image_path": record.get("image_path")
-            if record
-            else str(self.current_image_path),
+            "image_path": record.get("image_path") if record else self._cur_key,
             "image_flag": bool(self.current_image_flag),
             "view": self.current_view_var.get().strip() or None,
             "annotations": self._prepare_landmark_data(for_json=True),
@@ -3848,7 +4063,7 @@ class AnnotationGUI(tk.Tk):
     def _refresh_saved_snapshot_for_current_image(self) -> None:
         if self.current_image_path is None:
             return
-        self.saved_image_snapshots[self._path_key(self.current_image_path)] = (
+        self.saved_image_snapshots[self._current_path_key()] = (
             self._canonical_image_state_for_path(self.current_image_path)
         )
 
@@ -3856,7 +4071,7 @@ class AnnotationGUI(tk.Tk):
         if self.current_image_path is None:
             return False
 
-        key = self._path_key(self.current_image_path)
+        key = self._current_path_key()
         current_state = self._current_image_state_string()
         saved_state = self.saved_image_snapshots.get(key)
         if saved_state is None:
@@ -3905,7 +4120,7 @@ class AnnotationGUI(tk.Tk):
                     """,
                     (
                         extract_filename(self.current_image_path),
-                        str(self.current_image_path),
+                        self._cur_key,
                         quality,
                         json.dumps(landmark_data),
                     ),
@@ -3958,7 +4173,7 @@ class AnnotationGUI(tk.Tk):
                     """,
                     (
                         extract_filename(self.current_image_path),
-                        str(self.current_image_path),
+                        self._cur_key,
                         quality,
                         json.dumps(landmark_data),
                     ),
@@ -4017,7 +4232,7 @@ class AnnotationGUI(tk.Tk):
         frame.pack(fill="both", expand=True)
 
         tk.Label(frame, text="Review Note:", font=self.heading_font).pack(anchor="w")
-        note_text = tk.Text(frame, height=8, font=self.dialogue_font)
+        note_text = tk.Text(frame, height=8)
         note_text.pack(fill="x", pady=(5, 10))
 
         result = {"note": "", "confirmed": False}
@@ -4038,14 +4253,12 @@ class AnnotationGUI(tk.Tk):
             btn_frame,
             text="Cancel",
             command=cancel,
-            font=self.dialogue_font,
             width=12,
         ).pack(side="right", padx=5)
         tk.Button(
             btn_frame,
             text="Submit",
             command=confirm,
-            font=self.dialogue_font,
             width=12,
         ).pack(side="right")
 
@@ -4170,14 +4383,12 @@ class AnnotationGUI(tk.Tk):
             btn_frame,
             text="Cancel",
             command=cancel,
-            font=self.dialogue_font,
             width=12,
         ).pack(side="right", padx=5)
         tk.Button(
             btn_frame,
             text="OK",
             command=confirm,
-            font=self.dialogue_font,
             width=12,
         ).pack(side="right")
 
@@ -4246,8 +4457,7 @@ class AnnotationGUI(tk.Tk):
         if self.enable_zoom_contrast.get():
             out_gray = out.convert("L")
             img_np = np.array(out_gray)
-            clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-            cl = clahe.apply(img_np)
+            cl = self._get_clahe().apply(img_np)
             out = Image.fromarray(cl)
 
         return out
@@ -4258,9 +4468,9 @@ class AnnotationGUI(tk.Tk):
         """Prepare review submission data JSON."""
         pts, quality = self._get_annotations()
         key = (
-            self._path_key(self.current_image_path)
+            self._current_path_key()
             if self.json_path is not None and self.current_image_path is not None
-            else str(self.current_image_path)
+            else self._cur_key
         )
         per_img_meta = self.landmark_meta.get(key, {})
 
@@ -4288,7 +4498,7 @@ class AnnotationGUI(tk.Tk):
             }
 
         return {
-            "image_path": str(self.current_image_path),
+            "image_path": self._cur_key,
             "image_name": PurePath(self.current_image_path).name,
             "image_flag": self.current_image_flag,
             "image_direction": self.current_image_direction,
@@ -4327,9 +4537,7 @@ class AnnotationGUI(tk.Tk):
         frame = tk.Frame(status_dialog, padx=20, pady=20)
         frame.pack(fill="both", expand=True)
 
-        status_label = tk.Label(
-            frame, text="Uploading to OneDrive...", font=self.dialogue_font
-        )
+        status_label = tk.Label(frame, text="Uploading to OneDrive...")
         status_label.pack(pady=(0, 10))
 
         progress = tk.Canvas(
@@ -4359,15 +4567,11 @@ class AnnotationGUI(tk.Tk):
                 logger.error("No Graph client available for review upload")
                 return False
 
-            loop = asyncio.SelectorEventLoop()
-
             async def do_upload():
                 base_folder = "pelvic-2d-points-backup/to_review"
+                # Path-based PUTs create the missing folders themselves
                 img_folder = f"{base_folder}/{image_name}"
 
-                # Ensure folder exists
-                await self.onedrive_backup._ensure_folder_exists(img_folder)
-
                 async def upload_file(
                     local_path: Optional[Path], remote_name: str
                 ) -> bool:
@@ -4402,9 +4606,8 @@ class AnnotationGUI(tk.Tk):
                 return success
 
             try:
-                success = loop.run_until_complete(do_upload())
+                success = self.onedrive_backup._run_coroutine(do_upload())
             finally:
-                loop.close()
                 progress.after_cancel(anim_id)
                 status_dialog.grab_release()
                 status_dialog.destroy()
@@ -4540,6 +4743,8 @@ class AnnotationGUI(tk.Tk):
 
     def _export_db_to_csv(self) -> None:
         """Export database to CSV file with atomic write (temp file + rename)."""
+        import pandas as pd
+
         current_time = datetime.now()
         # save every so often, or save when the window is being closed
         if ((current_time - self.last_update).total_seconds() > 20) or (
@@ -4612,6 +4817,9 @@ class AnnotationGUI(tk.Tk):
                 df.to_csv(str(temp_path), index=False)
                 # Atomic rename (on same filesystem)
                 temp_path.replace(csv_path)
+                # Don't trust mtime alone on coarse-timestamp filesystems
+                self._csv_cache = None
+                self._csv_row_index = None
 
                 # Backup to OneDrive after successful local save
                 self._backup_to_onedrive(csv_path)
@@ -4632,9 +4840,9 @@ class AnnotationGUI(tk.Tk):
         """Returns (points_dict, quality) for current image."""
         if self.current_image_path is not None:
             current_filename = PurePath(self.current_image_path).name
-            keys_to_try = [str(self.current_image_path)]
+            keys_to_try = [self._cur_key]
             if self.json_path is not None:
-                keys_to_try.insert(0, self._path_key(self.current_image_path))
+                keys_to_try.insert(0, self._current_path_key())
 
             for key in keys_to_try:
                 if key in self.annotations:
@@ -4665,13 +4873,14 @@ class AnnotationGUI(tk.Tk):
                 )
             return
         try:
-            df = pd.read_csv(self.abs_csv_path)
+            # Read-only here, so skip the defensive copy of the cached frame
+            df = self._read_csv_cached()
         except Exception as e:
             if show_message:
                 messagebox.showerror("Load Points", f"Failed to read CSV:\n{e}")
             return
         if df.empty:
-            self.annotations[str(self.current_image_path)] = {}
+            self.annotations[self._cur_key] = {}
             self._update_found_checks({})
             if show_message:
                 messagebox.showinfo("Load Points", "No saved points for this image.")
@@ -4681,73 +4890,41 @@ class AnnotationGUI(tk.Tk):
         df_img_path_col = self._detect_path_column(df)
 
         # rowdf = df.loc[df[col0] == self.current_image_path]
-        rowdf = df.loc[df[df_img_path_col] == str(self.current_image_path)]
+        current_key = self._cur_key
+        pos = self._csv_row_position(df, df_img_path_col, current_key)
+        rowdf = df.iloc[pos : pos + 1] if pos is not None else df.iloc[0:0]
         if rowdf.empty:
             # Check if the current image filename is in any of the rows
             # Only if that fails do we reset the points values
             current_filename = PurePath(self.current_image_path).name
-            found_filename = False
-            for name in list(df[df_img_path_col]):
-                if current_filename in name:
-                    rowdf = df.loc[df[df_img_path_col] == name]
-                    found_filename = True
-                    break
+            hits = (
+                df[df_img_path_col]
+                .astype(str)
+                .str.contains(current_filename, regex=False, na=False)
+            )
+            rowdf = df[hits].head(1)
 
-            if found_filename is False:
-                self.annotations[str(self.current_image_path)] = {}
-                self.hover_radii.pop(str(self.current_image_path), None)
+            if rowdf.empty:
+                self.annotations[self._cur_key] = {}
+                self.hover_radii.pop(self._cur_key, None)
                 self._update_found_checks({})
                 if show_message:
                     messagebox.showinfo(
                         "Load Points", "No saved points for this image."
                     )
                 return
-        row: pd.DataFrame = rowdf.iloc[0]
+        # Plain dict lookups instead of a Series label lookup per landmark
+        row: Dict[str, Any] = rowdf.iloc[0].to_dict()
         pts = {}
-        per_img_settings = self.lm_settings.setdefault(str(self.current_image_path), {})
-        self.hover_radii.pop(str(self.current_image_path), None)
+        per_img_settings = self.lm_settings.setdefault(self._cur_key, {})
+        self.hover_radii.pop(self._cur_key, None)
         for lm in self.landmarks:
-            val = row.get(lm, "")
-            if isinstance(val, str) and val.startswith("[") and val.endswith("]"):
-                try:
-                    arr = ast.literal_eval(val)
-                except Exception:
-                    continue
-                if self._is_line_landmark(lm):
-                    line_pts: List[Tuple[float, float]] = []
-                    if isinstance(arr, (list, tuple)):
-                        for point in arr[:2]:
-                            if isinstance(point, (list, tuple)) and len(point) >= 2:
-                                try:
-                                    line_pts.append((float(point[0]), float(point[1])))
-                                except Exception:
-                                    continue
-                    if line_pts:
-                        pts[lm] = line_pts
-                    continue
-                try:
-                    x, y = float(arr[0]), float(arr[1])
-                    pts[lm] = (x, y)
-                except Exception:
-                    continue
-                if (
-                    lm in ("LOB", "ROB")
-                    and isinstance(arr, (list, tuple))
-                    and len(arr) >= 8
-                ):
-                    method_code = str(arr[2])
-                    st = {
-                        "method": "Flood Fill"
-                        if method_code in ("FF", "Flood Fill")
-                        else "Adaptive CC",
-                        "sens": int(arr[3]),
-                        "edge_lock": int(arr[4]),
-                        "edge_width": int(arr[5]),
-                        "clahe": int(arr[6]),
-                        "grow": int(arr[7]),
-                    }
-                    per_img_settings[lm] = st
-        self.annotations[str(self.current_image_path)] = pts
+            value, settings = self._parse_csv_landmark_cell(lm, row.get(lm, ""))
+            if value is not None:
+                pts[lm] = value
+            if settings is not None:
+                per_img_settings[lm] = settings
+        self.annotations[self._cur_key] = pts
         try:
             self.current_image_quality = int(row.get("image_quality", 0))
         except (ValueError, TypeError):
@@ -4768,13 +4945,8 @@ class AnnotationGUI(tk.Tk):
                     self.last_seed[lm] = (int(sx), int(sy))
                 except Exception:
                     self.last_seed.pop(lm, None)
-                vis_var = self.landmark_visibility.get(lm)
-                if (
-                    self.last_seed.get(lm) is not None
-                    and vis_var is not None
-                    and vis_var.get()
-                    and cv2 is not None
-                ):
+                is_visible = self.landmark_visibility.get(lm, False)
+                if self.last_seed.get(lm) is not None and is_visible:
                     self._resegment_for(lm, apply_saved_settings=True)
                 else:
                     self._update_overlay_for(lm)
@@ -4782,51 +4954,71 @@ class AnnotationGUI(tk.Tk):
             messagebox.showinfo("Load Points", "Points loaded from CSV.")
         self._update_path_var()
 
+    def _parse_csv_landmark_cell(
+        self, lm: str, val: Any
+    ) -> Tuple[Optional[AnnotationValue], Optional[Dict[str, Any]]]:
+        """Decode one legacy CSV landmark cell into (value, LOB/ROB settings)."""
+        if not (isinstance(val, str) and val.startswith("[") and val.endswith("]")):
+            return None, None
+        nums = _CSV_NUM_RE.findall(val)
+        if self._is_line_landmark(lm):
+            line_pts: List[Tuple[float, float]] = [
+                (float(nums[k]), float(nums[k + 1]))
+                for k in range(0, min(len(nums) - 1, 4), 2)
+            ]
+            return (line_pts or None), None
+        if len(nums) < 2:
+            return None, None
+        point = (float(nums[0]), float(nums[1]))
+
+        method = _CSV_METHOD_RE.search(val)
+        if lm not in ("LOB", "ROB") or method is None or len(nums) < 7:
+            return point, None
+        try:
+            sens, edge_lock, edge_width, clahe, grow = (
+                int(float(n)) for n in nums[2:7]
+            )
+        except (ValueError, OverflowError):
+            return point, None
+        method_code = method.group(1)
+        settings = {
+            "method": "Flood Fill"
+            if method_code in ("FF", "Flood Fill")
+            else "Adaptive CC",
+            "sens": sens,
+            "edge_lock": edge_lock,
+            "edge_width": edge_width,
+            "clahe": clahe,
+            "grow": grow,
+        }
+        return point, settings
+
     # Updates the disabled “Annotated” checkboxes based on available points.
     def _update_found_checks(self, pts_dict):
         key = (
-            self._path_key(self.current_image_path)
+            self._current_path_key()
             if self.json_path is not None and self.current_image_path is not None
-            else str(self.current_image_path)
+            else self._cur_key
         )
         meta = self.landmark_meta.get(key, {})
 
         for lm in self.landmarks:
-            var = self.landmark_found.get(lm)
-            widget = getattr(self, "landmark_found_widgets", {}).get(lm)
-            if var is not None:
-                is_found = lm in pts_dict
-                var.set(is_found)
+            if lm in self.landmark_found:
+                self.landmark_found[lm] = lm in pts_dict
 
-                if widget is not None:
-                    try:
-                        widget.configure(
-                            fg="green" if is_found else "black",
-                            activeforeground="green" if is_found else "black",
-                            selectcolor="#90EE90" if is_found else widget.cget("bg"),
-                        )
-                    except Exception:
-                        pass
+            if lm in self.landmark_flagged:
+                self.landmark_flagged[lm] = bool(meta.get(lm, {}).get("flag", False))
 
-            fvar = self.landmark_flagged.get(lm)
-            fwidget = getattr(self, "landmark_flag_widgets", {}).get(lm)
-            is_flagged = bool(meta.get(lm, {}).get("flag", False))
-            if fvar is not None:
-                fvar.set(is_flagged)
-            if fwidget is not None:
-                try:
-                    fwidget.configure(
-                        fg="red" if is_flagged else "black",
-                        activeforeground="red" if is_flagged else "black",
-                        selectcolor="#FFB6B6" if is_flagged else fwidget.cget("bg"),
-                    )
-                except Exception:
-                    pass
+            self._refresh_landmark_row(lm)
 
     # Draws landmark markers/labels and syncs overlays and pair lines.
     def _draw_points(self) -> None:
-        self.canvas.delete("marker")
+        # Point markers (oval + label) are persistent items keyed by landmark;
+        # everything else tagged "marker" is rebuilt on each draw.
+        self.canvas.delete("marker&&!point_marker")
+        drawn_points: Set[str] = set()
         if not self.current_image_path:
+            self._hide_point_items()
             self._clear_line_preview()
             self._clear_femoral_axis_overlay()
             return
@@ -4835,8 +5027,7 @@ class AnnotationGUI(tk.Tk):
         self._update_found_checks(pts)
         current_image_verified = self._is_current_image_verified()
         x_curr, y_curr = self._img_to_screen(0, 0)
-        label_font = self.landmark_font.copy()
-        label_font.configure(size=30)
+        label_font = self._derived_font(self.landmark_font, 30)
 
         selected_lm = self.selected_landmark.get()
         if self._is_line_landmark(selected_lm):
@@ -4855,16 +5046,11 @@ class AnnotationGUI(tk.Tk):
                 anchor="nw",
             )
 
-        key = (
-            self._path_key(self.current_image_path)
-            if self.json_path is not None
-            else str(self.current_image_path)
-        )
+        key = self._current_path_key() if self.json_path is not None else self._cur_key
         meta = self.landmark_meta.get(key, {})
 
         for lm, val in pts.items():
-            vis_var = self.landmark_visibility.get(lm)
-            if vis_var is not None and not vis_var.get():
+            if not self.landmark_visibility.get(lm, True):
                 continue
 
             drawing_current_selected = lm == self.selected_landmark.get()
@@ -4882,8 +5068,7 @@ class AnnotationGUI(tk.Tk):
             font = (
                 self.landmark_font if drawing_current_selected else self.dialogue_font
             )
-            shadow_font = font.copy()
-            shadow_font.configure(size=font.cget("size") + 1)
+            shadow_font = self._derived_font(font, int(font.cget("size")) + 1)
 
             if self._is_line_landmark(lm):
                 line_pts = self._get_line_points(lm)
@@ -4952,15 +5137,50 @@ class AnnotationGUI(tk.Tk):
             xs, ys = self._img_to_screen(x, y)
 
             r = 5
-            self.canvas.create_oval(
-                xs - r,
-                ys - r,
-                xs + r,
-                ys + r,
-                outline=oval_color,
-                width=2,
-                tags="marker",
-            )
+            label_y = ys - y_offset_label
+            items = self._point_items.get(lm)
+            state = (xs, ys, label_y, oval_color, text_color, str(font))
+            if items is None:
+                point_tags = ("marker", "point_marker")
+                label_tags = ("marker", "point_marker", "point_label")
+                oval_id = self.canvas.create_oval(
+                    xs - r,
+                    ys - r,
+                    xs + r,
+                    ys + r,
+                    outline=oval_color,
+                    width=2,
+                    tags=point_tags,
+                )
+                shadow_id = self.canvas.create_text(
+                    xs - 1,
+                    label_y - 1,
+                    text=lm,
+                    fill="black",
+                    font=shadow_font,
+                    tags=label_tags,
+                )
+                label_id = self.canvas.create_text(
+                    xs,
+                    label_y,
+                    text=lm,
+                    fill=text_color,
+                    font=font,
+                    tags=label_tags,
+                )
+                self._point_items[lm] = (oval_id, shadow_id, label_id)
+            elif self._point_item_state.get(lm) != state:
+                oval_id, shadow_id, label_id = items
+                self.canvas.coords(oval_id, xs - r, ys - r, xs + r, ys + r)
+                self.canvas.itemconfigure(oval_id, outline=oval_color, state="normal")
+                self.canvas.coords(shadow_id, xs - 1, label_y - 1)
+                self.canvas.itemconfigure(shadow_id, font=shadow_font, state="normal")
+                self.canvas.coords(label_id, xs, label_y)
+                self.canvas.itemconfigure(
+                    label_id, fill=text_color, font=font, state="normal"
+                )
+            self._point_item_state[lm] = state
+            drawn_points.add(lm)
             if lm in self.HOVER_CIRCLE_LANDMARKS:
                 saved_radius = self.hover_radii.get(key, {}).get(lm)
                 if saved_radius is not None:
@@ -4984,28 +5204,47 @@ class AnnotationGUI(tk.Tk):
                     width=6,
                     tags="marker",
                 )
-
-            self.canvas.create_text(
-                xs - 1,
-                ys - y_offset_label - 1,
-                text=lm,
-                fill="black",
-                font=shadow_font,
-                tags="marker",
-            )
-            self.canvas.create_text(
-                xs,
-                ys - y_offset_label,
-                text=lm,
-                fill=text_color,
-                font=font,
-                tags="marker",
-            )
+        self._hide_point_items(keep=drawn_points)
+        # Labels sit above the per-draw hover/check circles, as when recreated
+        self.canvas.tag_raise("point_label")
         for lm in ("LOB", "ROB"):
             self._update_overlay_for(lm)
-        self._update_pair_lines()
+        self._update_pair_lines(pts)
         self._update_femoral_axis_overlay()
 
+    # Queues one _draw_points for the next idle point. Requests made before it
+    # runs, e.g. from arrow-key autorepeat, share that single redraw.
+    def _request_draw(self) -> None:
+        if self._draw_pending:
+            return
+        self._draw_pending = True
+        self.after_idle(self._run_pending_draw)
+
+    # Idle callback for _request_draw: clears the pending flag and redraws.
+    def _run_pending_draw(self) -> None:
+        self._draw_pending = False
+        self._draw_points()
+
+    # Hides persistent point markers, except those for landmarks in keep.
+    def _hide_point_items(self, keep: Optional[Set[str]] = None) -> None:
+        for lm, items in self._point_items.items():
+            if keep is not None and lm in keep:
+                continue
+            # Items without a recorded state are already hidden
+            if self._point_item_state.pop(lm, None) is not None:
+                for item in items:
+                    self.canvas.itemconfigure(item, state="hidden")
+
+    # Returns a cached copy of font at the given size (for shadows/headings).
+    def _derived_font(self, font: tkfont.Font, size: int) -> tkfont.Font:
+        key = (str(font), size)
+        derived = self._derived_fonts.get(key)
+        if derived is None:
+            derived = font.copy()
+            derived.configure(size=size)
+            self._derived_fonts[key] = derived
+        return derived
+
     # Removes any connector lines between paired landmarks.
     def _remove_pair_lines(self):
         for key, line_id in list(self.pair_line_ids.items()):
@@ -5016,19 +5255,23 @@ class AnnotationGUI(tk.Tk):
             self.pair_line_ids.pop(key, None)
 
     # Finds a landmark by lowercase name, returning the exact key.
+    def _refresh_landmark_lookup(self) -> None:
+        # reversed() so the first landmark wins on case-insensitive clashes
+        self._lm_lower = {lm.lower(): lm for lm in reversed(self.landmarks)}
+
     def _find_landmark_key(self, name_lower: str):
-        for k in self.landmarks:
-            if k.lower() == name_lower:
-                return k
-        return None
+        return self._lm_lower.get(name_lower)
 
     # Adds or updates connector lines between DF/PF pairs if visible.
-    def _update_pair_lines(self) -> None:
+    def _update_pair_lines(
+        self, pts: Optional[Dict[str, AnnotationValue]] = None
+    ) -> None:
         if not self.current_image_path:
             self._remove_pair_lines()
             return
         # pts = self.annotations.get(self.current_image_path, {})
-        pts, quality = self._get_annotations()
+        if pts is None:
+            pts, _quality = self._get_annotations()
         pairs = [("ldf", "lpf"), ("rdf", "rpf")]
         color = "#00FFFF"
         for a, b in pairs:
@@ -5038,9 +5281,8 @@ class AnnotationGUI(tk.Tk):
             if ka is None or kb is None:
                 return
             if ka in pts and kb in pts:
-                va = self.landmark_visibility.get(ka)
-                vb = self.landmark_visibility.get(kb)
-                if (va is None or va.get()) and (vb is None or vb.get()):
+                visible = self.landmark_visibility
+                if visible.get(ka, True) and visible.get(kb, True):
                     point_a = pts[ka]
                     point_b = pts[kb]
                     if not (
@@ -5404,21 +5646,19 @@ class AnnotationGUI(tk.Tk):
 
     # Shows or hides a landmark overlay depending on mask and visibility.
     def _update_overlay_for(self, lm: str) -> None:
-        vis = True
-        vis_var = self.landmark_visibility.get(lm)
-        if vis_var is not None:
-            vis = bool(vis_var.get())
+        vis = self.landmark_visibility.get(lm, True)
         has_mask = (
             self.current_image_path
-            and str(self.current_image_path) in self.seg_masks
-            and lm in self.seg_masks[str(self.current_image_path)]
+            and self._cur_key in self.seg_masks
+            and lm in self.seg_masks[self._cur_key]
         )
         if not has_mask or not vis:
             self._remove_overlay_for(lm)
             return
-        mask = self.seg_masks[str(self.current_image_path)][lm]
+        # Overlay drawing is disabled; nothing new sits above the markers, so
+        # skip the tag_raise round-trip as well.
+        # mask = self.seg_masks[self._cur_key][lm]
         # self._render_overlay_for(lm, mask)
-        self.canvas.tag_raise("marker")
 
     # Renders a semi-transparent RGBA overlay from a binary mask.
     def _render_overlay_for(
@@ -5427,6 +5667,8 @@ class AnnotationGUI(tk.Tk):
         mask: np.ndarray,
         fill_rgba: Tuple[int, int, int, int] = (0, 255, 255, 120),
     ) -> None:
+        import cv2
+
         if mask is None or self.current_image is None:
             return
 
@@ -5437,17 +5679,26 @@ class AnnotationGUI(tk.Tk):
         disp_w, disp_h = self.disp_size
         off_x, off_y = self.disp_off
 
-        mask_u8 = (mask > 0).astype(np.uint8) * 255
-        mask_img = Image.fromarray(mask_u8, mode="L").resize(
-            (disp_w, disp_h), Image.Resampling.NEAREST
+        # Build the RGBA overlay in one numpy pass instead of pasting images.
+        # Segmentation masks are already 0/1 uint8, so resize them as-is.
+        mask_u8 = mask if mask.dtype == np.uint8 else (mask > 0).astype(np.uint8)
+        mask_disp = cv2.resize(
+            mask_u8, (disp_w, disp_h), interpolation=cv2.INTER_NEAREST
         )
+        overlay = np.zeros((disp_h, disp_w, 4), dtype=np.uint8)
+        overlay[mask_disp > 0] = fill_rgba
 
-        overlay = Image.new("RGBA", (disp_w, disp_h), (0, 0, 0, 0))
-        color_img = Image.new("RGBA", (disp_w, disp_h), fill_rgba)
-
-        overlay.paste(color_img, (0, 0), mask_img)
-
-        self.seg_img_objs[lm] = ImageTk.PhotoImage(overlay)
+        # frombuffer wraps the array's memory instead of copying it
+        overlay_img = Image.frombuffer(
+            "RGBA", (disp_w, disp_h), overlay, "raw", "RGBA", 0, 1
+        )
+        # Overlays are always RGBA, so a photo of the same size can be
+        # refilled in place while the grow/shrink slider is dragged
+        photo = self.seg_img_objs.get(lm)
+        if photo is not None and (photo.width(), photo.height()) == (disp_w, disp_h):
+            photo.paste(overlay_img)
+        else:
+            self.seg_img_objs[lm] = ImageTk.PhotoImage(overlay_img)
 
         if lm not in self.seg_item_ids:
             self.seg_item_ids[lm] = self.canvas.create_image(
@@ -5528,29 +5779,23 @@ class AnnotationGUI(tk.Tk):
         if not self._check_left_right_order_for_landmark(lm, x, y):
             return
 
-        self.annotations.setdefault(str(self.current_image_path), {})[lm] = (x, y)
+        self.annotations.setdefault(self._cur_key, {})[lm] = (x, y)
         if lm in self.HOVER_CIRCLE_LANDMARKS:
             img_key = (
-                self._path_key(self.current_image_path)
+                self._current_path_key()
                 if self.json_path is not None
-                else str(self.current_image_path)
+                else self._cur_key
             )
             disp_scale = self.disp_scale or 1.0
             self.hover_radii.setdefault(img_key, {})[lm] = (
                 self.hover_radius.get() / disp_scale
             )
         if lm in self.landmark_found:
-            self.landmark_found[lm].set(True)
+            self.landmark_found[lm] = True
         self._draw_points()
         self._refresh_zoom_landmark_overlay()
         self.dirty = True
         if lm in ("LOB", "ROB"):
-            if cv2 is None:
-                messagebox.showerror(
-                    "OpenCV missing",
-                    'cv2 is not available. Install with "pip install opencv-python".',
-                )
-                return
             self.last_seed[lm] = (int(x), int(y))
             self._store_current_settings_for(lm)
             self._resegment_for(lm)
@@ -5734,14 +5979,14 @@ class AnnotationGUI(tk.Tk):
         if self.current_image_path is None:
             return
 
-        current_pts = self.annotations.setdefault(str(self.current_image_path), {})
+        current_pts = self.annotations.setdefault(self._cur_key, {})
         if lm in current_pts:
             # Delete it if it does
             del current_pts[lm]
             img_key = (
-                self._path_key(self.current_image_path)
+                self._current_path_key()
                 if self.json_path is not None
-                else str(self.current_image_path)
+                else self._cur_key
             )
             self.hover_radii.get(img_key, {}).pop(lm, None)
 
@@ -5752,12 +5997,6 @@ class AnnotationGUI(tk.Tk):
         self._refresh_zoom_landmark_overlay()
         self.dirty = True
         if lm in ("LOB", "ROB"):
-            if cv2 is None:
-                messagebox.showerror(
-                    "OpenCV missing",
-                    'cv2 is not available. Install with "pip install opencv-python".',
-                )
-                return
             self._store_current_settings_for(lm)
             self._resegment_for(lm)
         # Auto-save to database immediately after deleting landmark
@@ -5776,7 +6015,7 @@ class AnnotationGUI(tk.Tk):
         if self.current_image_path is None:
             return
         seed = self.last_seed.get(lm)
-        if seed is None or cv2 is None or self.current_image is None:
+        if seed is None or self.current_image is None:
             return
         x, y = seed
         mask = self._segment_with_fallback(x, y, lm)
@@ -5784,7 +6023,7 @@ class AnnotationGUI(tk.Tk):
         if mask is None:
             return
         mask = self._grow_shrink(mask, self.grow_shrink.get())
-        self.seg_masks.setdefault(str(self.current_image_path), {})[lm] = mask
+        self.seg_masks.setdefault(self._cur_key, {})[lm] = mask
         self._update_overlay_for(lm)
 
     def _segment_with_fallback(self, x: int, y: int, lm: str) -> np.ndarray | None:
@@ -5793,6 +6032,8 @@ class AnnotationGUI(tk.Tk):
     def _percentile_contrast_stretch(
         self, img: np.ndarray, low_percent: int, high_percent: int
     ) -> np.ndarray:
+        import cv2
+
         gray = cv2.cvtColor(img, cv2.COLOR_RGB2GRAY) if len(img.shape) == 3 else img
         p_low, p_high = np.percentile(gray, (low_percent, high_percent))
 
@@ -5801,39 +6042,55 @@ class AnnotationGUI(tk.Tk):
 
         return np.clip((img - p_low) / (p_high - p_low) * 255, 0, 255).astype(np.uint8)
 
+    # Returns the CLAHE operator shared by the zoom view and segmentation.
+    def _get_clahe(self) -> Any:
+        import cv2
+
+        if self._clahe is None:
+            self._clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+        return self._clahe
+
     # Converts image to preprocessed grayscale (CLAHE + blur).
     def _preprocess_gray(self):
+        import cv2
+
+        use_clahe = bool(self.use_clahe.get())
+        cached = self._gray_cache
+        if (
+            cached is not None
+            and cached[0] is self.current_image
+            and cached[1] == use_clahe
+        ):
+            return cached[2]
+
         img_rgb = np.array(self.current_image)
         if img_rgb.shape[-1] == 3:
             gray = cv2.cvtColor(img_rgb, cv2.COLOR_RGB2GRAY)
         else:
             gray = img_rgb
 
-        if self.use_clahe.get():
-            clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-            gray = clahe.apply(gray)
+        if use_clahe:
+            gray = self._get_clahe().apply(gray)
         gray = cv2.GaussianBlur(gray, (5, 5), 0)
+        # Shared by every segmentation attempt on this image; callers must not
+        # write into it
+        gray.flags.writeable = False
+        self._gray_cache = (self.current_image, use_clahe, gray)
         return gray
 
     # Segments a region via flood fill with optional edge-lock barrier.
     def _segment_ff(self, x: int, y: int) -> np.ndarray | None:
+        import cv2
+
         gray = self._preprocess_gray()
         h, w = gray.shape[:2]
         if not (0 <= x < w and 0 <= y < h):
             return None
-        barrier = np.zeros((h, w), np.uint8)
-        if self.edge_lock.get():
-            edges = cv2.Canny(gray, 40, 120)
-            k = max(1, min(5, int(self.edge_lock_width.get())))
-            kernel = cv2.getStructuringElement(
-                cv2.MORPH_ELLIPSE, (2 * k + 1, 2 * k + 1)
-            )
-            barrier = cv2.dilate(edges, kernel, iterations=1)
-            barrier = (barrier > 0).astype(np.uint8)
         ff_mask = np.zeros((h + 2, w + 2), np.uint8)
         ff_mask[0, :], ff_mask[-1, :], ff_mask[:, 0], ff_mask[:, -1] = 1, 1, 1, 1
         if self.edge_lock.get():
-            ff_mask[1:-1, 1:-1][barrier == 1] = 1
+            k = max(1, min(5, int(self.edge_lock_width.get())))
+            ff_mask[1:-1, 1:-1][self._edge_barrier(gray, k)] = 1
         sens = int(self.fill_sensitivity.get())
         tol = max(1, min(80, 2 * sens + 2))
         img_ff = gray.copy()
@@ -5854,8 +6111,34 @@ class AnnotationGUI(tk.Tk):
         region = self._sanity_and_clean(region)
         return region
 
+    # Returns the dilated Canny edge mask, reused while gray and k are unchanged.
+    def _edge_barrier(self, gray: np.ndarray, k: int) -> np.ndarray:
+        import cv2
+
+        cached = self._barrier_cache
+        if cached is not None and cached[0] is gray and cached[1] == k:
+            return cached[2]
+        edges = cv2.Canny(gray, 40, 120)
+        barrier = cv2.dilate(edges, self._ellipse_kernel(k), iterations=1) > 0
+        self._barrier_cache = (gray, k, barrier)
+        return barrier
+
+    # Returns the elliptical morphology kernel of radius k, built once per radius.
+    def _ellipse_kernel(self, k: int) -> np.ndarray:
+        import cv2
+
+        kernel = self._ellipse_kernels.get(k)
+        if kernel is None:
+            kernel = cv2.getStructuringElement(
+                cv2.MORPH_ELLIPSE, (2 * k + 1, 2 * k + 1)
+            )
+            self._ellipse_kernels[k] = kernel
+        return kernel
+
     # Segments a region via adaptive thresholding and connected components.
     def _segment_adaptive_cc(self, x: int, y: int) -> np.ndarray | None:
+        import cv2
+
         gray = self._preprocess_gray()
         h, w = gray.shape[:2]
         if not (0 <= x < w and 0 <= y < h):
@@ -5866,11 +6149,12 @@ class AnnotationGUI(tk.Tk):
         thr = cv2.adaptiveThreshold(
             gray, 255, cv2.ADAPTIVE_THRESH_MEAN_C, cv2.THRESH_BINARY_INV, block, C
         )
-        kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3))
-        thr = cv2.morphologyEx(thr, cv2.MORPH_OPEN, kernel, iterations=1)
-        labels = cv2.connectedComponentsWithStats(
+        thr = cv2.morphologyEx(
+            thr, cv2.MORPH_OPEN, self._ellipse_kernel(1), iterations=1
+        )
+        _n, labels, stats, _centroids = cv2.connectedComponentsWithStats(
             (thr > 0).astype(np.uint8), connectivity=8
-        )[1]
+        )
         lbl = labels[int(y), int(x)]
         if lbl == 0:
             r = 3
@@ -5882,28 +6166,42 @@ class AnnotationGUI(tk.Tk):
             if u.size == 0:
                 return None
             lbl = int(u[0])
+        # Reject on the component area before materialising the mask
+        area = int(stats[lbl, cv2.CC_STAT_AREA])
+        if not self._plausible_area(area, w, h):
+            return None
         region = (labels == lbl).astype(np.uint8)
-        region = self._sanity_and_clean(region)
+        region = self._sanity_and_clean(region, area=area)
         return region
 
     # Rejects implausible masks and performs a closing for cleanup.
-    def _sanity_and_clean(self, mask: np.ndarray) -> np.ndarray | None:
+    def _sanity_and_clean(
+        self, mask: np.ndarray, area: Optional[int] = None
+    ) -> np.ndarray | None:
+        import cv2
+
         h, w = mask.shape[:2]
-        area = int(mask.sum())
-        if area < 30:
-            return None
-        if area > 0.7 * w * h:
+        if area is None:
+            area = int(mask.sum())
+        if not self._plausible_area(area, w, h):
             return None
-        kernel2 = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
-        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel2, iterations=1)
+        mask = cv2.morphologyEx(
+            mask, cv2.MORPH_CLOSE, self._ellipse_kernel(2), iterations=1
+        )
         return (mask > 0).astype(np.uint8)
 
+    # True if a region of this many pixels is a plausible segmentation.
+    @staticmethod
+    def _plausible_area(area: int, w: int, h: int) -> bool:
+        return 30 <= area <= 0.7 * w * h
+
     # Dilates (positive) or erodes (negative) a mask by the requested steps.
     def _grow_shrink(self, mask: np.ndarray, steps: int) -> np.ndarray:
+        import cv2
+
         if steps == 0:
             return (mask > 0).astype(np.uint8)
-        k = min(25, max(1, abs(steps)))
-        kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (2 * k + 1, 2 * k + 1))
+        kernel = self._ellipse_kernel(min(25, max(1, abs(steps))))
         if steps > 0:
             out = cv2.dilate(mask.astype(np.uint8), kernel, iterations=1)
         else:
@@ -5923,12 +6221,12 @@ class AnnotationGUI(tk.Tk):
 
     # Stores current UI settings for a specific landmark on this image.
     def _store_current_settings_for(self, lm: str) -> None:
-        per_img = self.lm_settings.setdefault(str(self.current_image_path), {})
+        per_img = self.lm_settings.setdefault(self._cur_key, {})
         per_img[lm] = self._current_settings_dict()
 
     # Applies saved settings for a landmark back into the UI controls.
     def _apply_settings_to_ui_for(self, lm: str) -> None:
-        st = self.lm_settings.get(str(self.current_image_path), {}).get(lm)
+        st = self.lm_settings.get(self._cur_key, {}).get(lm)
         if not st:
             return
         self.method.set(st["method"])
@@ -5958,11 +6256,11 @@ class AnnotationGUI(tk.Tk):
         lm = self.selected_landmark.get()
         if not lm:
             return
-        var = self.landmark_visibility.get(lm)
-        if var is None:
+        if lm not in self.landmark_visibility:
             return
-        var.set(visible)
-        self._draw_points()
+        self.landmark_visibility[lm] = visible
+        self._refresh_landmark_row(lm)
+        self._request_draw()
 
     def _on_arrow_left(self, event) -> None:
         self._set_selected_visibility(False)
@@ -5982,35 +6280,26 @@ class AnnotationGUI(tk.Tk):
         Looks good even with proportional fonts.
         """
 
-        key_w = max(len(k) for k, _ in rows)
-        lines = []
+        key_w = max(map(len, (k for k, _ in rows)))
+        # Slices of one full-width fill string, instead of a new repeat per row
+        max_fill = (leader or " ") * max(width, gap_min)
 
-        for keys, action in rows:
-            left = f"{keys:<{key_w}}"
+        return "\n".join(
             # Fill the middle with dots/spaces so the action ends at width-ish
-            fill_len = max(gap_min, width - len(left) - len(action))
-            fill = (leader * fill_len) if leader else (" " * fill_len)
-            lines.append(f"{left} {fill} {action}")
-
-        return "\n".join(lines)
+            f"{keys.ljust(key_w)} "
+            f"{max_fill[: max(gap_min, width - key_w - len(action))]} {action}"
+            for keys, action in rows
+        )
 
     def _on_h_press(self, event=None) -> None:
-        shortcuts = [
-            ("<up> / ↑ / d", "Previous landmark"),
-            ("<down> / ↓ / f", "Next landmark"),
-            ("<left> / <--", "Hide selected landmark"),
-            ("<right> / -->", "Show selected landmark"),
-            ("b / Ctrl+b", "Previous image"),
-            ("n / Ctrl+n", "Next image"),
-            ("1–4", "Set image quality (1-worst, 4-best)"),
-            ("Backspace", "Delete selected landmark"),
-            ("h", "Show this help"),
-            ("?", "Show landmark reference"),
-            ("Mouse click", "Place landmark"),
-            ("Mouse wheel", "Adjust hover radius"),
-        ]
+        win = self._help_win
+        if win is not None and win.winfo_exists():
+            win.deiconify()
+            win.lift()
+            return
+
         help_text = self._format_shortcuts(
-            shortcuts,
+            self.SHORTCUT_ROWS,
             width=60,
             leader=".",
         )
@@ -6019,6 +6308,9 @@ class AnnotationGUI(tk.Tk):
         win.title("Help & Keyboard Shortcuts")
         win.transient(self)
         win.resizable(False, False)
+        # Closing only hides the window so the next "h" press reuses it
+        win.protocol("WM_DELETE_WINDOW", win.withdraw)
+        self._help_win = win
 
         frm = ttk.Frame(win, padding=12)
         frm.pack(fill="both", expand=True)
@@ -6029,24 +6321,17 @@ class AnnotationGUI(tk.Tk):
             font=self.heading_font,
         ).pack(anchor="w", pady=(0, 8))
 
-        text = tk.Text(
+        ttk.Label(
             frm,
-            wrap="none",
-            height=len(shortcuts) + 1,
-            borderwidth=0,
-            highlightthickness=0,
-        )
-        text.pack(fill="both", expand=True)
-
-        text.configure(font=self.dialogue_font)
-
-        text.insert("1.0", help_text)
-        text.configure(state="disabled")
+            text=help_text,
+            font=self.dialogue_font,
+            justify="left",
+        ).pack(fill="both", expand=True)
 
         ttk.Button(
             frm,
             text="Close",
-            command=win.destroy,
+            command=win.withdraw,
         ).pack(anchor="e", pady=(10, 0))
 
     def _open_landmark_reference(self, event=None) -> None:
@@ -6086,7 +6371,8 @@ class AnnotationGUI(tk.Tk):
             family="Liberation Sans", size=12, weight="bold"
         )
 
-        # Tk named fonts (classic tk widgets)
+        # Tk named fonts (classic tk widgets); one "font configure" each,
+        # without nametofont's extra "font names" lookup
         for name in (
             "TkDefaultFont",
             "TkTextFont",
@@ -6094,29 +6380,18 @@ class AnnotationGUI(tk.Tk):
             "TkMenuFont",
             "TkHeadingFont",
         ):
-            f = tkfont.nametofont(name)
-            f.configure(family="Liberation Sans", size=12)
+            self.tk.call(
+                "font", "configure", name, "-family", "Liberation Sans", "-size", 12
+            )
 
         # ttk styles
         style = ttk.Style(self)
         style.theme_use(style.theme_use())  # force theme init / refresh
 
+        # Every ttk style inherits "." except Heading, which the stock themes
+        # pin to TkHeadingFont
         style.configure(".", font=self.dialogue_font)
-        for s in (
-            "TLabel",
-            "TButton",
-            "TCheckbutton",
-            "TRadiobutton",
-            "TEntry",
-            "TCombobox",
-            "TMenubutton",
-            "TNotebook",
-            "TNotebook.Tab",
-            "Treeview",
-            "Treeview.Heading",
-            "TLabelframe.Label",
-        ):
-            style.configure(s, font=self.dialogue_font)
+        style.configure("Treeview.Heading", font=self.dialogue_font)
         return
 
     def _refresh_image_listbox(self) -> None:
@@ -6185,10 +6460,7 @@ class AnnotationGUI(tk.Tk):
         if idx is None:
             return 0
 
-        if (
-            self.current_image_path is not None
-            and self._path_key(self.current_image_path) == key
-        ):
+        if self.current_image_path is not None and self._current_path_key() == key:
             view = self.current_view_var.get().strip()
         else:
             record = self.json_data["images"][idx]
@@ -6206,8 +6478,7 @@ class AnnotationGUI(tk.Tk):
             return 0
 
         is_current_image = (
-            self.current_image_path is not None
-            and self._path_key(self.current_image_path) == key
+            self.current_image_path is not None and self._current_path_key() == key
         )
         if is_current_image:
             view = self.current_view_var.get().strip()
@@ -6250,10 +6521,7 @@ class AnnotationGUI(tk.Tk):
         if idx is None:
             return "0/?"
 
-        if (
-            self.current_image_path is not None
-            and self._path_key(self.current_image_path) == key
-        ):
+        if self.current_image_path is not None and self._current_path_key() == key:
             view = self.current_view_var.get().strip()
         else:
             record = self.json_data["images"][idx]
@@ -6273,10 +6541,7 @@ class AnnotationGUI(tk.Tk):
         if idx is None:
             return False
 
-        if (
-            self.current_image_path is not None
-            and self._path_key(self.current_image_path) == key
-        ):
+        if self.current_image_path is not None and self._current_path_key() == key:
             view = self.current_view_var.get().strip()
         else:
             record = self.json_data["images"][idx]
@@ -6289,20 +6554,9 @@ class AnnotationGUI(tk.Tk):
         total = self._count_allowed_landmarks_for_current_image(image_path)
         return total > 0 and done >= total
 
-    def _widget_y_in_inner(self, widget) -> int:
-        y = 0
-        w = widget
-        while w is not None and w is not self.lp_inner:
-            y += w.winfo_y()
-            parent_name = w.winfo_parent()
-            if not parent_name:
-                break
-            w = w.nametowidget(parent_name)
-        return y
-
     def _get_csv_images_from_directory(self, dir: Path) -> list[Path]:
         try:
-            df = pd.read_csv(self.abs_csv_path)
+            df = self._read_csv_cached()
         except Exception:
             return []
 
@@ -6326,6 +6580,48 @@ class AnnotationGUI(tk.Tk):
 
         return local_dir_csv_files
 
+    def _annotated_csv_filenames(self, df: pd.DataFrame, col: str) -> FrozenSet[str]:
+        """Lowercased filenames of CSV rows that are "truly annotated".
+
+        A row counts if it has any landmark value or a non-zero image_quality
+        (marked as bad image). Evaluated column-wise rather than row by row.
+        """
+        import pandas as pd
+
+        # Check if any landmark columns have values
+        lm_cells = df[[lm for lm in self.landmarks if lm in df.columns]]
+        has_landmarks = (
+            lm_cells.notna()
+            & lm_cells.astype(str).apply(lambda c: c.str.strip().ne(""))
+        ).any(axis=1)
+
+        # Check image quality
+        if "image_quality" in df.columns:
+            quality = (
+                pd.to_numeric(df["image_quality"], errors="coerce")
+                .fillna(0)
+                .astype(int)
+            )
+        else:
+            quality = pd.Series(0, index=df.index)
+
+        # Consider "annotated" if:
+        # 1. Has landmarks, OR
+        # 2. Has no landmarks but quality != 0 (marked as bad image)
+        annotated = has_landmarks | (quality != 0)
+        # Lowercased to match the scan, which compares DirEntry.name.lower()
+        return frozenset(extract_filename(p).lower() for p in df.loc[annotated, col])
+
+    def _cached_annotated_filenames(self) -> FrozenSet[str]:
+        """_annotated_csv_filenames for the current CSV, reused while the file
+        and the landmark list are unchanged."""
+        df = self._read_csv_cached()
+        col = self._detect_path_column(df)
+        key = (self._csv_cache[0], col, tuple(self.landmarks))
+        if self._annotated_cache is None or self._annotated_cache[0] != key:
+            self._annotated_cache = (key, self._annotated_csv_filenames(df, col))
+        return self._annotated_cache[1]
+
     def _find_unannotated_images(self) -> None:
         """Scan directory for images not in CSV, enter queue mode."""
         if not hasattr(self, "abs_csv_path") or not self.abs_csv_path:
@@ -6346,60 +6642,69 @@ class AnnotationGUI(tk.Tk):
 
         # Load existing annotations from CSV
         try:
-            df = pd.read_csv(self.abs_csv_path)
-            col = self._detect_path_column(df)
-
-            # Build a set of files that are "truly annotated"
-            # (either have landmarks OR have been quality-rated as bad)
-            annotated_filenames: Set = set()
-
-            for _, row in df.iterrows():
-                # filename = Path(str(row[col])).name.lower()
-                filename = extract_filename(row[col])
+            annotated_filenames = self._cached_annotated_filenames()
+        except Exception as e:
+            messagebox.showerror("CSV Error", f"Failed to read CSV:\n{e}")
+            return
 
-                # Check if any landmark columns have values
-                has_landmarks = any(
-                    pd.notna(row.get(lm)) and str(row.get(lm, "")).strip()
-                    for lm in self.landmarks
-                )
+        # The directory walk can take a while on large trees, so run it on a
+        # background thread and poll for the result like the OneDrive backup
+        dialog = tk.Toplevel(self)
+        dialog.title("Scanning for unannotated images...")
+        dialog.resizable(False, False)
+        dialog.transient(self)
+        dialog.grab_set()
+        dialog.protocol("WM_DELETE_WINDOW", lambda: None)
 
-                # Check image quality
-                quality = row.get("image_quality", 0)
-                try:
-                    quality = int(quality)
-                except (ValueError, TypeError):
-                    quality = 0
+        frame = ttk.Frame(dialog, padding=20)
+        frame.pack(fill="both", expand=True)
+        ttk.Label(frame, text=f"Scanning {scan_path.name}...").pack(pady=(0, 15))
+        progress = ttk.Progressbar(frame, mode="indeterminate", length=300)
+        progress.pack(pady=10)
+        progress.start(10)
 
-                # Consider "annotated" if:
-                # 1. Has landmarks, OR
-                # 2. Has no landmarks but quality != 0 (marked as bad image)
-                if has_landmarks or quality != 0:
-                    annotated_filenames.add(filename)
+        # Shared state for thread communication
+        scan_state: Dict[str, Any] = {"done": False, "unannotated": [], "error": None}
+        suffixes = self.possible_image_suffix
 
-        except Exception as e:
-            messagebox.showerror("CSV Error", f"Failed to read CSV:\n{e}")
-            return
+        def do_scan():
+            """Find unannotated image files, skipping duplicates folders."""
+            try:
+                if scan_path.name != "duplicates":
+                    scan_state["unannotated"] = [
+                        Path(entry.path)
+                        for entry in iter_image_files(scan_path, suffixes)
+                        if entry.name.lower() not in annotated_filenames
+                    ]
+            except Exception as e:
+                logger.warning(f"Unannotated image scan failed: {e}")
+                scan_state["error"] = e
+            finally:
+                scan_state["done"] = True
 
-        # Recursively find all image files
-        all_images = []
-        for dirpath, dirnames, filenames in scan_path.walk():
-            if "duplicates" in dirnames:
-                dirnames.remove("duplicates")
-            for file in filenames:
-                if Path(file).suffix.lower() in self.possible_image_suffix:
-                    all_images.append(dirpath / file)
-                    pass
-                pass
-            pass
+        def check_scan():
+            """Poll scan state and finish on the Tk thread."""
+            if scan_state["done"]:
+                progress.stop()
+                dialog.grab_release()
+                dialog.destroy()
+                if scan_state["error"] is not None:
+                    messagebox.showerror(
+                        "Scan Error",
+                        f"Failed to scan {scan_path.name}:\n{scan_state['error']}",
+                    )
+                    return
+                self._start_unannotated_queue(scan_path, scan_state["unannotated"])
+            else:
+                dialog.after(100, check_scan)
 
-        # Filter to unannotated only
-        unannotated = [
-            img
-            for img in all_images
-            if (img.name.lower() not in annotated_filenames)
-            and (img.parent.name != "duplicates")
-        ]
+        threading.Thread(target=do_scan, daemon=True).start()
+        check_scan()
 
+    def _start_unannotated_queue(
+        self, scan_path: Path, unannotated: List[Path]
+    ) -> None:
+        """Enter queue mode over the images found by _find_unannotated_images."""
         if not unannotated:
             messagebox.showinfo(
                 "All Done!", f"All images in {scan_path.name} are already annotated!"
@@ -6470,7 +6775,7 @@ class AnnotationGUI(tk.Tk):
             initialdir=BASE_DIR / "data/csv", filetypes=[("CSV File", ("*.csv"))]
         )
         if self.abs_csv_path:
-            df: pd.DataFrame = pd.read_csv(self.abs_csv_path)
+            df: pd.DataFrame = self._read_csv_cached()
             csv_path_column = self._detect_path_column(df)
             self.load_landmarks_from_csv(self.abs_csv_path)
             self.check_csv_mode = True
@@ -2,7 +2,7 @@
 
 import os
 from pathlib import Path, PurePath
-from typing import Union
+from typing import AbstractSet, Iterator, Union
 
 
 def normalize_path_string(path: Union[Path, str, PurePath]) -> str:
@@ -21,3 +21,32 @@ def filenames_match(path1: Union[Path, str], path2: Union[Path, str]) -> bool:
 def normalize_relative_path(path: Path, base: Path) -> str:
     rel = PurePath(path.resolve()).relative_to(base.resolve(), walk_up=True)
     return normalize_path_string(rel)
+
+
+def iter_image_files(
+    root: Union[Path, str],
+    suffixes: AbstractSet[str],
+    skip_dirs: AbstractSet[str] = frozenset({"duplicates"}),
+) -> Iterator[os.DirEntry]:
+    """Yield DirEntry objects for files under root whose lowercased suffix is
+    in suffixes, without descending into directories named in skip_dirs."""
+    # str.endswith takes a tuple, so the per-file test needs no splitext
+    suffix_tuple = tuple(suffixes)
+    stack = [str(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            # Unreadable directories are skipped, as Path.walk does
+            continue
+        subdirs = []
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in skip_dirs:
+                        subdirs.append(entry.path)
+                elif entry.name.lower().endswith(suffix_tuple):
+                    if entry.is_file():
+                        yield entry
+        # Reversed so siblings are popped in listing order, top-down like walk
+        stack.extend(reversed(subdirs))
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+
+# pyright: reportMissingImports=false
+
+import sys
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import main
+from main import AnnotationGUI
+
+
+class FakeCanvas:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.coords_calls = []
+
+    def winfo_width(self):
+        return self.width
+
+    def winfo_height(self):
+        return self.height
+
+    def create_image(self, *_args, **_kwargs):
+        return 1
+
+    def itemconfigure(self, *_args, **_kwargs):
+        pass
+
+    def coords(self, item, *coords):
+        self.coords_calls.append((item, coords))
+
+    def tag_lower(self, *_args):
+        pass
+
+    def tag_raise(self, *_args):
+        pass
+
+
+class FakePhotoImage:
+    def __init__(self, img):
+        self.img = img
+        self.paste_calls = 0
+
+    def width(self):
+        return self.img.size[0]
+
+    def height(self):
+        return self.img.size[1]
+
+    def paste(self, img):
+        self.img = img
+        self.paste_calls += 1
+
+
+def make_gui_stub(monkeypatch, tmp_path):
+    monkeypatch.setattr(main.ImageTk, "PhotoImage", FakePhotoImage)
+    gui = AnnotationGUI.__new__(AnnotationGUI)
+    gui.canvas = FakeCanvas(200, 100)
+    gui.current_image = Image.new("RGB", (400, 200))
+    gui._preview_np = None
+    gui.absolute_current_image_path = tmp_path / "image.png"
+    gui.img_obj = None
+    gui.base_img_item = None
+    gui._last_disp_size = None
+    gui._resized_image_cache = {}
+    return gui
+
+
+def test_render_base_image_skips_resize_when_size_unchanged(monkeypatch, tmp_path):
+    gui = make_gui_stub(monkeypatch, tmp_path)
+
+    gui._render_base_image()
+    first = gui.img_obj
+    gui._render_base_image()
+
+    assert gui.img_obj is first
+    assert first.img.size == (200, 100)
+    assert gui.canvas.coords_calls[-1] == (1, (0, 0))
+
+
+def test_render_base_image_reuses_cached_resize_for_same_image(monkeypatch, tmp_path):
+    gui = make_gui_stub(monkeypatch, tmp_path)
+
+    gui._render_base_image()
+    first = gui.img_obj
+    gui._last_disp_size = None
+    gui._render_base_image()
+
+    assert gui.img_obj is first
+    assert first.paste_calls == 1
+    assert len(gui._resized_image_cache) == 1
+
+
+def test_render_base_image_allocates_new_photo_when_size_changes(
+    monkeypatch, tmp_path
+):
+    gui = make_gui_stub(monkeypatch, tmp_path)
+
+    gui._render_base_image()
+    first = gui.img_obj
+    gui.canvas.width = 100
+    gui.canvas.height = 50
+    gui._render_base_image()
+
+    assert gui.img_obj is not first
+    assert gui.img_obj.img.size == (100, 50)
+
+
+def test_build_preview_image_reduces_only_large_images(monkeypatch, tmp_path):
+    gui = make_gui_stub(monkeypatch, tmp_path)
+    gui.winfo_screenwidth = lambda: 100
+    gui.winfo_screenheight = lambda: 50
+
+    small = Image.new("RGB", (300, 150))
+    large = Image.new("RGB", (1000, 500))
+
+    assert gui._build_preview_image(small) is small
+    assert gui._build_preview_image(large).size == (200, 100)
+
+
+def test_normalize_16bit_matches_percentile_stretch():
+    rng = np.random.default_rng(0)
+    arr = rng.integers(1000, 60000, size=(64, 64), dtype=np.uint16)
+
+    out = AnnotationGUI._normalize_16bit(arr)
+
+    lo, hi = np.percentile(arr, 1), np.percentile(arr, 99)
+    expected = ((np.clip(arr, lo, hi) - lo) / (hi - lo) * 255).astype(np.uint8)
+    assert out.dtype == np.uint8
+    assert out.shape == arr.shape
+    assert np.abs(out.astype(int) - expected.astype(int)).max() <= 1
+
+
+def test_normalize_16bit_handles_flat_image():
+    arr = np.full((8, 8), 500, dtype=np.uint16)
+
+    out = AnnotationGUI._normalize_16bit(arr)
+
+    assert out.dtype == np.uint8
+    assert np.unique(out).size == 1
+
+
+def test_show_zoom_image_reuses_photo_for_same_mode_and_size(monkeypatch, tmp_path):
+    gui = make_gui_stub(monkeypatch, tmp_path)
+    gui.zoom_canvas = FakeCanvas(50, 50)
+    gui.zoom_img_obj = None
+    gui.zoom_base_item = None
+    gui._zoom_img_key = None
+
+    gui._show_zoom_image(Image.new("RGB", (50, 50)))
+    first = gui.zoom_img_obj
+    gui._show_zoom_image(Image.new("RGB", (50, 50)))
+    assert gui.zoom_img_obj is first
+    assert first.paste_calls == 1
+
+    gui._show_zoom_image(Image.new("L", (50, 50)))
+    assert gui.zoom_img_obj is not first
+
+
+def test_render_overlay_reuses_photo_until_display_size_changes(
+    monkeypatch, tmp_path
+):
+    gui = make_gui_stub(monkeypatch, tmp_path)
+    gui.disp_size = (20, 10)
+    gui.disp_off = (0, 0)
+    gui.seg_img_objs = {}
+    gui.seg_item_ids = {}
+    mask = np.zeros((40, 80), dtype=np.uint8)
+    mask[10:20, 10:30] = 1
+
+    gui._render_overlay_for("LOB", mask)
+    first = gui.seg_img_objs["LOB"]
+    gui._render_overlay_for("LOB", mask)
+    assert gui.seg_img_objs["LOB"] is first
+    assert first.paste_calls == 1
+
+    gui.disp_size = (40, 20)
+    gui._render_overlay_for("LOB", mask)
+    assert gui.seg_img_objs["LOB"] is not first
+    assert gui.seg_img_objs["LOB"].img.size == (40, 20)
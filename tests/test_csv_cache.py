@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+
+# pyright: reportMissingImports=false
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from main import AnnotationGUI
+
+
+def make_gui_stub(csv_path: Path):
+    gui = AnnotationGUI.__new__(AnnotationGUI)
+    gui.abs_csv_path = str(csv_path)
+    gui._csv_cache = None
+    return gui
+
+
+def test_read_csv_cached_reuses_parsed_frame(tmp_path):
+    csv_path = tmp_path / "points.csv"
+    csv_path.write_text("image_path,image_quality,A\nimg.png,1,\n")
+    gui = make_gui_stub(csv_path)
+
+    first = gui._read_csv_cached()
+    second = gui._read_csv_cached()
+
+    assert first is second is gui._csv_cache[1]
+    assert list(second.columns) == ["image_path", "image_quality", "A"]
+
+
+def test_read_csv_cached_rereads_after_file_changes(tmp_path):
+    csv_path = tmp_path / "points.csv"
+    csv_path.write_text("image_path,image_quality\na.png,1\n")
+    gui = make_gui_stub(csv_path)
+    gui._read_csv_cached()
+
+    csv_path.write_text("image_path,image_quality\na.png,1\nb.png,2\n")
+    st = csv_path.stat()
+    os.utime(csv_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert len(gui._read_csv_cached()) == 2
+
+
+def test_csv_row_position_indexes_first_match(tmp_path):
+    csv_path = tmp_path / "points.csv"
+    csv_path.write_text("image_path,image_quality\na.png,1\nb.png,2\na.png,3\n,4\n")
+    gui = make_gui_stub(csv_path)
+    df = gui._read_csv_cached()
+
+    assert gui._csv_row_position(df, "image_path", "a.png") == 0
+    assert gui._csv_row_position(df, "image_path", "b.png") == 1
+    assert gui._csv_row_position(df, "image_path", "missing.png") is None
+
+
+def test_parse_csv_landmark_cell_matches_literal_eval_formats(tmp_path):
+    gui = make_gui_stub(tmp_path / "points.csv")
+    gui._is_line_landmark = lambda lm: lm == "L-FA"
+
+    assert gui._parse_csv_landmark_cell("A", "[12.5, -3.0]") == ((12.5, -3.0), None)
+    assert gui._parse_csv_landmark_cell("L-FA", "[[1.0, 2.0], [3.5, 4e2]]") == (
+        [(1.0, 2.0), (3.5, 400.0)],
+        None,
+    )
+    lob_cell = "[10.0, 20.0, 'FF', 5, 1, 3, 2, -1]"
+    assert gui._parse_csv_landmark_cell("LOB", lob_cell) == (
+        (10.0, 20.0),
+        {
+            "method": "Flood Fill",
+            "sens": 5,
+            "edge_lock": 1,
+            "edge_width": 3,
+            "clahe": 2,
+            "grow": -1,
+        },
+    )
+    assert gui._parse_csv_landmark_cell("A", "") == (None, None)
+    assert gui._parse_csv_landmark_cell("A", "[nan, nan]") == (None, None)
+
+
+def test_annotated_csv_filenames_counts_landmarks_or_quality(tmp_path):
+    csv_path = tmp_path / "points.csv"
+    csv_path.write_text(
+        "image_path,image_quality,A,B\n"
+        'a/x.png,0,"[1, 2]",\n'
+        "b/y.png,2,,\n"
+        'z.png,,"  ",\n'
+        "w.png,0,,3.0\n"
+        "v.png,0,,\n"
+    )
+    gui = make_gui_stub(csv_path)
+    gui.landmarks = ["A", "B", "C"]
+    df = gui._read_csv_cached()
+
+    assert gui._annotated_csv_filenames(df, "image_path") == {"x.png", "y.png", "w.png"}
+
+
+def test_import_csv_to_db_parses_landmark_cells(tmp_path):
+    import json
+    import sqlite3
+
+    csv_path = tmp_path / "points.csv"
+    csv_path.write_text(
+        'image_path,image_quality,A,B\ndir/x.png,2,"[1.5, 2.0]",\ny.png,bad,,oops[\n'
+    )
+    gui = make_gui_stub(csv_path)
+    gui.landmarks = ["A", "B", "C"]
+    gui.db_path = tmp_path / "points.db"
+    gui._init_database()
+
+    gui._import_csv_to_db()
+
+    with sqlite3.connect(str(gui.db_path)) as conn:
+        rows = conn.execute(
+            "SELECT image_filename, image_quality, data FROM annotations "
+            "ORDER BY image_filename"
+        ).fetchall()
+    assert [(name, quality, json.loads(data)) for name, quality, data in rows] == [
+        ("x.png", 2, {"A": [1.5, 2.0]}),
+        ("y.png", 0, {}),
+    ]
+
+
+def test_annotated_csv_filenames_are_lowercased_for_scan_lookup(tmp_path):
+    csv_path = tmp_path / "points.csv"
+    csv_path.write_text("image_path,image_quality\nScans/IMG_01.TIF,1\n")
+    gui = make_gui_stub(csv_path)
+    gui.landmarks = []
+    df = gui._read_csv_cached()
+
+    assert gui._annotated_csv_filenames(df, "image_path") == {"img_01.tif"}
+
+
+def test_cached_annotated_filenames_reused_until_csv_changes(tmp_path):
+    csv_path = tmp_path / "points.csv"
+    csv_path.write_text("image_path,image_quality\na.png,1\n")
+    gui = make_gui_stub(csv_path)
+    gui.landmarks = []
+    gui._annotated_cache = None
+
+    first = gui._cached_annotated_filenames()
+    assert gui._cached_annotated_filenames() is first
+
+    csv_path.write_text("image_path,image_quality\na.png,1\nb.png,2\n")
+    st = csv_path.stat()
+    os.utime(csv_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert gui._cached_annotated_filenames() == {"a.png", "b.png"}
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from find_duplicates import check_all_images, iter_files
+
+
+def test_iter_files_skips_duplicates_dir(tmp_path):
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "duplicates").mkdir()
+    for name in ["a.png", "sub/b.png", "duplicates/c.png"]:
+        (tmp_path / name).touch()
+
+    found = sorted(
+        Path(entry.path).relative_to(tmp_path).as_posix()
+        for entry in iter_files(tmp_path)
+    )
+    assert found == ["a.png", "sub/b.png"]
+
+
+def test_check_all_images_rerun_ignores_moved_duplicates(tmp_path, capsys):
+    dup_path = tmp_path / "duplicates"
+    (tmp_path / "sub").mkdir()
+    dup_path.mkdir()
+    for i in range(3):
+        (tmp_path / "sub" / f"img{i}.png").write_bytes(f"image {i}".encode())
+        (dup_path / f"img{i}.png").write_bytes(f"image {i}".encode())
+
+    check_all_images(tmp_path, dup_path)
+
+    assert "Total duplicates: 0" in capsys.readouterr().out
+    for i in range(3):
+        assert (tmp_path / "sub" / f"img{i}.png").exists()
+        assert (dup_path / f"img{i}.png").exists()
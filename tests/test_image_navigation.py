@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+
+# pyright: reportMissingImports=false
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from main import AnnotationGUI
+
+
+def make_gui_stub(current: Path):
+    gui = AnnotationGUI.__new__(AnnotationGUI)
+    gui.absolute_current_image_path = current
+    gui.possible_image_suffix = frozenset({".png", ".jpg", ".tif"})
+    gui._dir_cache = {}
+    return gui
+
+
+def test_directory_listing_is_sorted_filtered_and_cached(tmp_path):
+    for name in ["b.png", "a.TIF", "notes.txt", "c.jpg"]:
+        (tmp_path / name).touch()
+    gui = make_gui_stub(tmp_path / "b.png")
+
+    idx, files = gui._get_image_index_from_directory()
+
+    assert files == ["a.TIF", "b.png", "c.jpg"]
+    assert idx == 1
+    assert gui._current_dir == tmp_path.resolve()
+    assert gui._get_image_index_from_directory()[1] is files
+
+
+def test_directory_listing_refreshes_when_directory_changes(tmp_path):
+    (tmp_path / "b.png").touch()
+    gui = make_gui_stub(tmp_path / "b.png")
+    gui._get_image_index_from_directory()
+
+    (tmp_path / "a.png").touch()
+    # Force a distinct mtime even on filesystems with coarse timestamps
+    cached = gui._dir_cache[tmp_path.resolve()]
+    gui._dir_cache[tmp_path.resolve()] = (cached[0] - 10, *cached[1:])
+
+    idx, files = gui._get_image_index_from_directory()
+
+    assert files == ["a.png", "b.png"]
+    assert idx == 1
@@ -157,3 +157,34 @@ def test_current_image_has_unsaved_changes_uses_json_snapshot(tmp_path):
 
     gui.current_view_var.set("lat")
     assert gui._current_image_has_unsaved_changes() is True
+
+
+def test_format_annotation_json_round_trips_with_one_image_per_line():
+    save_data = {
+        "landmarks": ["L-FA", "LOB"],
+        "views": {"AP": ["L-FA"]},
+        "images": [
+            {"image_path": "a.png", "annotations": {"LOB": {"value": [1.0, 2.0]}}},
+            {"image_path": 'b "quoted".png', "annotations": {}},
+        ],
+    }
+
+    text = AnnotationGUI._format_annotation_json(save_data)
+
+    assert json.loads(text) == save_data
+    image_lines = [line for line in text.splitlines() if "image_path" in line]
+    assert len(image_lines) == 2
+
+
+def test_current_image_keys_follow_path_changes(tmp_path):
+    gui = make_gui_stub(tmp_path)
+    first = tmp_path / "image.png"
+
+    assert gui._cur_key == str(first)
+    assert gui._current_path_key() == str(first.resolve())
+
+    second = tmp_path / "sub" / ".." / "other.png"
+    gui.current_image_path = second
+
+    assert gui._cur_key == str(second)
+    assert gui._current_path_key() == str((tmp_path / "other.png").resolve())
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+
+# pyright: reportMissingImports=false
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from main import AnnotationGUI
+
+
+def make_gui_stub(blocked=False):
+    gui = AnnotationGUI.__new__(AnnotationGUI)
+    gui.calls = []
+    gui._key_map = {"f": lambda event: gui.calls.append(event.keysym)}
+    gui._note_text_shortcuts_blocked = lambda: blocked
+    return gui
+
+
+def test_key_press_dispatches_mapped_keysym():
+    gui = make_gui_stub()
+
+    gui._on_key_press(SimpleNamespace(keysym="f"))
+
+    assert gui.calls == ["f"]
+
+
+def test_key_press_ignores_unmapped_keysym():
+    gui = make_gui_stub(blocked=True)
+
+    assert gui._on_key_press(SimpleNamespace(keysym="Tab")) is None
+    assert gui.calls == []
+
+
+def test_key_press_is_swallowed_while_note_text_has_focus():
+    gui = make_gui_stub(blocked=True)
+
+    assert gui._on_key_press(SimpleNamespace(keysym="f")) == "break"
+    assert gui.calls == []
+
+
+class FakeHelpWindow:
+    def __init__(self):
+        self.calls = []
+
+    def winfo_exists(self):
+        return True
+
+    def deiconify(self):
+        self.calls.append("deiconify")
+
+    def lift(self):
+        self.calls.append("lift")
+
+
+def test_help_window_is_reshown_instead_of_rebuilt():
+    gui = make_gui_stub()
+    gui._help_win = FakeHelpWindow()
+
+    gui._on_h_press()
+
+    assert gui._help_win.calls == ["deiconify", "lift"]
+
+
+def test_format_shortcuts_pads_keys_and_fills_with_leader():
+    gui = make_gui_stub()
+    rows = [("h", "Help"), ("Ctrl+S", "Save"), ("a", "A very long action name")]
+
+    text = gui._format_shortcuts(rows, width=20, leader=".")
+
+    assert text.split("\n") == [
+        "h      .......... Help",
+        "Ctrl+S .......... Save",
+        "a      .. A very long action name",
+    ]
+    assert gui._format_shortcuts(rows[:1], width=10, leader="") == "h       Help"
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+# pyright: reportMissingImports=false
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from main import AnnotationGUI
+
+
+class FakeVar:
+    def __init__(self, value=""):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+def make_gui_stub(selected):
+    gui = AnnotationGUI.__new__(AnnotationGUI)
+    gui.landmarks = ["A", "B", "C", "D"]
+    gui._panel_landmarks = ["A", "C", "D"]
+    gui._lm_idx = {"A": 0, "C": 1, "D": 2}
+    gui.selected_landmark = FakeVar(selected)
+    gui._on_landmark_selected = lambda: None
+    return gui
+
+
+def test_change_selected_landmark_follows_panel_order():
+    gui = make_gui_stub("A")
+
+    gui._change_selected_landmark(1)
+    assert gui.selected_landmark.get() == "C"
+
+    gui._change_selected_landmark(1)
+    assert gui.selected_landmark.get() == "D"
+
+
+def test_change_selected_landmark_stops_at_ends():
+    gui = make_gui_stub("D")
+
+    gui._change_selected_landmark(1)
+
+    assert gui.selected_landmark.get() == "D"
+
+
+def test_change_selected_landmark_starts_from_first_when_not_in_panel():
+    gui = make_gui_stub("B")
+
+    gui._change_selected_landmark(1)
+
+    assert gui.selected_landmark.get() == "C"
@@ -16,11 +16,13 @@ The -s flag shows print output so you can see where things hang.
 """
 
 import asyncio
+import os
 import sys
 import tempfile
 import threading
 import time
 from pathlib import Path
+from types import SimpleNamespace
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from unittest.mock import patch
 
@@ -36,6 +38,11 @@ from auth import (
     AUTH_RECORD_PATH,
     BASE_BACKUP_FOLDER,
     SHAREPOINT_DRIVE_ID,
+    SIMPLE_UPLOAD_LIMIT,
+    UPLOAD_CHUNK_SIZE,
+    _cached_token_is_fresh,
+    _probe_online,
+    _save_token_expiry,
 )
 
 
@@ -205,6 +212,217 @@ class TestAuthInitialization:
         print(f"[TEST] Fresh client created: {client is not None}")
         # Client may be None if no auth record exists
 
+    def test_cached_token_freshness_uses_saved_expiry(self, tmp_path):
+        """Startup verification is skipped only while the saved token is fresh."""
+        meta = tmp_path / "auth_meta.json"
+        with patch("auth.AUTH_META_PATH", meta):
+            assert not _cached_token_is_fresh()
+
+            _save_token_expiry(int(time.time()) + 3600)
+            assert _cached_token_is_fresh()
+
+            _save_token_expiry(int(time.time()) + 60)
+            assert not _cached_token_is_fresh()
+
+            meta.write_text("not json")
+            assert not _cached_token_is_fresh()
+
+    def test_uploads_share_one_background_loop_and_client(self, backup_instance):
+        """Every thread submits to the same running loop and Graph client."""
+        with (
+            patch.object(backup_instance, "_get_shared_credential", object),
+            patch("auth.GraphServiceClient", lambda **kwargs: object()),
+        ):
+            client = backup_instance._create_fresh_client()
+            other = {}
+
+            def worker():
+                other["client"] = backup_instance._create_fresh_client()
+                other["loop"] = backup_instance._get_loop()
+
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+
+        loop = backup_instance._get_loop()
+        assert other["client"] is client
+        assert other["loop"] is loop
+
+        async def loop_name():
+            await asyncio.sleep(0)
+            return threading.current_thread().name
+
+        assert backup_instance._run_coroutine(loop_name(), timeout=5) == "onedrive-loop"
+
+    def test_run_coroutine_times_out(self, backup_instance):
+        """A coroutine that overruns its timeout raises TimeoutError."""
+        with pytest.raises(TimeoutError):
+            backup_instance._run_coroutine(asyncio.sleep(5), timeout=0.01)
+
+
+# =============================================================================
+# Upload Routing Tests (no network)
+# =============================================================================
+
+
+class TestUploadRouting:
+    """Test how files are sent to Graph, using fake request builders."""
+
+    def test_put_file_streams_large_files_through_upload_session(
+        self, backup_instance, tmp_path
+    ):
+        """Small files use one PUT; large files go through an upload session."""
+        calls = []
+
+        class FakeItem:
+            def __init__(self):
+                self.content = SimpleNamespace(put=self.put)
+                self.create_upload_session = SimpleNamespace(post=self.post)
+
+            async def put(self, body):
+                calls.append(("put", len(body)))
+                return "small"
+
+            async def post(self, body):
+                calls.append(("session", None))
+                return "session"
+
+        class FakeTask:
+            def __init__(self, upload_session, stream, max_chunk_size, **kwargs):
+                calls.append((upload_session, max_chunk_size))
+
+            async def upload(self):
+                return SimpleNamespace(item_response="large")
+
+        items = SimpleNamespace(by_drive_item_id=lambda path: FakeItem())
+        drives = SimpleNamespace(
+            by_drive_id=lambda drive_id: SimpleNamespace(items=items)
+        )
+        client = SimpleNamespace(drives=drives, request_adapter=None)
+        small = tmp_path / "small.json"
+        small.write_bytes(b"x" * 10)
+        large = tmp_path / "large.db"
+        large.write_bytes(b"x" * (SIMPLE_UPLOAD_LIMIT + 1))
+
+        with patch("auth.LargeFileUploadTask", FakeTask):
+            put = backup_instance._put_file
+            assert asyncio.run(put(client, small, "root:/a:")) == "small"
+            assert asyncio.run(put(client, large, "root:/b:")) == "large"
+
+        assert calls == [
+            ("put", 10),
+            ("session", None),
+            ("session", UPLOAD_CHUNK_SIZE),
+        ]
+
+    def test_backup_many_overlaps_uploads_and_counts_successes(
+        self, backup_instance, tmp_path
+    ):
+        """Uploads run concurrently; failures and timeouts are not counted."""
+        running = []
+        peak = [0]
+
+        async def fake_backup(client, path):
+            running.append(path)
+            peak[0] = max(peak[0], len(running))
+            await asyncio.sleep(0.01 if path.name != "slow" else 1.0)
+            running.remove(path)
+            if path.name == "bad":
+                raise RuntimeError("upload failed")
+            return path.name != "none"
+
+        paths = [tmp_path / name for name in ["a", "b", "bad", "none", "slow"]]
+        with patch.object(backup_instance, "_backup_with_client", fake_backup):
+            count = asyncio.run(
+                backup_instance._backup_many_async(None, paths, timeout=0.5)
+            )
+
+        assert count == 2
+        assert peak[0] == len(paths)
+
+    def test_unchanged_files_are_not_uploaded_again(self, backup_instance, tmp_path):
+        """The upload ledger skips files whose content was already uploaded."""
+        puts = []
+
+        async def fake_put(client, local_path, drive_item_path):
+            puts.append(local_path.read_text())
+            return SimpleNamespace(name=local_path.name)
+
+        data = tmp_path / "session.json"
+        data.write_text("v1")
+        ledger = tmp_path / "upload_ledger.json"
+        with (
+            patch("auth.UPLOAD_LEDGER_PATH", ledger),
+            patch.object(backup_instance, "_put_file", fake_put),
+        ):
+            backup = backup_instance._backup_with_client
+            assert asyncio.run(backup(None, data))
+            assert asyncio.run(backup(None, data))
+
+            st = data.stat()
+            os.utime(data, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+            assert asyncio.run(backup(None, data))
+
+            data.write_text("v2")
+            assert asyncio.run(backup(None, data))
+
+            assert puts == ["v1", "v2"]
+            assert OneDriveBackup()._upload_ledger() == backup_instance._ledger
+
+    def test_upload_backup_runs_on_shared_worker_pool(self, backup_instance, tmp_path):
+        """Background uploads reuse the module's worker threads."""
+        data = tmp_path / "session.json"
+        data.write_text("{}")
+        done = threading.Event()
+        threads = []
+
+        def fake_sync(path, timeout):
+            threads.append(threading.current_thread().name)
+            return True
+
+        def on_done(success):
+            threads.append(success)
+            done.set()
+
+        with patch.object(backup_instance, "upload_backup_sync", fake_sync):
+            backup_instance.upload_backup(data, callback=on_done)
+            assert done.wait(timeout=5.0)
+
+        assert threads[0].startswith("onedrive")
+        assert threads[1] is True
+
+    def test_probe_online_caches_result(self):
+        """An offline probe is remembered so repeat uploads skip the connect."""
+        attempts = []
+
+        def refuse(address, timeout):
+            attempts.append(address)
+            raise OSError("unreachable")
+
+        with (
+            patch("auth._probe_cache", None),
+            patch("auth.socket.create_connection", refuse),
+            patch("auth.urllib.request.getproxies", dict),
+        ):
+            assert not _probe_online()
+            assert not _probe_online()
+
+        assert attempts == [("graph.microsoft.com", 443)]
+
+    def test_probe_online_is_skipped_behind_https_proxy(self):
+        """A configured proxy bypasses the direct connect, which would fail."""
+
+        def refuse(address, timeout):
+            raise OSError("direct connections blocked")
+
+        proxies = {"https": "http://proxy.example:3128"}
+        with (
+            patch("auth._probe_cache", None),
+            patch("auth.socket.create_connection", refuse),
+            patch("auth.urllib.request.getproxies", lambda: proxies),
+        ):
+            assert _probe_online()
+
 
 # =============================================================================
 # Upload Tests (require valid auth)
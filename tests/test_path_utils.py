@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+
+# pyright: reportMissingImports=false
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from path_utils import iter_image_files
+
+
+def test_iter_image_files_filters_suffix_and_skips_duplicates(tmp_path):
+    (tmp_path / "sub" / "deeper").mkdir(parents=True)
+    (tmp_path / "duplicates").mkdir()
+    for name in [
+        "a.PNG",
+        "notes.txt",
+        "sub/b.tif",
+        "sub/deeper/c.jpg",
+        "duplicates/d.png",
+    ]:
+        (tmp_path / name).touch()
+    (tmp_path / "folder.png").mkdir()
+
+    found = sorted(
+        Path(entry.path).relative_to(tmp_path).as_posix()
+        for entry in iter_image_files(tmp_path, {".png", ".tif", ".jpg"})
+    )
+
+    assert found == ["a.PNG", "sub/b.tif", "sub/deeper/c.jpg"]
+
+
+def test_iter_image_files_tolerates_missing_root(tmp_path):
+    assert list(iter_image_files(tmp_path / "missing", {".png"})) == []
+
+
+def test_iter_image_files_walks_top_down_like_os_walk(tmp_path):
+    for name in ["a", "b", "c", "b/x", "b/y"]:
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "img.png").touch()
+    (tmp_path / "top.png").touch()
+
+    expected = [
+        os.path.join(dirpath, name)
+        for dirpath, _dirnames, filenames in os.walk(tmp_path)
+        for name in filenames
+    ]
+
+    assert [e.path for e in iter_image_files(tmp_path, {".png"})] == expected
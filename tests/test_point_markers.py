@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+# pyright: reportMissingImports=false
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from main import AnnotationGUI
+
+
+class FakeCanvas:
+    def __init__(self):
+        self.hidden = []
+
+    def itemconfigure(self, item, **kwargs):
+        if kwargs.get("state") == "hidden":
+            self.hidden.append(item)
+
+
+def make_gui_stub():
+    gui = AnnotationGUI.__new__(AnnotationGUI)
+    gui.canvas = FakeCanvas()
+    gui._point_items = {"A": (1, 2, 3), "B": (4, 5, 6)}
+    gui._point_item_state = {"A": ("drawn",), "B": ("drawn",)}
+    return gui
+
+
+def test_hide_point_items_keeps_requested_landmarks():
+    gui = make_gui_stub()
+
+    gui._hide_point_items(keep={"A"})
+
+    assert gui.canvas.hidden == [4, 5, 6]
+    assert gui._point_item_state == {"A": ("drawn",)}
+
+
+def test_hide_point_items_skips_items_already_hidden():
+    gui = make_gui_stub()
+    gui._hide_point_items()
+
+    gui._hide_point_items()
+
+    assert gui.canvas.hidden == [1, 2, 3, 4, 5, 6]
+    assert gui._point_item_state == {}
+
+
+def test_request_draw_coalesces_until_idle_callback_runs():
+    gui = make_gui_stub()
+    gui._draw_pending = False
+    idle = []
+    draws = []
+    gui.after_idle = idle.append
+    gui._draw_points = lambda: draws.append(True)
+
+    gui._request_draw()
+    gui._request_draw()
+    assert len(idle) == 1 and draws == []
+
+    idle.pop()()
+    assert draws == [True]
+
+    gui._request_draw()
+    assert len(idle) == 1
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+# pyright: reportMissingImports=false
+
+import sys
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from main import AnnotationGUI
+
+
+class FakeVar:
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+def make_gui_stub():
+    gui = AnnotationGUI.__new__(AnnotationGUI)
+    rng = np.random.default_rng(0)
+    pixels = rng.integers(0, 255, (64, 64, 3), dtype=np.uint8)
+    gui.current_image = Image.fromarray(pixels)
+    gui.use_clahe = FakeVar(True)
+    gui._gray_cache = None
+    gui._barrier_cache = None
+    gui._ellipse_kernels = {}
+    gui._clahe = None
+    return gui
+
+
+def test_preprocess_gray_is_reused_for_same_image_and_clahe():
+    gui = make_gui_stub()
+
+    first = gui._preprocess_gray()
+
+    assert gui._preprocess_gray() is first
+    assert not first.flags.writeable
+    assert gui._clahe is not None
+
+
+def test_preprocess_gray_recomputes_when_inputs_change():
+    gui = make_gui_stub()
+    first = gui._preprocess_gray()
+
+    gui.use_clahe.set(False)
+    no_clahe = gui._preprocess_gray()
+    gui.current_image = gui.current_image.copy()
+    new_image = gui._preprocess_gray()
+
+    assert no_clahe is not first
+    assert new_image is not no_clahe
+    np.testing.assert_array_equal(new_image, no_clahe)
+
+
+def test_edge_barrier_is_reused_per_gray_and_width():
+    gui = make_gui_stub()
+    gray = gui._preprocess_gray()
+
+    barrier = gui._edge_barrier(gray, 2)
+
+    assert barrier.dtype == bool
+    assert gui._edge_barrier(gray, 2) is barrier
+    assert gui._edge_barrier(gray, 3) is not barrier
+
+
+def test_ellipse_kernel_is_built_once_per_radius():
+    gui = make_gui_stub()
+
+    kernel = gui._ellipse_kernel(2)
+
+    assert kernel.shape == (5, 5)
+    assert gui._ellipse_kernel(2) is kernel
+
+
+def test_plausible_area_bounds_match_sanity_check():
+    assert not AnnotationGUI._plausible_area(29, 100, 100)
+    assert AnnotationGUI._plausible_area(30, 100, 100)
+    assert AnnotationGUI._plausible_area(7000, 100, 100)
+    assert not AnnotationGUI._plausible_area(7001, 100, 100)